@@ -0,0 +1,13 @@
+"""
+Punto de entrada sin interfaz gráfica:
+
+    python -m chromaflux --help
+
+Ver core/cli.py.
+"""
+import sys
+
+from core.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,97 @@
 import os
-import subprocess
+import shutil
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
+from core.binary_patch import LayoutCache, package_files, patch_vectors, probe_layout
+from core.converter_backends import ConverterBackend, create_backend
+from core.data_models import ColorEntry
+from core.entry_cache import EntryCache, content_key
 from core.json_reader import load_color_over_life_from_json
-from core.json_writer import apply_color_groups_to_json
+from core.json_writer import apply_color_groups_to_json, write_entries_to_json
+from core.package_scan import may_contain_color_modules
 from core.resource_path import resource_path
+from core.uasset_reader import UnsupportedPackage, read_color_entries
 
-# =====================================================
-# 🔒 Evitar ventanas CMD en Windows
-# =====================================================
-CREATE_NO_WINDOW = 0x08000000
+@dataclass
+class BatchResult:
+    source: str
+    output: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class LoadedAsset:
+    uasset_path: str
+    json_path: str
+    min_entries: List[ColorEntry]
+    max_entries: List[ColorEntry]
+    from_cache: bool = False
 
 
 class AssetPipeline:
-    def __init__(self):
-        self.uejson_path = resource_path(
+    def __init__(
+        self,
+        uejson_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        backend: Union[str, ConverterBackend] = "auto",
+        cache: Optional[EntryCache] = None,
+        layouts: Optional[LayoutCache] = None,
+        native_reader: bool = False,
+    ):
+        self.uejson_path = uejson_path or resource_path(
             os.path.join("tools", "UEJSON.exe")
         )
 
         if not os.path.exists(self.uejson_path):
-            raise FileNotFoundError(self.uejson_path)
+            self.uejson_path = shutil.which(self.uejson_path) or self.uejson_path
+
+        # Nº de conversores simultáneos (por defecto, uno por núcleo)
+        self.max_workers = max(1, int(max_workers or os.cpu_count() or 1))
+
+        self.cache = cache
+
+        # Posiciones binarias de los colores (None = siempre vía JSON)
+        self.layouts = layouts
+
+        # Leer con core.uasset_reader y usar UEJSON solo como respaldo
+        self.native_reader = native_reader
+
+        self._backend_lock = threading.Lock()
+        if isinstance(backend, ConverterBackend):
+            self._backend = backend
+            self.backend_kind = backend.name
+        else:
+            self._backend = None
+            self.backend_kind = backend or "auto"
+
+            if self.backend_kind != "python" and not os.path.exists(self.uejson_path):
+                raise FileNotFoundError(self.uejson_path)
+
+    # =====================================================
+    # 🔹 Backend de conversión (se crea en el primer uso)
+    # =====================================================
+    @property
+    def backend(self) -> ConverterBackend:
+        with self._backend_lock:
+            if self._backend is None:
+                self._backend = create_backend(
+                    self.backend_kind,
+                    [self.uejson_path],
+                    max_sessions=self.max_workers,
+                )
+            return self._backend
+
+    def close(self):
+        with self._backend_lock:
+            if self._backend is not None:
+                self._backend.close()
 
     # =====================================================
     # 🔹 UASSET → JSON (sin ventana CMD)
@@ -27,13 +100,7 @@ class AssetPipeline:
         if not os.path.exists(uasset_path):
             raise FileNotFoundError(uasset_path)
 
-        subprocess.run(
-            [self.uejson_path, "-e", uasset_path],
-            check=True,
-            creationflags=CREATE_NO_WINDOW
-        )
-
-        json_path = os.path.splitext(uasset_path)[0] + ".json"
+        json_path = self.backend.uasset_to_json(uasset_path)
         if not os.path.exists(json_path):
             raise FileNotFoundError(json_path)
 
@@ -46,13 +113,79 @@ class AssetPipeline:
         if not os.path.exists(json_path):
             raise FileNotFoundError(json_path)
 
-        subprocess.run(
-            [self.uejson_path, "-i", json_path],
-            check=True,
-            creationflags=CREATE_NO_WINDOW
+        return self.backend.json_to_uasset(json_path)
+
+    # =====================================================
+    # 🔹 Lotes concurrentes
+    # =====================================================
+    def run_batch(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[str],
+        max_workers: Optional[int] = None,
+        cancel=None,
+    ) -> Iterator[BatchResult]:
+        """
+        Ejecuta func(item) en paralelo (como máximo max_workers a la vez)
+        y devuelve los resultados según van terminando.
+
+        Un error en un asset se devuelve en su BatchResult y no detiene
+        el lote. Si cancel.is_set() se deja de lanzar trabajo nuevo; lo
+        que ya está en marcha termina normalmente.
+        """
+        workers = max(1, int(max_workers or self.max_workers))
+        pending_items = iter(items)
+        in_flight = {}
+
+        def submit_next(pool) -> bool:
+            if cancel is not None and cancel.is_set():
+                return False
+            try:
+                item = next(pending_items)
+            except StopIteration:
+                return False
+            in_flight[pool.submit(func, item)] = item
+            return True
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Ventana acotada: nunca más de 2x workers tareas en cola
+            for _ in range(workers * 2):
+                if not submit_next(pool):
+                    break
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    item = in_flight.pop(future)
+                    error = future.exception()
+
+                    if error is None:
+                        yield BatchResult(source=item, output=future.result())
+                    else:
+                        yield BatchResult(source=item, error=error)
+
+                    submit_next(pool)
+
+    def convert_many_to_json(
+        self,
+        uasset_paths: Iterable[str],
+        max_workers: Optional[int] = None,
+        cancel=None,
+    ) -> Iterator[BatchResult]:
+        return self.run_batch(
+            self.convert_uasset_to_json, uasset_paths, max_workers, cancel
         )
 
-        return os.path.splitext(json_path)[0] + ".uasset"
+    def convert_many_to_uasset(
+        self,
+        json_paths: Iterable[str],
+        max_workers: Optional[int] = None,
+        cancel=None,
+    ) -> Iterator[BatchResult]:
+        return self.run_batch(
+            self.convert_json_to_uasset, json_paths, max_workers, cancel
+        )
 
     # =====================================================
     # 🔹 Cargar datos de color
@@ -60,6 +193,150 @@ class AssetPipeline:
     def load_color_data(self, json_path):
         return load_color_over_life_from_json(json_path)
 
+    def load_asset(self, uasset_path: str) -> LoadedAsset:
+        """
+        Extrae las entries de un .uasset. Si la caché tiene el mismo
+        contenido (y la misma versión del conversor) o el lector nativo
+        entiende el paquete, no se llama a UEJSON.
+        """
+        json_path = os.path.splitext(uasset_path)[0] + ".json"
+
+        key = None
+        if self.cache is not None:
+            key = content_key(uasset_path, self.backend.version)
+            cached = self.cache.get(key, json_path)
+            if cached is not None:
+                return LoadedAsset(uasset_path, json_path, *cached, from_cache=True)
+
+        if self.native_reader:
+            try:
+                mins, maxs = read_color_entries(uasset_path, json_path)
+            except (UnsupportedPackage, OSError):
+                pass
+            else:
+                if key is not None:
+                    self.cache.put(key, mins, maxs)
+                return LoadedAsset(uasset_path, json_path, mins, maxs)
+
+        json_path = self.convert_uasset_to_json(uasset_path)
+
+        # Streaming: nunca se materializa el documento completo y las
+        # entries solo guardan ubicación + valores
+        mins, maxs = load_color_over_life_from_json(json_path, streaming=True)
+        for entry in mins + maxs:
+            entry.detach()
+
+        if key is not None:
+            self.cache.put(key, mins, maxs)
+
+        return LoadedAsset(uasset_path, json_path, mins, maxs)
+
+    def prefilter(
+        self,
+        uasset_paths: Iterable[str],
+        cancel=None,
+    ) -> Tuple[List[str], int]:
+        """
+        Descarta (en paralelo) los paquetes que seguro no tienen módulos
+        de color, sin llamar al conversor. Devuelve (candidatos en el
+        orden original, nº descartados).
+        """
+        uasset_paths = list(uasset_paths)
+        skip = set()
+
+        for result in self.run_batch(may_contain_color_modules, uasset_paths, cancel=cancel):
+            # Un error al leer nunca descarta
+            if result.ok and not result.output:
+                skip.add(result.source)
+
+        return [p for p in uasset_paths if p not in skip], len(skip)
+
+    def load_many(
+        self,
+        uasset_paths: Iterable[str],
+        max_workers: Optional[int] = None,
+        cancel=None,
+    ) -> Iterator[BatchResult]:
+        return self.run_batch(self.load_asset, uasset_paths, max_workers, cancel)
+
+    # =====================================================
+    # 🔹 Reconstruir un asset a partir de sus entries
+    # =====================================================
+    def rebuild_asset(self, json_path: str, entries: List[ColorEntry]) -> str:
+        """
+        Escribe las entries en el paquete. Si se conocen (o se pueden
+        demostrar) las posiciones binarias de los colores se parchean
+        directamente; si no, relee el JSON del asset (lo re-exporta si
+        falta o es más viejo que el paquete), aplica las entries por
+        ubicación y vuelve a importar.
+        """
+        uasset_path = os.path.splitext(json_path)[0] + ".uasset"
+
+        if self.layouts is not None and self._patch_binary(uasset_path, json_path, entries):
+            result = uasset_path
+        else:
+            self._ensure_fresh_json(uasset_path, json_path)
+            write_entries_to_json(json_path, entries)
+            result = self.convert_json_to_uasset(json_path)
+
+        try:
+            os.remove(json_path)
+        except OSError:
+            pass
+
+        # El contenido nuevo ya corresponde a estas entries
+        if self.cache is not None:
+            key = content_key(uasset_path, self.backend.version)
+            self.cache.put(
+                key,
+                [e for e in entries if e.mode != "MAX"],
+                [e for e in entries if e.mode == "MAX"],
+            )
+
+        return result
+
+    def _ensure_fresh_json(self, uasset_path: str, json_path: str):
+        package_mtime = max(
+            os.path.getmtime(p) for p in package_files(uasset_path) if os.path.exists(p)
+        )
+        fresh = (
+            os.path.exists(json_path)
+            and os.path.getmtime(json_path) >= package_mtime
+        )
+        if not fresh:
+            self.convert_uasset_to_json(uasset_path)
+
+    def _patch_binary(self, uasset_path: str, json_path: str, entries: List[ColorEntry]) -> bool:
+        """
+        Camino rápido sin conversión. La primera vez que se ve un contenido
+        se sondea (una importación sobre una copia); después solo hay E/S.
+        """
+        if any(e.location is None for e in entries):
+            return False
+
+        key = content_key(uasset_path, self.backend.version)
+        found, layout = self.layouts.lookup(key)
+
+        if not found:
+            self._ensure_fresh_json(uasset_path, json_path)
+            try:
+                layout = probe_layout(
+                    self.backend,
+                    uasset_path,
+                    json_path,
+                    sorted({e.location for e in entries}),
+                )
+            except Exception:
+                return False  # fallo del conversor: no se recuerda
+            self.layouts.put(key, layout)
+
+        if layout is None or not patch_vectors(uasset_path, layout, entries):
+            return False
+
+        # Mismo layout para el contenido nuevo
+        self.layouts.put(content_key(uasset_path, self.backend.version), layout)
+        return True
+
     # =====================================================
     # 🔹 Procesar grupo de assets
     # =====================================================
@@ -69,6 +346,7 @@ class AssetPipeline:
         entries,
         new_rgb
     ) -> str:
+        entries = list(entries)
         json_path = self.convert_uasset_to_json(original_uasset)
 
         apply_color_groups_to_json(
@@ -77,7 +355,12 @@ class AssetPipeline:
             new_rgb=new_rgb
         )
 
-        return self.convert_json_to_uasset(json_path)
+        result = self.convert_json_to_uasset(json_path)
+
+        for entry in entries:
+            entry.mark_clean()
+
+        return result
 
     # =====================================================
     # 🔹 UNDO SUPPORT
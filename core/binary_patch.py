@@ -0,0 +1,340 @@
+import json
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.data_models import ColorEntry
+from core.entry_cache import cache_files, evict_oldest
+from core.json_writer import resolve_vector
+from core.settings_manager import get_appdata_dir
+
+# =====================================================
+# Parcheo binario de colores
+#
+# Los FVector se serializan como 3 floats (UE4: float32, UE5 con LWC:
+# float64). Sus posiciones se averiguan UNA vez por asset con una sonda:
+# se importa una copia con valores centinela únicos y se busca dónde
+# aparecen. Solo se acepta el resultado si el paquete sondeado es
+# exactamente el original con los centinelas escritos en esas posiciones.
+# =====================================================
+PACKAGE_EXTENSIONS = (".uasset", ".uexp")
+
+_FORMATS = ("<f", "<d")
+_AXES = ("X", "Y", "Z")
+
+# Enteros exactos en float32 (< 2^24) y que no aparecen en un color
+_SENTINEL_BASE = -8_000_000.0
+
+Location = Tuple[int, int, int]
+Offset = Tuple[int, int]  # (índice en PACKAGE_EXTENSIONS, byte)
+
+
+@dataclass
+class PatchLayout:
+    fmt: str
+    sizes: Tuple[int, ...]
+    vectors: Dict[Location, Tuple[Offset, Offset, Offset]]
+
+    def to_json(self) -> dict:
+        return {
+            "fmt": self.fmt,
+            "sizes": list(self.sizes),
+            "vectors": [[list(loc), [list(o) for o in offs]] for loc, offs in self.vectors.items()],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "PatchLayout":
+        return cls(
+            fmt=data["fmt"],
+            sizes=tuple(data["sizes"]),
+            vectors={
+                tuple(loc): tuple(tuple(o) for o in offs)
+                for loc, offs in data["vectors"]
+            },
+        )
+
+
+def package_files(uasset_path: str) -> List[str]:
+    base = os.path.splitext(uasset_path)[0]
+    return [base + ext for ext in PACKAGE_EXTENSIONS]
+
+
+def _read_package(uasset_path: str) -> List[Optional[bytes]]:
+    data = []
+    for path in package_files(uasset_path):
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                data.append(f.read())
+        else:
+            data.append(None)
+    return data
+
+
+def _sizes(uasset_path: str) -> Tuple[int, ...]:
+    return tuple(
+        os.path.getsize(p) if os.path.exists(p) else -1
+        for p in package_files(uasset_path)
+    )
+
+
+# =====================================================
+# 🔹 Sonda (una importación por asset)
+# =====================================================
+def _find_unique(files: Sequence[Optional[bytes]], needle: bytes) -> Optional[Offset]:
+    found = None
+    for index, data in enumerate(files):
+        if data is None:
+            continue
+        pos = data.find(needle)
+        while pos != -1:
+            if found is not None:
+                return None
+            found = (index, pos)
+            pos = data.find(needle, pos + 1)
+    return found
+
+
+def probe_layout(backend, uasset_path: str, json_path: str, locations: Sequence[Location]) -> Optional[PatchLayout]:
+    """
+    Averigua dónde están en el paquete los floats de cada vector. Devuelve
+    None si no se puede demostrar (forma inesperada, centinela ambiguo,
+    el paquete cambia de tamaño o difiere en algo más).
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        root = json.load(f)
+
+    sentinels = {}
+    n = 0
+    for loc in locations:
+        ref = resolve_vector(root, loc)
+        if ref is None:
+            return None
+        for axis in _AXES:
+            value = ref.get(axis)
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return None
+            ref[axis] = _SENTINEL_BASE - n
+            sentinels[(loc, axis)] = (_SENTINEL_BASE - n, float(value))
+            n += 1
+
+    original = _read_package(uasset_path)
+
+    with tempfile.TemporaryDirectory(prefix="chromaflux_probe_") as tmp:
+        name = os.path.basename(os.path.splitext(uasset_path)[0])
+        for src in package_files(uasset_path):
+            if os.path.exists(src):
+                shutil.copyfile(src, os.path.join(tmp, name + os.path.splitext(src)[1]))
+
+        probe_json = os.path.join(tmp, name + ".json")
+        with open(probe_json, "w", encoding="utf-8") as f:
+            json.dump(root, f, ensure_ascii=False)
+
+        backend.json_to_uasset(probe_json)
+        probed = _read_package(os.path.join(tmp, name + ".uasset"))
+
+    if [len(d) if d else -1 for d in probed] != [len(d) if d else -1 for d in original]:
+        return None
+
+    for fmt in _FORMATS:
+        offsets = {}
+        for key, (sentinel, _) in sentinels.items():
+            offset = _find_unique(probed, struct.pack(fmt, sentinel))
+            if offset is None:
+                break
+            offsets[key] = offset
+        else:
+            break
+    else:
+        return None
+
+    # Prueba: original + centinelas en esas posiciones == paquete sondeado,
+    # y en el original esas posiciones contienen los valores del JSON
+    expected = [bytearray(d) if d is not None else None for d in original]
+    width = struct.calcsize(fmt)
+    for key, (index, pos) in offsets.items():
+        sentinel, value = sentinels[key]
+        if original[index][pos:pos + width] != struct.pack(fmt, value):
+            return None
+        expected[index][pos:pos + width] = struct.pack(fmt, sentinel)
+
+    if [bytes(d) if d is not None else None for d in expected] != probed:
+        return None
+
+    return PatchLayout(
+        fmt=fmt,
+        sizes=tuple(len(d) if d is not None else -1 for d in original),
+        vectors={
+            loc: tuple(offsets[(loc, axis)] for axis in _AXES)
+            for loc in locations
+        },
+    )
+
+
+# =====================================================
+# 🔹 Parcheo in situ con verificación
+# =====================================================
+def patch_vectors(uasset_path: str, layout: PatchLayout, entries: Sequence[ColorEntry]) -> bool:
+    """
+    Escribe los colores de las entries directamente en el paquete. Antes
+    comprueba que cada posición contiene el valor original de la entry y
+    después relee lo escrito. Si algo no cuadra no toca nada (o deshace)
+    y devuelve False para que se use la conversión completa.
+    """
+    if _sizes(uasset_path) != layout.sizes:
+        return False
+
+    width = struct.calcsize(layout.fmt)
+    writes: Dict[int, List[Tuple[int, bytes, bytes]]] = {}
+
+    for entry in entries:
+        offsets = layout.vectors.get(entry.location) if entry.location else None
+        if offsets is None:
+            return False
+        if (entry.r, entry.g, entry.b) == entry.original:
+            continue
+        for (index, pos), old, new in zip(offsets, entry.original, (entry.r, entry.g, entry.b)):
+            writes.setdefault(index, []).append(
+                (pos, struct.pack(layout.fmt, old), struct.pack(layout.fmt, new))
+            )
+
+    paths = package_files(uasset_path)
+
+    # 1) Verificar antes de escribir nada
+    for index, items in writes.items():
+        with open(paths[index], "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if any(buf[pos:pos + width] != old for pos, old, _ in items):
+                return False
+
+    # 2) Escribir
+    for index, items in writes.items():
+        with open(paths[index], "r+b") as f, mmap.mmap(f.fileno(), 0) as buf:
+            for pos, _, new in items:
+                buf[pos:pos + width] = new
+            buf.flush()
+
+    # 3) Releer; si no coincide, restaurar los bytes originales
+    for index, items in writes.items():
+        with open(paths[index], "rb") as f:
+            ok = all(_read_at(f, pos, width) == new for pos, _, new in items)
+        if not ok:
+            with open(paths[index], "r+b") as f:
+                for pos, old, _ in items:
+                    f.seek(pos)
+                    f.write(old)
+            return False
+
+    return True
+
+
+def _read_at(f, pos: int, width: int) -> bytes:
+    f.seek(pos)
+    return f.read(width)
+
+
+class LayoutCache:
+    """
+    Posiciones de los vectores por contenido del paquete (content_key).
+    Guarda también los assets que no se pudieron demostrar, para no
+    repetir la sonda en cada Apply.
+
+    Como EntryCache: la fecha de modificación de cada archivo hace de
+    marca LRU y al pasar de max_bytes se borran los más antiguos. En
+    memoria se quedan como mucho MEMORY_ITEMS layouts.
+    """
+
+    UNSUPPORTED = None
+
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+    MEMORY_ITEMS = 4096
+
+    def __init__(self, folder: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.folder = folder or os.path.join(get_appdata_dir(), "cache", "layouts")
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Optional[PatchLayout]]" = OrderedDict()
+        self._total_bytes = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.folder, key[:2], key + ".json")
+
+    def lookup(self, key: str) -> Tuple[bool, Optional[PatchLayout]]:
+        """
+        (encontrado, layout); layout None = asset no apto para parchear
+        """
+        path = self._path(key)
+
+        with self._lock:
+            found = key in self._memory
+            if found:
+                self._memory.move_to_end(key)
+                layout = self._memory[key]
+
+        if not found:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                layout = PatchLayout.from_json(data) if data else self.UNSUPPORTED
+            except (OSError, ValueError, KeyError, TypeError):
+                return False, None
+            self._remember(key, layout)
+
+        # Marca de uso para la poda por antigüedad
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True, layout
+
+    def _remember(self, key: str, layout: Optional[PatchLayout]):
+        with self._lock:
+            self._memory[key] = layout
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MEMORY_ITEMS:
+                self._memory.popitem(last=False)
+
+    def put(self, key: str, layout: Optional[PatchLayout]):
+        self._remember(key, layout)
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        data = json.dumps(layout.to_json() if layout else None)
+        # Al sobrescribir solo cuenta la diferencia con el fichero anterior
+        try:
+            old_size = os.stat(path).st_size
+        except OSError:
+            old_size = 0
+
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in cache_files(self.folder, ".json"))
+            else:
+                self._total_bytes += len(data) - old_size
+
+            if self._total_bytes > self.max_bytes:
+                self._total_bytes = evict_oldest(self.folder, ".json", self.max_bytes)
+
+    def purge(self) -> int:
+        removed = 0
+        with self._lock:
+            self._memory.clear()
+            self._total_bytes = 0
+            for root, _, files in os.walk(self.folder):
+                for name in files:
+                    try:
+                        os.remove(os.path.join(root, name))
+                        removed += 1
+                    except OSError:
+                        pass
+        return removed
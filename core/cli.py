@@ -0,0 +1,478 @@
+"""
+ChromaFlux sin interfaz gráfica (para CI / granjas de build):
+
+    python -m chromaflux scan   Content/FX --workers 8
+    python -m chromaflux list   Content/FX --mode MAX
+    python -m chromaflux groups Content/FX
+    python -m chromaflux recolor Content/FX --from 1,0.5,0 --to "#3080FF"
+    python -m chromaflux run job.json --jsonl
+
+Con --jsonl cada evento (inicio, progreso, asset, error, fin) sale como
+una línea JSON por stdout. Nunca importa PySide6.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+EXIT_OK = 0
+EXIT_FAILURES = 1
+EXIT_USAGE = 2
+
+# Mínimo intervalo entre eventos de progreso (segundos)
+PROGRESS_INTERVAL = 0.25
+
+
+# =====================================================
+# 🔹 Salida: texto para personas o JSON lines para máquinas
+# =====================================================
+class Reporter:
+    def __init__(self, jsonl: bool = False, stream=None):
+        self.jsonl = jsonl
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+        self._last_progress = 0.0
+
+    def emit(self, event: str, text: Optional[str] = None, **fields):
+        with self._lock:
+            if self.jsonl:
+                fields = {"event": event, **fields}
+                self.stream.write(json.dumps(fields, ensure_ascii=False) + "\n")
+            elif text is not None:
+                self.stream.write(text + "\n")
+            self.stream.flush()
+
+    def progress(self, op: str, done: int, total: int):
+        now = time.monotonic()
+        if done < total and now - self._last_progress < PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        self.emit("progress", op=op, done=done, total=total)
+
+
+# =====================================================
+# 🔹 Utilidades de argumentos
+# =====================================================
+def parse_rgb(text) -> Tuple[float, float, float]:
+    """
+    "r,g,b" en floats (lineal, 0-1 o HDR) o "#RRGGBB"
+    """
+    if isinstance(text, (list, tuple)):
+        values = [float(v) for v in text]
+    elif text.startswith("#") and len(text) == 7:
+        values = [int(text[i:i + 2], 16) / 255.0 for i in (1, 3, 5)]
+    else:
+        values = [float(v) for v in text.split(",")]
+
+    if len(values) != 3:
+        raise ValueError(f"Color no válido: {text!r}")
+    return values[0], values[1], values[2]
+
+
+def collect_uassets(paths: Sequence[str]) -> List[str]:
+    uassets = []
+    for p in paths:
+        if os.path.isfile(p) and p.lower().endswith(".uasset"):
+            uassets.append(p)
+        elif os.path.isdir(p):
+            for root, _, files in os.walk(p):
+                for f in sorted(files):
+                    if f.lower().endswith(".uasset"):
+                        uassets.append(os.path.join(root, f))
+    return uassets
+
+
+def _add_common(parser):
+    parser.add_argument("paths", nargs="*", help=".uasset o carpetas (recursivo)")
+    parser.add_argument("--workers", type=int, default=None, help="conversores en paralelo (por defecto, uno por núcleo)")
+    parser.add_argument("--backend", default="auto", choices=["auto", "session", "spawn", "python"])
+    parser.add_argument("--uejson", default=None, help="ruta a UEJSON.exe")
+    parser.add_argument("--no-cache", action="store_true", help="no usar la caché de entries")
+    parser.add_argument("--no-prefilter", action="store_true", help="convertir todos los paquetes")
+    parser.add_argument("--no-binary-patch", action="store_true", help="reconstruir siempre vía JSON")
+    parser.add_argument("--native", action="store_true", help="leer los colores directamente del .uasset (experimental)")
+    parser.add_argument("--jsonl", action="store_true", help="eventos como JSON lines por stdout")
+
+
+def _add_filters(parser):
+    parser.add_argument("--mode", choices=["MIN", "MAX", "ALL"], default="ALL")
+    parser.add_argument("--module", default=None, help="patrón (fnmatch) del nombre de módulo")
+    parser.add_argument("--asset", default=None, help="patrón (fnmatch) del nombre de asset")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="chromaflux", description="ChromaFlux por línea de comandos")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scan", help="convierte y cuenta entries por asset")
+    _add_common(p)
+
+    p = sub.add_parser("list", help="lista cada entry de color")
+    _add_common(p)
+    _add_filters(p)
+
+    p = sub.add_parser("groups", help="agrupa entries por color")
+    _add_common(p)
+    _add_filters(p)
+
+    p = sub.add_parser("recolor", help="cambia colores y reconstruye los assets")
+    _add_common(p)
+    _add_filters(p)
+    p.add_argument("--from", dest="match", default=None, help="solo entries con este color")
+    p.add_argument("--tolerance", type=float, default=1e-6)
+    p.add_argument("--to", dest="target", required=True, help="color nuevo")
+    p.add_argument("--dry-run", action="store_true", help="no escribir nada")
+
+    p = sub.add_parser("run", help="ejecuta un archivo de trabajo JSON")
+    p.add_argument("job", help="archivo .json con paths / operations")
+    p.add_argument("--jsonl", action="store_true", help="eventos como JSON lines por stdout")
+    p.add_argument("--dry-run", action="store_true", help="no escribir nada")
+
+    return parser
+
+
+# =====================================================
+# 🔹 Pasos comunes
+# =====================================================
+def make_pipeline(options: Dict):
+    # Import diferido: `chromaflux --help` no paga la pipeline
+    from core.asset_pipeline import AssetPipeline
+    from core.binary_patch import LayoutCache
+    from core.entry_cache import EntryCache
+
+    uejson = options.get("uejson")
+    if uejson is None and not getattr(sys, "frozen", False):
+        # Independiente del directorio de trabajo (CI)
+        uejson = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools", "UEJSON.exe")
+
+    return AssetPipeline(
+        uejson_path=uejson,
+        max_workers=options.get("workers"),
+        backend=options.get("backend", "auto"),
+        cache=None if options.get("no_cache") else EntryCache(),
+        layouts=None if options.get("no_binary_patch") else LayoutCache(),
+        native_reader=bool(options.get("native")),
+    )
+
+
+def json_path_for(uasset_path: str) -> str:
+    return os.path.splitext(uasset_path)[0] + ".json"
+
+
+def remove_jsons(json_paths) -> None:
+    for path in json_paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def load_entries(
+    pipeline,
+    uassets: List[str],
+    options: Dict,
+    reporter: Reporter,
+    keep_jsons: Optional[Set[str]] = None,
+):
+    """
+    Carga en paralelo. Devuelve ({json_path: entries}, nº fallos).
+    Con keep_jsons, cada JSON exportado que no esté en el conjunto se
+    borra en cuanto se extraen sus entries; sin él se conservan todos
+    (hacen falta para reconstruir).
+    """
+    skipped = 0
+    if not options.get("no_prefilter"):
+        uassets, skipped = pipeline.prefilter(uassets)
+
+    reporter.emit(
+        "start",
+        f"{len(uassets)} asset(s), {skipped} descartados por el prefiltro",
+        op="load",
+        total=len(uassets),
+        skipped=skipped,
+    )
+
+    assets: Dict[str, list] = {}
+    failed = 0
+
+    for done, result in enumerate(pipeline.load_many(uassets), start=1):
+        if result.ok:
+            loaded = result.output
+            entries = loaded.min_entries + loaded.max_entries
+            assets[loaded.json_path] = entries
+            if keep_jsons is not None and loaded.json_path not in keep_jsons:
+                remove_jsons([loaded.json_path])
+            reporter.emit(
+                "asset",
+                None,
+                path=loaded.uasset_path,
+                entries=len(entries),
+                cached=loaded.from_cache,
+            )
+        else:
+            failed += 1
+            reporter.emit(
+                "error",
+                f"✗ {result.source}: {result.error}",
+                op="load",
+                path=result.source,
+                error=str(result.error),
+            )
+        reporter.progress("load", done, len(uassets))
+
+    return assets, failed
+
+
+def filter_entries(assets: Dict[str, list], options: Dict) -> list:
+    mode = options.get("mode") or "ALL"
+    module = options.get("module")
+    asset = options.get("asset")
+
+    selected = []
+    for json_path, entries in assets.items():
+        name = os.path.basename(os.path.splitext(json_path)[0])
+        if asset and not fnmatch.fnmatchcase(name, asset):
+            continue
+        for e in entries:
+            if mode != "ALL" and e.mode != mode:
+                continue
+            if module and not fnmatch.fnmatchcase(e.module, module):
+                continue
+            selected.append(e)
+    return selected
+
+
+def match_color(entries: list, rgb: Optional[Tuple[float, float, float]], tolerance: float) -> list:
+    if rgb is None:
+        return list(entries)
+    return [
+        e for e in entries
+        if all(abs(a - b) <= tolerance for a, b in zip((e.r, e.g, e.b), rgb))
+    ]
+
+
+def apply_assets(pipeline, assets: Dict[str, list], reporter: Reporter) -> int:
+    """
+    Reconstruye en paralelo los assets con entries sucias. Devuelve nº fallos.
+    """
+    dirty = [path for path, entries in assets.items() if any(e.dirty for e in entries)]
+    reporter.emit("start", f"Reconstruyendo {len(dirty)} asset(s)", op="apply", total=len(dirty))
+
+    def rebuild(json_path):
+        return pipeline.rebuild_asset(json_path, assets[json_path])
+
+    failed = 0
+    for done, result in enumerate(pipeline.run_batch(rebuild, dirty), start=1):
+        if result.ok:
+            for e in assets[result.source]:
+                e.mark_clean()
+            reporter.emit("asset", f"✓ {result.output}", op="apply", path=result.output)
+        else:
+            failed += 1
+            reporter.emit(
+                "error",
+                f"✗ {result.source}: {result.error}",
+                op="apply",
+                path=result.source,
+                error=str(result.error),
+            )
+        reporter.progress("apply", done, len(dirty))
+
+    return failed
+
+
+# =====================================================
+# 🔹 Comandos
+# =====================================================
+def _entry_record(e) -> Dict:
+    return {
+        "asset": os.path.splitext(e.asset)[0] + ".uasset",
+        "module": e.module,
+        "mode": e.mode,
+        "rgb": [e.r, e.g, e.b],
+        "location": list(e.location) if e.location else None,
+    }
+
+
+def cmd_scan(pipeline, assets, options, reporter):
+    total = sum(len(v) for v in assets.values())
+    reporter.emit("summary", f"{len(assets)} asset(s), {total} entries", assets=len(assets), entries=total)
+    return EXIT_OK
+
+
+def cmd_list(pipeline, assets, options, reporter):
+    for e in filter_entries(assets, options):
+        record = _entry_record(e)
+        reporter.emit(
+            "entry",
+            f"{os.path.basename(record['asset'])}\t{e.module}\t{e.mode}\t"
+            f"{e.r:.6f},{e.g:.6f},{e.b:.6f}",
+            **record,
+        )
+    return EXIT_OK
+
+
+def cmd_groups(pipeline, assets, options, reporter):
+    from core.grouping_engine import group_color_entries
+
+    groups = group_color_entries(filter_entries(assets, options))
+    for group in sorted(groups.values(), key=lambda g: g.total_uses, reverse=True):
+        reporter.emit(
+            "group",
+            f"{group.r:.6f},{group.g:.6f},{group.b:.6f}\t{group.total_uses} uso(s)\t"
+            f"{len(group.assets)} asset(s)",
+            rgb=[group.r, group.g, group.b],
+            uses=group.total_uses,
+            assets=len(group.assets),
+            min=group.affects_min,
+            max=group.affects_max,
+        )
+    return EXIT_OK
+
+
+def recolor(assets, operations: List[Dict], reporter: Reporter) -> int:
+    """
+    Aplica (en memoria) cada operación {match..., set} sobre las entries.
+    Devuelve cuántas entries cambiaron.
+    """
+    changed = 0
+    for op in operations:
+        match = op.get("match", {})
+        target = parse_rgb(op["set"])
+        source = parse_rgb(match["rgb"]) if match.get("rgb") is not None else None
+
+        entries = match_color(
+            filter_entries(assets, match),
+            source,
+            float(match.get("tolerance", 1e-6)),
+        )
+        for e in entries:
+            if (e.r, e.g, e.b) != target:
+                e.set_rgb(*target)
+                changed += 1
+
+        reporter.emit("recolor", f"{len(entries)} entries → {target}", matched=len(entries), set=list(target))
+    return changed
+
+
+def _finish(pipeline, assets, operations, dry_run, reporter) -> int:
+    changed = recolor(assets, operations, reporter)
+    if dry_run:
+        reporter.emit("done", f"{changed} entries cambiarían (dry run)", changed=changed, failed=0, dry_run=True)
+        return EXIT_OK
+
+    failed = apply_assets(pipeline, assets, reporter)
+    reporter.emit("done", f"{changed} entries cambiadas, {failed} fallo(s)", changed=changed, failed=failed)
+    return EXIT_FAILURES if failed else EXIT_OK
+
+
+def cmd_recolor(pipeline, assets, options, reporter):
+    match = {k: options.get(k) for k in ("mode", "module", "asset")}
+    match["rgb"] = options.get("match")
+    match["tolerance"] = options.get("tolerance", 1e-6)
+    operations = [{"match": match, "set": options["target"]}]
+    return _finish(pipeline, assets, operations, options.get("dry_run"), reporter)
+
+
+def cmd_run(pipeline, assets, options, reporter):
+    return _finish(
+        pipeline,
+        assets,
+        options.get("operations", []),
+        options.get("dry_run"),
+        reporter,
+    )
+
+
+COMMANDS = {
+    "scan": cmd_scan,
+    "list": cmd_list,
+    "groups": cmd_groups,
+    "recolor": cmd_recolor,
+    "run": cmd_run,
+}
+
+
+def load_job(path: str) -> Dict:
+    """
+    Archivo de trabajo:
+
+        {
+          "paths": ["Content/FX"],
+          "workers": 8, "backend": "auto",
+          "operations": [
+            {"match": {"rgb": [1, 0.5, 0], "mode": "MAX", "module": "*OverLife*"},
+             "set": "#3080FF"}
+          ]
+        }
+
+    Las rutas relativas se resuelven desde la carpeta del archivo.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        job = json.load(f)
+
+    base = os.path.dirname(os.path.abspath(path))
+    job["paths"] = [os.path.join(base, p) for p in job.get("paths", [])]
+    return job
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    try:
+        return _main(argv)
+    except BrokenPipeError:
+        # `chromaflux list ... | head`: salir sin traza
+        sys.stdout = open(os.devnull, "w")
+        return EXIT_OK
+
+
+def _main(argv: Optional[Sequence[str]]) -> int:
+    args = build_parser().parse_args(argv)
+    options = vars(args)
+
+    if args.command == "run":
+        try:
+            job = load_job(args.job)
+        except (OSError, ValueError) as e:
+            print(f"chromaflux: {e}", file=sys.stderr)
+            return EXIT_USAGE
+        job["dry_run"] = args.dry_run or job.get("dry_run", False)
+        options = {**job, "command": "run", "jsonl": args.jsonl}
+
+    reporter = Reporter(jsonl=options.get("jsonl", False))
+
+    uassets = collect_uassets(options.get("paths", []))
+    if not uassets:
+        print("chromaflux: no se encontraron .uasset", file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        if options.get("command") == "recolor":
+            parse_rgb(options["target"])
+            if options.get("match"):
+                parse_rgb(options["match"])
+        pipeline = make_pipeline(options)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"chromaflux: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    # La CLI no deja JSON junto a los assets; los que ya había (p. ej. de
+    # la GUI) se respetan. Al reconstruir se borran al terminar.
+    existing = {p for p in map(json_path_for, uassets) if os.path.exists(p)}
+    writes = options["command"] in ("recolor", "run") and not options.get("dry_run")
+
+    try:
+        assets, failed = load_entries(
+            pipeline, uassets, options, reporter,
+            keep_jsons=None if writes else existing,
+        )
+        code = COMMANDS[options["command"]](pipeline, assets, options, reporter)
+    finally:
+        pipeline.close()
+        if writes:
+            remove_jsons(p for p in map(json_path_for, uassets) if p not in existing)
+
+    return EXIT_FAILURES if failed and code == EXIT_OK else code
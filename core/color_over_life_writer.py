@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 import json
 import os
 import subprocess
 
-from color_over_life import RGB, ColorOverLife, extract_color_over_life_list
+from core.asset_pipeline import AssetPipeline
+from core.color_over_life import RGB, ColorOverLife, extract_color_over_life_list
+from core.json_reader import VECTOR_AXES
+from core.json_writer import SpliceError, splice_numbers
 
 
 @dataclass
@@ -18,6 +21,21 @@ class ColorOccurrence:
     role: str
     rgb: RGB
     json_vec_node: Dict[str, Any]
+    original: Optional[Tuple[float, float, float]] = None
+
+    def __post_init__(self):
+        if self.original is None:
+            self.original = self.rgb.as_tuple()
+
+    @property
+    def dirty(self) -> bool:
+        return self.rgb.as_tuple() != self.original
+
+    def mark_clean(self):
+        """
+        El valor actual ya está escrito en el JSON
+        """
+        self.original = self.rgb.as_tuple()
 
 
 @dataclass
@@ -91,6 +109,18 @@ def apply_group_color(group: ColorGroup, new_rgb: RGB) -> None:
     group.key = new_key
 
 
+def dirty_asset_paths(groups: Iterable[ColorGroup]) -> List[str]:
+    """
+    Assets con al menos una ocurrencia cuyo color ya no es el original
+    """
+    paths: Dict[str, None] = {}
+    for group in groups:
+        for occ in group.occurrences:
+            if occ.dirty:
+                paths[occ.asset_path] = None
+    return list(paths)
+
+
 def export_uasset_to_json(uasset_path: str, uejson_exe: str = "UEJSON.exe") -> str:
     if not os.path.isfile(uasset_path):
         raise FileNotFoundError(uasset_path)
@@ -114,35 +144,102 @@ def import_json_to_uasset(json_path: str, uejson_exe: str = "UEJSON.exe") -> str
 def scan_assets_for_color_over_life(
     uasset_paths: Sequence[str],
     uejson_exe: str = "UEJSON.exe",
+    max_workers: Optional[int] = None,
+    errors: Optional[List[Tuple[str, BaseException]]] = None,
+    pipeline: Optional[AssetPipeline] = None,
 ):
+    """
+    Con pipeline se usa la del llamador (y él la cierra); si no, se crea
+    una y se cierra al terminar para no dejar sesiones del conversor vivas
+    """
     json_paths: List[str] = []
     all_json_roots: Dict[str, Any] = {}
     all_colors: List[ColorOverLife] = []
 
-    for p in uasset_paths:
-        if not p:
-            continue
+    owned = pipeline is None
+    if owned:
+        pipeline = AssetPipeline(uejson_path=uejson_exe, max_workers=max_workers)
 
-        json_path = export_uasset_to_json(p, uejson_exe)
-        json_paths.append(json_path)
+    try:
+        for result in pipeline.convert_many_to_json([p for p in uasset_paths if p]):
+            # Los fallos se acumulan en `errors` sin abortar el escaneo
+            if not result.ok:
+                if errors is not None:
+                    errors.append((result.source, result.error))
+                continue
 
-        with open(json_path, "r", encoding="utf-8") as f:
-            root = json.load(f)
+            json_path = result.output
+            json_paths.append(json_path)
 
-        all_json_roots[json_path] = root
+            with open(json_path, "r", encoding="utf-8") as f:
+                root = json.load(f)
 
-        exports = root.get("Exports") if isinstance(root, dict) else root
-        cols = extract_color_over_life_list(asset_path=p, json_root=exports)
-        all_colors.extend(cols)
+            all_json_roots[json_path] = root
+
+            exports = root.get("Exports") if isinstance(root, dict) else root
+            cols = extract_color_over_life_list(asset_path=result.source, json_root=exports)
+            all_colors.extend(cols)
+    finally:
+        if owned:
+            pipeline.close()
 
     groups = build_color_groups(all_colors)
     return json_paths, all_json_roots, all_colors, groups
 
 
-def write_back_jsons(json_roots: Mapping[str, Any]) -> None:
+def _occurrence_values(occurrences: Iterable[ColorOccurrence]) -> Dict[Tuple[int, tuple], float]:
+    """
+    {(export, ruta): valor} para parchear el texto de cada vector
+    (ruta según color_over_life_from_json)
+    """
+    values: Dict[Tuple[int, tuple], float] = {}
+    for occ in occurrences:
+        vec = "MinValueVec" if occ.role == "MIN" else "MaxValueVec"
+        for axis, value in zip(VECTOR_AXES, occ.rgb.as_tuple()):
+            values[(occ.entry_index, ("Properties", "ColorOverLife", vec, axis))] = value
+    return values
+
+
+def write_back_jsons(
+    json_roots: Mapping[str, Any],
+    groups: Optional[Iterable[ColorGroup]] = None,
+) -> List[str]:
+    """
+    Guarda los JSON. Si se pasan los grupos, solo los de assets con
+    cambios reales, parcheando los números en el texto original cuando
+    se puede. Devuelve las rutas escritas.
+    """
+    only = None
+    if groups is not None:
+        only = {}
+        for group in groups:
+            for occ in group.occurrences:
+                if occ.dirty:
+                    path = os.path.splitext(occ.asset_path)[0] + ".json"
+                    only.setdefault(path, []).append(occ)
+
+    written: List[str] = []
     for path, root in json_roots.items():
+        if only is not None:
+            if path not in only:
+                continue
+            try:
+                splice_numbers(path, _occurrence_values(only[path]))
+            except SpliceError:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(root, f, ensure_ascii=False, indent=2)
+
+            # Ya escritas: la próxima llamada no vuelve a tocar este asset
+            for occ in only[path]:
+                occ.mark_clean()
+            written.append(path)
+            continue
+
         with open(path, "w", encoding="utf-8") as f:
             json.dump(root, f, ensure_ascii=False, indent=2)
+        written.append(path)
+
+    return written
 
 
 def rebuild_uassets_from_jsons(
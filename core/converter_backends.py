@@ -0,0 +1,375 @@
+import abc
+import atexit
+import hashlib
+import json
+import os
+import queue
+import subprocess
+import threading
+from typing import List, Optional, Sequence
+
+from core import uejson_standin
+from core.settings_manager import get_appdata_dir
+
+# =====================================================
+# 🔒 Evitar ventanas CMD en Windows
+# =====================================================
+CREATE_NO_WINDOW = 0x08000000
+
+
+def _popen_kwargs() -> dict:
+    if os.name == "nt":
+        return {"creationflags": CREATE_NO_WINDOW}
+    return {}
+
+
+def _expected_json(uasset_path: str) -> str:
+    return os.path.splitext(uasset_path)[0] + ".json"
+
+
+def _expected_uasset(json_path: str) -> str:
+    return os.path.splitext(json_path)[0] + ".uasset"
+
+
+def tool_version(command: Sequence[str]) -> str:
+    """
+    Identificador estable del conversor: hash del ejecutable y de la
+    DLL hermana (UEJSON.dll), que es donde vive la lógica real.
+    """
+    digest = hashlib.sha1()
+    exe = command[-1] if command else ""
+
+    for path in (exe, os.path.splitext(exe)[0] + ".dll"):
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+
+    return f"uejson-{digest.hexdigest()[:16]}"
+
+
+# =====================================================
+# 🔹 Interfaz común
+# =====================================================
+class ConverterBackend(abc.ABC):
+    name = "base"
+
+    @property
+    @abc.abstractmethod
+    def version(self) -> str:
+        ...
+
+    @abc.abstractmethod
+    def uasset_to_json(self, uasset_path: str) -> str:
+        ...
+
+    @abc.abstractmethod
+    def json_to_uasset(self, json_path: str) -> str:
+        ...
+
+    def close(self):
+        pass
+
+
+# =====================================================
+# 🔹 Un proceso por archivo (comportamiento clásico)
+# =====================================================
+class SpawnBackend(ConverterBackend):
+    name = "spawn"
+
+    def __init__(self, command: Sequence[str]):
+        self.command = list(command)
+        self._version = None
+
+    @property
+    def version(self) -> str:
+        if self._version is None:
+            self._version = tool_version(self.command)
+        return self._version
+
+    def uasset_to_json(self, uasset_path: str) -> str:
+        subprocess.run(
+            self.command + ["-e", uasset_path],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            **_popen_kwargs()
+        )
+        return _expected_json(uasset_path)
+
+    def json_to_uasset(self, json_path: str) -> str:
+        subprocess.run(
+            self.command + ["-i", json_path],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            **_popen_kwargs()
+        )
+        return _expected_uasset(json_path)
+
+
+# =====================================================
+# 🔹 Sesiones largas (--batch por stdin)
+# =====================================================
+class ConverterSessionError(RuntimeError):
+    pass
+
+
+def _readline(stream, timeout: float) -> Optional[str]:
+    """
+    readline con plazo (None si no llega a tiempo). Se lee en un hilo
+    porque en Windows las tuberías no admiten select().
+    """
+    lines = queue.Queue(maxsize=1)
+    threading.Thread(target=lambda: lines.put(stream.readline()), daemon=True).start()
+    try:
+        return lines.get(timeout=timeout)
+    except queue.Empty:
+        return None
+
+
+class _Session:
+    # Arranque de .NET incluido; un conversor que no saluda no bloquea
+    # la pipeline
+    HANDSHAKE_TIMEOUT = 15.0
+
+    def __init__(self, command: List[str]):
+        self.proc = subprocess.Popen(
+            command + ["--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            **_popen_kwargs()
+        )
+
+        hello = _readline(self.proc.stdout, self.HANDSHAKE_TIMEOUT)
+        if hello is None:
+            self.proc.kill()
+            self.proc.wait()
+            raise ConverterSessionError("el conversor no respondió al iniciar --batch")
+
+        hello = hello.rstrip("\r\n")
+        op, _, version = hello.partition("\t")
+        if op != "ready":
+            self.close()
+            raise ConverterSessionError(hello or "el conversor no soporta --batch")
+
+        self.version = version
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(self, op: str, path: str) -> str:
+        try:
+            self.proc.stdin.write(f"{op}\t{path}\n")
+            self.proc.stdin.flush()
+            reply = self.proc.stdout.readline()
+        except (OSError, ValueError) as e:
+            raise ConverterSessionError(str(e)) from e
+
+        if not reply:
+            raise ConverterSessionError("la sesión del conversor terminó")
+
+        status, _, payload = reply.rstrip("\r\n").partition("\t")
+        if status != "ok":
+            raise RuntimeError(payload)
+        return payload
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            self.proc.wait(timeout=5)
+        except Exception:
+            self.proc.kill()
+
+
+class SessionBackend(ConverterBackend):
+    """
+    Mantiene hasta max_sessions procesos vivos y reparte las peticiones
+    entre ellos; el arranque de .NET y el JIT se pagan una vez por sesión.
+    Es seguro llamarlo desde varios hilos a la vez.
+    """
+    name = "session"
+
+    def __init__(self, command: Sequence[str], max_sessions: int = 1):
+        self.command = list(command)
+        self.max_sessions = max(1, int(max_sessions))
+
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._sessions: List[_Session] = []
+        self._version = None
+
+        # Falla aquí si la herramienta no soporta el protocolo
+        self._release(self._acquire())
+        atexit.register(self.close)
+
+    @property
+    def version(self) -> str:
+        if self._version is None:
+            self._version = tool_version(self.command)
+        return self._version
+
+    def _spawn(self) -> _Session:
+        session = _Session(self.command)
+        with self._lock:
+            self._sessions.append(session)
+        return session
+
+    def _acquire(self) -> _Session:
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            # Reservar hueco antes de arrancar para no pasar de max_sessions
+            with self._lock:
+                can_spawn = self._created < self.max_sessions
+                if can_spawn:
+                    self._created += 1
+
+            if can_spawn:
+                try:
+                    return self._spawn()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+    def _release(self, session: _Session):
+        if session.alive:
+            self._idle.put(session)
+            return
+
+        # Sesión muerta: dejar hueco para una nueva
+        session.close()
+        with self._lock:
+            self._created -= 1
+            if session in self._sessions:
+                self._sessions.remove(session)
+
+    def _request(self, op: str, path: str) -> str:
+        session = self._acquire()
+        try:
+            return session.request(op, path)
+        finally:
+            self._release(session)
+
+    def uasset_to_json(self, uasset_path: str) -> str:
+        return self._request("e", uasset_path)
+
+    def json_to_uasset(self, json_path: str) -> str:
+        return self._request("i", json_path)
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+            self._created = 0
+        for session in sessions:
+            session.close()
+        self._idle = queue.LifoQueue()
+
+
+# =====================================================
+# 🔹 Sustituto en proceso (sin .NET)
+# =====================================================
+class PythonStandInBackend(ConverterBackend):
+    name = "python"
+
+    @property
+    def version(self) -> str:
+        return uejson_standin.VERSION
+
+    def uasset_to_json(self, uasset_path: str) -> str:
+        return uejson_standin.export_package(uasset_path)
+
+    def json_to_uasset(self, json_path: str) -> str:
+        return uejson_standin.import_package(json_path)
+
+
+BACKENDS = ("auto", "spawn", "session", "python")
+
+
+# =====================================================
+# 🔹 Conversores que no hablan --batch (recordado entre ejecuciones)
+# =====================================================
+def _no_batch_path() -> str:
+    return os.path.join(get_appdata_dir(), "cache", "no_batch.json")
+
+
+def _load_no_batch() -> dict:
+    try:
+        with open(_no_batch_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _remember_no_batch(command: Sequence[str], version: str):
+    """
+    Guarda {comando: versión} para no repetir el saludo fallido; con otra
+    versión de la herramienta se vuelve a probar
+    """
+    data = _load_no_batch()
+    data[" ".join(command)] = version
+
+    path = _no_batch_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def create_backend(
+    kind: str,
+    command: Optional[Sequence[str]] = None,
+    max_sessions: int = 1,
+) -> ConverterBackend:
+    """
+    auto → sesiones si la herramienta habla --batch, si no un proceso
+    por archivo. El resultado negativo se recuerda por comando y versión.
+    """
+    kind = (kind or "auto").lower()
+
+    if kind == "python":
+        return PythonStandInBackend()
+
+    if not command:
+        raise ValueError(f"El backend '{kind}' necesita un comando")
+
+    if kind == "spawn":
+        return SpawnBackend(command)
+
+    if kind == "session":
+        return SessionBackend(command, max_sessions)
+
+    if kind == "auto":
+        version = tool_version(command)
+        if _load_no_batch().get(" ".join(command)) == version:
+            return SpawnBackend(command)
+
+        try:
+            return SessionBackend(command, max_sessions)
+        except ConverterSessionError:
+            _remember_no_batch(command, version)
+        except OSError:
+            pass
+        return SpawnBackend(command)
+
+    raise ValueError(f"Backend de conversión desconocido: {kind}")
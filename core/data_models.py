@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import List, Set, Any
+import sys
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Set, Any, Optional, Tuple
 
 
 @dataclass
@@ -19,12 +20,31 @@ class ColorEntry:
     g: float
     b: float
     raw_ref: Any
+    # (export, propiedad, valor) dentro del JSON de UEJSON
+    location: Optional[Tuple[int, int, int]] = None
+    # Valores tal como se leyeron del asset
+    original: Optional[Tuple[float, float, float]] = None
+    tracker: Any = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         self.r = float(self.r)
         self.g = float(self.g)
         self.b = float(self.b)
 
+        # Rutas y módulos se repiten miles de veces: una sola copia
+        self.asset = sys.intern(self.asset)
+        self.module = sys.intern(self.module)
+
+        if self.original is None:
+            self.original = (self.r, self.g, self.b)
+
+    def detach(self):
+        """
+        Suelta la referencia al árbol JSON; a partir de aquí la entry
+        solo guarda su ubicación y sus valores.
+        """
+        self.raw_ref = None
+
     def set_rgb(self, r: float, g: float, b: float):
         self.r = float(r)
         self.g = float(g)
@@ -35,6 +55,113 @@ class ColorEntry:
             self.raw_ref["Y"] = self.g
             self.raw_ref["Z"] = self.b
 
+        if self.tracker is not None:
+            self.tracker.update(self)
+
+    @property
+    def key(self) -> Tuple:
+        """
+        Identidad estable: a diferencia de id(), sigue valiendo al recargar
+        """
+        return (self.asset, self.module, self.mode, self.location)
+
+    @property
+    def dirty(self) -> bool:
+        return (self.r, self.g, self.b) != self.original
+
+    def snapshot(self) -> "ColorEntry":
+        """
+        Copia suelta (sin tracker ni árbol JSON) con los valores actuales,
+        para escribirla desde otro hilo mientras la original se sigue
+        editando
+        """
+        return replace(self, raw_ref=None, tracker=None)
+
+    def mark_clean(self, written: Optional[Tuple[float, float, float]] = None):
+        """
+        Los valores written (por defecto los actuales) ya están escritos
+        en el .uasset
+        """
+        self.original = written if written is not None else (self.r, self.g, self.b)
+
+        if self.tracker is not None:
+            self.tracker.update(self)
+
+    @property
+    def pointer(self) -> Optional[str]:
+        """
+        JSON pointer (RFC 6901) al FVector dentro del documento de UEJSON
+        """
+        if self.location is None:
+            return None
+
+        e, p, v = self.location
+        return f"/Exports/{e}/Data/{p}/Value/{v}/Value/0/Value"
+
+
+class DirtyTracker:
+    """
+    Sabe qué entries (y por tanto qué assets) difieren de lo que hay en
+    disco. ColorEntry.set_rgb lo avisa, así que consultar los assets
+    sucios cuesta lo que la edición, no lo que el proyecto.
+    """
+
+    def __init__(self):
+        self._dirty: Dict[str, Dict[int, ColorEntry]] = {}
+
+    def track(self, entries: List[ColorEntry]):
+        for entry in entries:
+            entry.tracker = self
+            if entry.dirty:
+                self.update(entry)
+
+    def update(self, entry: ColorEntry):
+        bucket = self._dirty.get(entry.asset)
+
+        if entry.dirty:
+            if bucket is None:
+                bucket = self._dirty[entry.asset] = {}
+            bucket[id(entry)] = entry
+        elif bucket is not None:
+            bucket.pop(id(entry), None)
+            if not bucket:
+                del self._dirty[entry.asset]
+
+    def dirty_assets(self) -> Dict[str, List[ColorEntry]]:
+        return {asset: list(bucket.values()) for asset, bucket in self._dirty.items()}
+
+    def is_dirty(self, asset: str) -> bool:
+        return asset in self._dirty
+
+    def clear(self):
+        self._dirty.clear()
+
+
+class SiblingIndex:
+    """
+    (asset, módulo) → entries de ese módulo, para Sync Min/Max: el
+    hermano MIN ↔ MAX de una entry se encuentra sin recorrer el proyecto.
+    """
+
+    def __init__(self):
+        self._modules: Dict[Tuple[str, str], List[ColorEntry]] = {}
+
+    def add(self, entries: List[ColorEntry]):
+        for entry in entries:
+            self._modules.setdefault((entry.asset, entry.module), []).append(entry)
+
+    def siblings(self, entry: ColorEntry) -> List[ColorEntry]:
+        """
+        Entries del mismo asset y módulo con el otro modo
+        """
+        return [
+            e for e in self._modules.get((entry.asset, entry.module), ())
+            if e.mode != entry.mode
+        ]
+
+    def clear(self):
+        self._modules.clear()
+
 
 @dataclass
 class ColorTableRow:
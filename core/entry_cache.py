@@ -0,0 +1,248 @@
+import hashlib
+import os
+import struct
+import threading
+from typing import List, Optional, Tuple
+
+from core.data_models import ColorEntry
+from core.settings_manager import get_appdata_dir
+
+# =====================================================
+# Formato binario (little endian):
+#
+#   cabecera  "CFEC" u16 formato  u32 nº strings  u32 nº entries
+#   strings   u16 longitud + utf-8          (nombres de módulo)
+#   entries   u32 módulo  u8 modo  3×u32 ubicación  3×f64 rgb
+# =====================================================
+MAGIC = b"CFEC"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHII")
+_STRLEN = struct.Struct("<H")
+_ENTRY = struct.Struct("<IBIII3d")
+
+_MODES = ("MIN", "MAX", "START")
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def cache_files(folder: str, suffix: str):
+    """
+    (ruta, tamaño, mtime) de los archivos de una caché en disco
+    """
+    for root, _, files in os.walk(folder):
+        for name in files:
+            if name.endswith(suffix):
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+
+def evict_oldest(folder: str, suffix: str, max_bytes: int) -> int:
+    """
+    Borra por antigüedad (mtime = último uso) hasta quedar en el 90 % del
+    límite. Devuelve el tamaño que queda.
+    """
+    target = int(max_bytes * 0.9)
+    files = sorted(cache_files(folder, suffix), key=lambda f: f[2])
+    total = sum(size for _, size, _ in files)
+
+    for path, size, _ in files:
+        if total <= target:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+    return total
+
+
+def content_key(uasset_path: str, converter_version: str) -> str:
+    """
+    Hash del .uasset (+ .uexp si existe) y de la versión del conversor
+    """
+    digest = hashlib.sha1()
+    digest.update(f"{FORMAT_VERSION}:{converter_version}".encode("utf-8"))
+
+    for path in (uasset_path, os.path.splitext(uasset_path)[0] + ".uexp"):
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def encode_entries(entries: List[ColorEntry]) -> bytes:
+    strings: List[str] = []
+    index = {}
+    records = []
+
+    for e in entries:
+        if e.location is None:
+            raise ValueError("Solo se pueden cachear entries con ubicación")
+
+        if e.module not in index:
+            index[e.module] = len(strings)
+            strings.append(e.module)
+
+        records.append(
+            _ENTRY.pack(
+                index[e.module],
+                _MODES.index(e.mode),
+                *e.location,
+                e.r, e.g, e.b,
+            )
+        )
+
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(strings), len(records))]
+    for text in strings:
+        raw = text.encode("utf-8")
+        parts.append(_STRLEN.pack(len(raw)))
+        parts.append(raw)
+    parts.extend(records)
+
+    return b"".join(parts)
+
+
+def decode_entries(data: bytes, json_path: str) -> List[ColorEntry]:
+    magic, version, n_strings, n_entries = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Formato de caché no reconocido")
+
+    pos = _HEADER.size
+    strings = []
+    for _ in range(n_strings):
+        (length,) = _STRLEN.unpack_from(data, pos)
+        pos += _STRLEN.size
+        strings.append(data[pos:pos + length].decode("utf-8"))
+        pos += length
+
+    entries = []
+    for module, mode, e, p, v, r, g, b in _ENTRY.iter_unpack(
+        data[pos:pos + n_entries * _ENTRY.size]
+    ):
+        entries.append(
+            ColorEntry(
+                asset=json_path,
+                module=strings[module],
+                mode=_MODES[mode],
+                r=r, g=g, b=b,
+                raw_ref=None,
+                location=(e, p, v),
+            )
+        )
+
+    return entries
+
+
+class EntryCache:
+    """
+    Caché persistente de entries de color, direccionada por contenido.
+
+    Un archivo por asset bajo <appdata>/cache/entries. La fecha de
+    modificación hace de marca LRU: se actualiza en cada acierto y al
+    pasar de max_bytes se borran primero los más antiguos.
+    """
+
+    def __init__(self, folder: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.folder = folder or os.path.join(get_appdata_dir(), "cache", "entries")
+        self.max_bytes = int(max_bytes)
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.folder, key[:2], key + ".bin")
+
+    # =====================================================
+    # 🔹 Lectura / escritura
+    # =====================================================
+    def get(self, key: str, json_path: str) -> Optional[Tuple[List[ColorEntry], List[ColorEntry]]]:
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as f:
+                entries = decode_entries(f.read(), json_path)
+            os.utime(path)
+        except Exception:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+
+        mins = [e for e in entries if e.mode != "MAX"]
+        maxs = [e for e in entries if e.mode == "MAX"]
+        return mins, maxs
+
+    def put(self, key: str, min_entries: List[ColorEntry], max_entries: List[ColorEntry]):
+        try:
+            data = encode_entries(min_entries + max_entries)
+        except ValueError:
+            return
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Al sobrescribir solo cuenta la diferencia con el fichero anterior
+        try:
+            old_size = os.stat(path).st_size
+        except OSError:
+            old_size = 0
+
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += len(data) - old_size
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    # =====================================================
+    # 🔹 Mantenimiento
+    # =====================================================
+    def _files(self):
+        return cache_files(self.folder, ".bin")
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._files())
+
+    def _evict(self):
+        self._total_bytes = evict_oldest(self.folder, ".bin", self.max_bytes)
+
+    def purge(self) -> int:
+        """
+        Vacía la caché. Devuelve cuántos archivos se borraron.
+        """
+        removed = 0
+        with self._lock:
+            for path, _, _ in list(self._files()):
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+            self._total_bytes = 0
+        return removed
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
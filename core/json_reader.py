@@ -1,8 +1,43 @@
 import json
-from typing import Any, List, Tuple
+import mmap
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from core.data_models import ColorEntry
 
 
+# =========================================================
+# Lectura en streaming (sin json.load del documento entero)
+# =========================================================
+
+# Todo lo que no es corchete/llave, incluidas cadenas completas y
+# objetos/arrays "planos" (sin anidar), que son la mayoría de propiedades
+# (cuantificadores posesivos: sin pila de backtracking)
+_STR = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_FLAT = rb'[^"\[\]{}]*+(?:' + _STR + rb'[^"\[\]{}]*+)*+'
+_SKIP_PATTERN = (
+    rb'(?:[^"\[\]{}]++|' + _STR + rb'|\{' + _FLAT + rb'\}|\[' + _FLAT + rb'\])*+'
+)
+
+
+def _possessive(pattern: bytes):
+    try:
+        return re.compile(pattern)
+    except re.error:
+        # Python < 3.11 no tiene cuantificadores posesivos
+        return re.compile(pattern.replace(b"*+", b"*").replace(b"++", b"+"))
+
+
+_SKIP = _possessive(_SKIP_PATTERN)
+_EXPORTS_KEY = re.compile(rb'"Exports"\s*:\s*\[')
+_SEPARATOR = re.compile(rb'[\s,]*')
+
+# Prefijo de las clases de módulo de color (ParticleModuleColor,
+# ParticleModuleColorOverLife, ...)
+COLOR_MODULE_PREFIX = "ParticleModuleColor"
+
+_RELEVANT = b'"' + COLOR_MODULE_PREFIX.encode("ascii")
+
+
 def _as_float(v: Any) -> float:
     try:
         return float(v)
@@ -10,6 +45,119 @@ def _as_float(v: Any) -> float:
         return 0.0
 
 
+def _extract_export(
+    json_path: str,
+    export_index: int,
+    export: Any,
+    min_entries: List[ColorEntry],
+    max_entries: List[ColorEntry],
+):
+    name = export.get("ObjectName", "")
+    data_block = export.get("Data", [])
+
+    # =========================================================
+    # 1) ParticleModuleColorOverLife
+    # =========================================================
+    if name.startswith("ParticleModuleColorOverLife"):
+        for prop_index, prop in enumerate(data_block):
+            if prop.get("Name") != "ColorOverLife":
+                continue
+
+            values = prop.get("Value", [])
+            min_ref = None
+            max_ref = None
+            min_loc = None
+            max_loc = None
+
+            for value_index, item in enumerate(values):
+                if item.get("Name") == "MinValueVec":
+                    min_ref = item["Value"][0]["Value"]
+                    min_loc = (export_index, prop_index, value_index)
+                elif item.get("Name") == "MaxValueVec":
+                    max_ref = item["Value"][0]["Value"]
+                    max_loc = (export_index, prop_index, value_index)
+
+            if isinstance(min_ref, dict):
+                min_entries.append(
+                    ColorEntry(
+                        asset=json_path,
+                        module=name,
+                        mode="MIN",
+                        r=_as_float(min_ref.get("X")),
+                        g=_as_float(min_ref.get("Y")),
+                        b=_as_float(min_ref.get("Z")),
+                        raw_ref=min_ref,
+                        location=min_loc,
+                    )
+                )
+
+            if isinstance(max_ref, dict):
+                max_entries.append(
+                    ColorEntry(
+                        asset=json_path,
+                        module=name,
+                        mode="MAX",
+                        r=_as_float(max_ref.get("X")),
+                        g=_as_float(max_ref.get("Y")),
+                        b=_as_float(max_ref.get("Z")),
+                        raw_ref=max_ref,
+                        location=max_loc,
+                    )
+                )
+
+    # =========================================================
+    # 2) ParticleModuleColor (INITIAL / START COLOR)
+    # =========================================================
+    elif name.startswith("ParticleModuleColor"):
+        for prop_index, prop in enumerate(data_block):
+            if prop.get("Name") != "StartColor":
+                continue
+
+            values = prop.get("Value", [])
+            min_ref = None
+            max_ref = None
+            min_loc = None
+            max_loc = None
+
+            for value_index, item in enumerate(values):
+                if item.get("Name") == "MinValueVec":
+                    min_ref = item["Value"][0]["Value"]
+                    min_loc = (export_index, prop_index, value_index)
+                elif item.get("Name") == "MaxValueVec":
+                    max_ref = item["Value"][0]["Value"]
+                    max_loc = (export_index, prop_index, value_index)
+
+            # Min Value Vector
+            if isinstance(min_ref, dict):
+                min_entries.append(
+                    ColorEntry(
+                        asset=json_path,
+                        module=name,
+                        mode="MIN",
+                        r=_as_float(min_ref.get("X")),
+                        g=_as_float(min_ref.get("Y")),
+                        b=_as_float(min_ref.get("Z")),
+                        raw_ref=min_ref,
+                        location=min_loc,
+                    )
+                )
+
+            # Max Value Vector
+            if isinstance(max_ref, dict):
+                max_entries.append(
+                    ColorEntry(
+                        asset=json_path,
+                        module=name,
+                        mode="MAX",
+                        r=_as_float(max_ref.get("X")),
+                        g=_as_float(max_ref.get("Y")),
+                        b=_as_float(max_ref.get("Z")),
+                        raw_ref=max_ref,
+                        location=max_loc,
+                    )
+                )
+
+
 def load_color_over_life_from_root(
     json_path: str,
     data: Any
@@ -20,107 +168,201 @@ def load_color_over_life_from_root(
 
     exports = data.get("Exports", []) if isinstance(data, dict) else []
 
-    for export in exports:
-        name = export.get("ObjectName", "")
-        data_block = export.get("Data", [])
-
-        # =========================================================
-        # 1) ParticleModuleColorOverLife
-        # =========================================================
-        if name.startswith("ParticleModuleColorOverLife"):
-            for prop in data_block:
-                if prop.get("Name") != "ColorOverLife":
-                    continue
-
-                values = prop.get("Value", [])
-                min_ref = None
-                max_ref = None
-
-                for item in values:
-                    if item.get("Name") == "MinValueVec":
-                        min_ref = item["Value"][0]["Value"]
-                    elif item.get("Name") == "MaxValueVec":
-                        max_ref = item["Value"][0]["Value"]
-
-                if isinstance(min_ref, dict):
-                    min_entries.append(
-                        ColorEntry(
-                            asset=json_path,
-                            module=name,
-                            mode="MIN",
-                            r=_as_float(min_ref.get("X")),
-                            g=_as_float(min_ref.get("Y")),
-                            b=_as_float(min_ref.get("Z")),
-                            raw_ref=min_ref,
-                        )
-                    )
+    for export_index, export in enumerate(exports):
+        _extract_export(json_path, export_index, export, min_entries, max_entries)
 
-                if isinstance(max_ref, dict):
-                    max_entries.append(
-                        ColorEntry(
-                            asset=json_path,
-                            module=name,
-                            mode="MAX",
-                            r=_as_float(max_ref.get("X")),
-                            g=_as_float(max_ref.get("Y")),
-                            b=_as_float(max_ref.get("Z")),
-                            raw_ref=max_ref,
-                        )
-                    )
+    return min_entries, max_entries
 
-        # =========================================================
-        # 2) ParticleModuleColor (INITIAL / START COLOR)
-        # =========================================================
-        elif name.startswith("ParticleModuleColor"):
-            for prop in data_block:
-                if prop.get("Name") != "StartColor":
-                    continue
-
-                values = prop.get("Value", [])
-                min_ref = None
-                max_ref = None
-
-                for item in values:
-                    if item.get("Name") == "MinValueVec":
-                        min_ref = item["Value"][0]["Value"]
-                    elif item.get("Name") == "MaxValueVec":
-                        max_ref = item["Value"][0]["Value"]
-
-                # Min Value Vector
-                if isinstance(min_ref, dict):
-                    min_entries.append(
-                        ColorEntry(
-                            asset=json_path,
-                            module=name,
-                            mode="MIN",
-                            r=_as_float(min_ref.get("X")),
-                            g=_as_float(min_ref.get("Y")),
-                            b=_as_float(min_ref.get("Z")),
-                            raw_ref=min_ref,
-                        )
-                    )
 
-                # Max Value Vector
-                if isinstance(max_ref, dict):
-                    max_entries.append(
-                        ColorEntry(
-                            asset=json_path,
-                            module=name,
-                            mode="MAX",
-                            r=_as_float(max_ref.get("X")),
-                            g=_as_float(max_ref.get("Y")),
-                            b=_as_float(max_ref.get("Z")),
-                            raw_ref=max_ref,
-                        )
-                    )
+def _end_of_value(buf, pos: int) -> int:
+    """
+    pos apunta a '{' o '['; devuelve la posición tras su cierre.
+    Las cadenas y escalares se saltan dentro del motor de regex, así
+    que el bucle en Python solo ve corchetes y llaves.
+    """
+    depth = 0
+    skip = _SKIP.match
 
-    return min_entries, max_entries
+    while True:
+        c = buf[pos]
+        if c == 0x7B or c == 0x5B:       # { [
+            depth += 1
+        elif c == 0x7D or c == 0x5D:     # } ]
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        else:
+            raise ValueError(f"JSON inesperado en el byte {pos}")
+
+        pos = skip(buf, pos + 1).end()
+
+
+def _exports_start(buf) -> Optional[int]:
+    """
+    Posición del primer export dentro del array Exports (o del array
+    raíz si el documento es directamente la lista de exports).
+    """
+    match = _EXPORTS_KEY.search(buf)
+    if match is not None:
+        return _SEPARATOR.match(buf, match.end()).end()
+
+    start = _SEPARATOR.match(buf, 0).end()
+    if start < len(buf) and buf[start] == 0x5B:
+        return _SEPARATOR.match(buf, start + 1).end()
+
+    return None
+
+
+def _iter_exports(buf, pos: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    (índice, inicio, fin) de cada export, saltando su contenido
+    """
+    export_index = 0
+
+    while pos < len(buf) and buf[pos] == 0x7B:
+        end = _end_of_value(buf, pos)
+        yield export_index, pos, end
+
+        export_index += 1
+        pos = _SEPARATOR.match(buf, end).end()
+
+
+def iter_color_over_life_stream(json_path: str) -> Iterator[ColorEntry]:
+    """
+    Recorre Exports sin materializar el documento: solo se decodifican
+    los exports cuyo texto menciona ParticleModuleColor*. Devuelve las
+    mismas entries (y ubicaciones) que load_color_over_life_from_root;
+    raw_ref apunta al export decodificado, no a un árbol completo.
+    """
+    with open(json_path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # archivo vacío
+
+    with buf:
+        if buf.find(_RELEVANT) == -1:
+            return
+
+        if _EXPORTS_KEY.search(buf) is None:
+            # Forma inesperada: camino clásico
+            mins, maxs = load_color_over_life_from_json(json_path)
+            yield from mins + maxs
+            return
+
+        for export_index, pos, end in _iter_exports(buf, _exports_start(buf)):
+            if buf.find(_RELEVANT, pos, end) != -1:
+                export = json.loads(buf[pos:end])
+                mins: List[ColorEntry] = []
+                maxs: List[ColorEntry] = []
+                _extract_export(json_path, export_index, export, mins, maxs)
+                yield from mins
+                yield from maxs
+
+
+# =========================================================
+# Posiciones de números (para parchear el texto sin re-serializar)
+# =========================================================
+
+_TOKEN = _possessive(
+    rb'\s*+(?:(' + _STR + rb')|([-+]?(?:Infinity|[\d.eE+-]++)|NaN)'
+    rb'|([{}\[\],:])|true|false|null)'
+)
+
+# Ruta (dentro del export) de cada componente de un FVector de color
+VECTOR_AXES = ("X", "Y", "Z")
+
+
+def vector_number_path(location: Tuple[int, int, int], axis: str) -> Tuple[int, tuple]:
+    e, p, v = location
+    return e, ("Data", p, "Value", v, "Value", 0, "Value", axis)
+
+
+def _number_spans_in(buf, start: int, end: int, export_index: int, wanted, spans):
+    """
+    Tokeniza un export y anota (inicio, fin, literal) de cada número
+    cuya ruta está en wanted.
+    """
+    path: List[Any] = []
+    is_object: List[bool] = []
+    expect_key = False
+
+    for match in _TOKEN.finditer(buf, start, end):
+        text, number, punct = match.group(1, 2, 3)
+
+        if punct is not None:
+            if punct == b"{" or punct == b"[":
+                is_object.append(punct == b"{")
+                path.append(None if punct == b"{" else 0)
+                expect_key = punct == b"{"
+            elif punct == b"}" or punct == b"]":
+                is_object.pop()
+                path.pop()
+                expect_key = False
+            elif punct == b",":
+                if is_object[-1]:
+                    expect_key = True
+                else:
+                    path[-1] += 1
+            continue
+
+        if expect_key:
+            path[-1] = text[1:-1].decode("utf-8")
+            expect_key = False
+            continue
+
+        if number is not None:
+            key = (export_index, tuple(path))
+            if key in wanted:
+                spans[key] = (match.start(2), match.end(2), number)
+
+
+def find_number_spans(
+    json_path: str,
+    targets: Iterable[Tuple[int, tuple]],
+) -> Dict[Tuple[int, tuple], Tuple[int, int, bytes]]:
+    """
+    Devuelve {(export, ruta): (inicio, fin, literal)} de los números
+    pedidos. Solo se tokenizan los exports implicados; el resto se salta
+    igual que en la lectura en streaming.
+    """
+    wanted = set(targets)
+    exports = {e for e, _ in wanted}
+    spans: Dict[Tuple[int, tuple], Tuple[int, int, bytes]] = {}
+
+    with open(json_path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return spans  # archivo vacío
+
+    with buf:
+        pos = _exports_start(buf)
+        if pos is None:
+            return spans
+
+        last = max(exports, default=-1)
+        for export_index, start, end in _iter_exports(buf, pos):
+            if export_index in exports:
+                _number_spans_in(buf, start, end, export_index, wanted, spans)
+            if export_index >= last:
+                break
+
+    return spans
 
 
 def load_color_over_life_from_json(
-    json_path: str
+    json_path: str,
+    streaming: bool = False,
 ) -> Tuple[List[ColorEntry], List[ColorEntry]]:
 
+    if streaming:
+        min_entries: List[ColorEntry] = []
+        max_entries: List[ColorEntry] = []
+        for entry in iter_color_over_life_stream(json_path):
+            (max_entries if entry.mode == "MAX" else min_entries).append(entry)
+        return min_entries, max_entries
+
     with open(json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
@@ -1,8 +1,29 @@
 import json
+import mmap
 import os
-from typing import Iterable, Tuple
+import struct
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
 from core.data_models import ColorEntry
+from core.json_reader import VECTOR_AXES, find_number_spans, vector_number_path
+
+# Buffer de escritura del parcheo en bloque
+_WRITE_BUFFER = 1024 * 1024
+
+
+class SpliceError(ValueError):
+    """
+    Algún número pedido no está en el texto (forma inesperada del
+    documento); quien llama debe recurrir a re-serializar.
+    """
+
+
+class StaleDocumentError(ValueError):
+    """
+    El documento no contiene los valores con los que se cargaron las
+    entries (cambió por fuera o la ubicación no corresponde): no se
+    escribe nada.
+    """
 
 
 def apply_color_groups_to_json(
@@ -14,13 +35,28 @@ def apply_color_groups_to_json(
     if not os.path.exists(json_path):
         raise FileNotFoundError(json_path)
 
+    nr, ng, nb = float(new_rgb[0]), float(new_rgb[1]), float(new_rgb[2])
+    entries = list(entries)
+
+    # Camino rápido: parchear solo los números en el texto original
+    if all(entry.location is not None for entry in entries):
+        try:
+            splice_numbers(json_path, _vector_values(entries, (nr, ng, nb)))
+        except SpliceError:
+            pass
+        else:
+            for entry in entries:
+                entry.set_rgb(nr, ng, nb)
+            return True
+
     with open(json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
-    nr, ng, nb = float(new_rgb[0]), float(new_rgb[1]), float(new_rgb[2])
-
     for entry in entries:
-        ref = entry.raw_ref
+        if entry.location is not None:
+            ref = resolve_vector(data, entry.location)
+        else:
+            ref = entry.raw_ref
         if not isinstance(ref, dict):
             continue
 
@@ -28,11 +64,184 @@ def apply_color_groups_to_json(
         ref["Y"] = ng
         ref["Z"] = nb
 
-        entry.r = nr
-        entry.g = ng
-        entry.b = nb
+        # set_rgb mantiene el estado sucio (y el tracker) al día
+        entry.set_rgb(nr, ng, nb)
 
     with open(json_path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=4)
 
     return True
+
+
+def _number_literal(value: float) -> bytes:
+    # Igual que json.dump (repr de float; NaN / Infinity)
+    return json.dumps(float(value)).encode("ascii")
+
+
+def _same_number(literal: bytes, value: float) -> bool:
+    try:
+        return float(literal) == float(value)
+    except ValueError:
+        return False
+
+
+def _stored_equal(stored, value: float) -> bool:
+    """
+    ¿El valor leído del documento es el que se escribió? Los paquetes
+    UE4 guardan float32, así que al re-exportar vuelve redondeado.
+    """
+    try:
+        a, b = float(stored), float(value)
+    except (TypeError, ValueError):
+        return False
+    if a == b:
+        return True
+    try:
+        return struct.pack("<f", a) == struct.pack("<f", b)
+    except OverflowError:
+        return False
+
+
+def _vector_equals(ref: Dict[str, Any], rgb) -> bool:
+    return all(_stored_equal(ref.get(axis), v) for axis, v in zip(VECTOR_AXES, rgb))
+
+
+def _vector_values(entries, rgb=None) -> Dict[Tuple[int, tuple], float]:
+    """
+    {(export, ruta): valor} de X/Y/Z de cada entry (su color actual o rgb)
+    """
+    values = {}
+    for entry in entries:
+        components = rgb if rgb is not None else (entry.r, entry.g, entry.b)
+        for axis, value in zip(VECTOR_AXES, components):
+            values[vector_number_path(entry.location, axis)] = value
+    return values
+
+
+def splice_numbers(
+    json_path: str,
+    values: Mapping[Tuple[int, tuple], float],
+    expected: Optional[Mapping[Tuple[int, tuple], float]] = None,
+) -> int:
+    """
+    Sustituye números concretos de un JSON sin re-serializarlo: copia el
+    texto original tal cual y solo reescribe los literales que cambian.
+    values: {(export, ruta dentro del export): valor}. Con expected, los
+    literales actuales deben valer eso (StaleDocumentError si no).
+    Devuelve cuántos literales se reescribieron (0 = el archivo no se toca).
+    """
+    spans = find_number_spans(json_path, values.keys())
+
+    missing = len(values) - len(spans)
+    if missing:
+        raise SpliceError(f"{missing} número(s) no encontrados en {json_path}")
+
+    if expected is not None:
+        for target, (_, _, literal) in spans.items():
+            if not _stored_equal(literal, expected[target]):
+                raise StaleDocumentError(f"{json_path} no coincide con las entries cargadas")
+
+    patches = sorted(
+        (start, end, _number_literal(values[target]))
+        for target, (start, end, literal) in spans.items()
+        if not _same_number(literal, values[target])
+    )
+    if not patches:
+        return 0
+
+    tmp = json_path + ".splice.tmp"
+    with open(json_path, "rb") as src:
+        buf = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        with memoryview(buf) as view, open(tmp, "wb", buffering=_WRITE_BUFFER) as out:
+            pos = 0
+            for start, end, literal in patches:
+                out.write(view[pos:start])
+                out.write(literal)
+                pos = end
+            out.write(view[pos:])
+    finally:
+        buf.close()
+
+    os.replace(tmp, json_path)
+    return len(patches)
+
+
+def resolve_vector(root: Any, location: Tuple[int, int, int]) -> Optional[Dict[str, Any]]:
+    """
+    Devuelve el dict FVector (X/Y/Z) de una ubicación (export, prop, valor)
+    """
+    try:
+        e, p, v = location
+        ref = root["Exports"][e]["Data"][p]["Value"][v]["Value"][0]["Value"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+    return ref if isinstance(ref, dict) else None
+
+
+def apply_entries_to_root(root: Any, entries: Iterable[ColorEntry]) -> int:
+    """
+    Escribe los valores actuales de cada entry en un documento recién
+    leído, usando su ubicación en vez de raw_ref. Devuelve cuántos aplicó.
+    """
+    applied = 0
+
+    for entry in entries:
+        if entry.location is None:
+            continue
+
+        ref = resolve_vector(root, entry.location)
+        if ref is None:
+            continue
+
+        ref["X"] = entry.r
+        ref["Y"] = entry.g
+        ref["Z"] = entry.b
+        applied += 1
+
+    return applied
+
+
+def write_entries_to_json(json_path: str, entries: Iterable[ColorEntry]) -> int:
+    """
+    Escribe los valores actuales de las entries en el JSON del asset, por
+    ubicación. Parchea los números en el texto original y solo si el
+    documento no tiene la forma esperada lo relee y re-serializa entero.
+    Antes comprueba que cada ubicación aún tiene el valor original de su
+    entry. Devuelve cuántas entries aplicó.
+    """
+    if not os.path.exists(json_path):
+        raise FileNotFoundError(json_path)
+
+    entries = [entry for entry in entries if entry.location is not None]
+    originals = {
+        target: value
+        for entry in entries
+        for target, value in _vector_values([entry], entry.original).items()
+    }
+
+    # Las posiciones de los números se buscan ahora y no en la carga: el
+    # JSON exportado se conserva tras cargar, pero rebuild_asset lo borra
+    # tras cada Apply y lo vuelve a exportar si el paquete cambió después
+    try:
+        splice_numbers(json_path, _vector_values(entries), expected=originals)
+        return len(entries)
+    except SpliceError:
+        pass
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    for entry in entries:
+        ref = resolve_vector(data, entry.location)
+        if ref is not None and not _vector_equals(ref, entry.original):
+            raise StaleDocumentError(f"{json_path} no coincide con las entries cargadas")
+
+    applied = apply_entries_to_root(data, entries)
+
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+
+    return applied
@@ -0,0 +1,33 @@
+import mmap
+
+from core.json_reader import COLOR_MODULE_PREFIX
+
+# =====================================================
+# Prefiltro de paquetes antes de convertir
+#
+# json_reader solo extrae exports cuyo ObjectName empieza (distinguiendo
+# mayúsculas) por "ParticleModuleColor", y ese nombre está en la tabla de
+# nombres del .uasset. Los FName se guardan en ASCII o, si tienen algún
+# carácter no ASCII, en UTF-16LE. Para no descartar nunca un candidato
+# se busca en TODO el .uasset y en ambas codificaciones.
+# =====================================================
+_NEEDLES = (
+    COLOR_MODULE_PREFIX.encode("ascii"),
+    COLOR_MODULE_PREFIX.encode("utf-16-le"),
+)
+
+
+def may_contain_color_modules(uasset_path: str) -> bool:
+    """
+    False solo si es seguro que el paquete no tiene módulos de color.
+    Ante cualquier duda (archivo vacío, ilegible) devuelve True y que
+    decida el conversor.
+    """
+    try:
+        with open(uasset_path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return True
+
+    with buf:
+        return any(buf.find(needle) != -1 for needle in _NEEDLES)
@@ -0,0 +1,137 @@
+import time
+from collections import deque
+from typing import Callable, Hashable, Iterable, List, Optional, Set, Tuple
+
+# (inicio, fin) semiabierto sobre los ids compactos
+Runs = Tuple[Tuple[int, int], ...]
+
+
+def to_runs(ids: Iterable[int]) -> Runs:
+    """
+    Ids sueltos → tramos consecutivos (seleccionar todo es un solo tramo)
+    """
+    runs = []
+    for i in sorted(ids):
+        if runs and runs[-1][1] == i:
+            runs[-1][1] = i + 1
+        else:
+            runs.append([i, i + 1])
+    return tuple((start, stop) for start, stop in runs)
+
+
+def from_runs(runs: Runs):
+    for start, stop in runs:
+        yield from range(start, stop)
+
+
+class SelectionHistory:
+    """
+    Deshacer / rehacer de la selección guardando solo lo que cambió en
+    cada paso (añadidos / quitados, en tramos). Las entries se identifican
+    por una clave estable (ColorEntry.key) que sigue valiendo tras
+    recargar; cada clave se guarda una vez y los pasos usan un id
+    compacto.
+
+    Los cambios seguidos (arrastrar, Shift+clic repetido) se funden en un
+    solo paso y el historial tiene un máximo de pasos.
+    """
+
+    MAX_STEPS = 200
+    COALESCE_MS = 250
+
+    def __init__(
+        self,
+        max_steps: int = MAX_STEPS,
+        coalesce_ms: float = COALESCE_MS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._coalesce = coalesce_ms / 1000.0
+        self._clock = clock
+
+        self._ids = {}              # clave → id compacto
+        self._keys: List[Hashable] = []
+
+        self._undo = deque(maxlen=max_steps)
+        self._redo = deque(maxlen=max_steps)
+
+        # Último paso, aún abierto a fundirse con el siguiente cambio
+        self._open: Optional[Tuple[Set[int], Set[int]]] = None
+        self._last_change = 0.0
+
+    def _id(self, key) -> int:
+        i = self._ids.get(key)
+        if i is None:
+            i = self._ids[key] = len(self._keys)
+            self._keys.append(key)
+        return i
+
+    def _keys_of(self, runs: Runs) -> list:
+        keys = self._keys
+        return [keys[i] for i in from_runs(runs)]
+
+    def record(self, added_keys: Iterable[Hashable], removed_keys: Iterable[Hashable]):
+        added = {self._id(k) for k in added_keys}
+        removed = {self._id(k) for k in removed_keys}
+        if not added and not removed:
+            return
+
+        # Cualquier cambio nuevo invalida redo
+        self._redo.clear()
+
+        now = self._clock()
+        if self._open is not None and now - self._last_change <= self._coalesce:
+            # Componer los dos pasos: lo que se añadió y luego se quitó (o
+            # al revés) se anula
+            prev_added, prev_removed = self._open
+            self._open = (
+                (prev_added - removed) | (added - prev_removed),
+                (prev_removed - added) | (removed - prev_added),
+            )
+        else:
+            self._seal()
+            self._open = (added, removed)
+        self._last_change = now
+
+    def _seal(self):
+        if self._open is None:
+            return
+        added, removed = self._open
+        self._open = None
+        if added or removed:
+            self._undo.append((to_runs(added), to_runs(removed)))
+
+    def undo(self) -> Optional[Tuple[list, list]]:
+        """
+        (claves a seleccionar, claves a deseleccionar) para volver al
+        estado anterior, o None si no hay nada que deshacer
+        """
+        self._seal()
+        if not self._undo:
+            return None
+        step = self._undo.pop()
+        self._redo.append(step)
+        added, removed = step
+        return self._keys_of(removed), self._keys_of(added)
+
+    def redo(self) -> Optional[Tuple[list, list]]:
+        self._seal()
+        if not self._redo:
+            return None
+        step = self._redo.pop()
+        self._undo.append(step)
+        added, removed = step
+        return self._keys_of(added), self._keys_of(removed)
+
+    def clear(self):
+        """
+        Vacía el historial y la tabla de claves (otro proyecto: las claves
+        viejas ya no sirven y no deben quedarse en memoria)
+        """
+        self._undo.clear()
+        self._redo.clear()
+        self._open = None
+        self._ids = {}
+        self._keys = []
+
+    def __len__(self):
+        return len(self._undo) + (self._open is not None)
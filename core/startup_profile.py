@@ -0,0 +1,186 @@
+"""
+Perfil de arranque de la GUI.
+
+Se importa lo primero en main.py: a partir de ahí cada mark() anota un
+hito (ms desde ese instante). Con --profile-startup, main.py relanza la
+app con `-X importtime`, espera a que termine el arranque diferido y
+escribe un informe (hitos + importaciones más caras) en
+<appdata>/startup/, añadiendo una línea al histórico para seguir la
+evolución del tiempo hasta ventana interactiva.
+"""
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+_T0 = time.perf_counter()
+_EPOCH0 = time.time()
+
+_marks: List[Tuple[str, float]] = []
+
+MILESTONES_ARG = "--startup-milestones"
+
+# Hitos en el orden en que deberían ocurrir
+MILESTONE_ORDER = (
+    "imports_done",
+    "qapp_ready",
+    "window_built",
+    "first_paint",
+    "interactive",
+    "idle_done",
+)
+
+
+def mark(name: str):
+    _marks.append((name, (time.perf_counter() - _T0) * 1000.0))
+
+
+def milestones() -> Dict[str, float]:
+    """
+    {hito: ms}; si un hito se repite cuenta la primera vez
+    """
+    result: Dict[str, float] = {}
+    for name, ms in _marks:
+        result.setdefault(name, ms)
+    return result
+
+
+def milestones_path(argv: List[str]) -> Optional[str]:
+    if MILESTONES_ARG in argv:
+        index = argv.index(MILESTONES_ARG)
+        if index + 1 < len(argv):
+            return argv[index + 1]
+    return None
+
+
+def write_milestones(path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"epoch0": _EPOCH0, "marks": milestones()}, f)
+
+
+# =====================================================
+# 🔹 -X importtime
+# =====================================================
+def parse_importtime(text: str) -> List[Tuple[str, int, int, int]]:
+    """
+    [(módulo, propio µs, acumulado µs, profundidad)] de la salida de
+    `python -X importtime`
+    """
+    rows = []
+    for line in text.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            own, cumulative, name = line[len("import time:"):].split("|", 2)
+            # Un espacio tras la barra, luego dos por nivel de anidamiento
+            depth = (len(name) - len(name.lstrip(" ")) - 1) // 2 + 1
+            rows.append((name.strip(), int(own), int(cumulative), depth))
+        except ValueError:
+            continue
+    return rows
+
+
+# =====================================================
+# 🔹 Medición (proceso padre)
+# =====================================================
+def _run_once(main_script: str, workdir: str) -> Tuple[Dict[str, float], float, List]:
+    import subprocess
+
+    path = os.path.join(workdir, f"milestones_{os.getpid()}_{time.time_ns()}.json")
+    command = [sys.executable, "-X", "importtime", main_script, MILESTONES_ARG, path]
+
+    spawned = time.time()
+    proc = subprocess.run(command, capture_output=True, text=True, timeout=120)
+    if not os.path.exists(path):
+        raise RuntimeError(f"La app no escribió sus hitos:\n{proc.stderr[-2000:]}")
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    os.remove(path)
+
+    # Hasta la primera línea de Python (arranque del intérprete)
+    interpreter_ms = (data["epoch0"] - spawned) * 1000.0
+    return data["marks"], interpreter_ms, parse_importtime(proc.stderr)
+
+
+def profile_startup(main_script: str, folder: str, runs: int = 3) -> str:
+    """
+    Lanza la app `runs` veces, escribe el informe y el histórico.
+    Devuelve la ruta del informe.
+    """
+    # Solo en el proceso padre: no cuentan en el arranque medido
+    import statistics
+    from datetime import datetime
+
+    os.makedirs(folder, exist_ok=True)
+
+    samples = [_run_once(main_script, folder) for _ in range(max(1, runs))]
+
+    names = [n for n in MILESTONE_ORDER if all(n in m for m, _, _ in samples)]
+    medians = {n: statistics.median(m[n] for m, _, _ in samples) for n in names}
+    interpreter = statistics.median(i for _, i, _ in samples)
+
+    interactive = max(medians.get("first_paint", 0.0), medians.get("interactive", 0.0))
+    tti = interpreter + interactive
+
+    # Importaciones: la última ejecución (caché de disco caliente)
+    imports = samples[-1][2]
+    top_level = sorted((r for r in imports if r[3] == 1), key=lambda r: -r[2])
+    by_self = sorted(imports, key=lambda r: -r[1])
+
+    history_path = os.path.join(folder, "history.jsonl")
+    previous = None
+    if os.path.exists(history_path):
+        with open(history_path, "r", encoding="utf-8") as f:
+            lines = [line for line in f if line.strip()]
+        if lines:
+            previous = json.loads(lines[-1])
+
+    stamp = datetime.now()
+    record = {
+        "date": stamp.isoformat(timespec="seconds"),
+        "runs": len(samples),
+        "python": sys.version.split()[0],
+        "interpreter_ms": round(interpreter, 1),
+        "tti_ms": round(tti, 1),
+        "milestones": {n: round(v, 1) for n, v in medians.items()},
+        "imports_ms": round(sum(r[2] for r in top_level) / 1000.0, 1),
+    }
+
+    lines = [
+        f"ChromaFlux · perfil de arranque · {record['date']}",
+        f"Python {record['python']}, mediana de {len(samples)} ejecución(es)",
+        "",
+        "Hitos (ms desde el lanzamiento del proceso)",
+        f"  {'interpreter':<14}{interpreter:9.1f}",
+    ]
+    for name in names:
+        lines.append(f"  {name:<14}{interpreter + medians[name]:9.1f}")
+    lines.append("")
+    lines.append(f"Tiempo hasta ventana interactiva: {tti:.1f} ms")
+    if previous is not None:
+        delta = tti - previous["tti_ms"]
+        lines.append(f"  anterior ({previous['date']}): {previous['tti_ms']:.1f} ms ({delta:+.1f} ms)")
+
+    lines.append("")
+    lines.append(
+        f"Importaciones de primer nivel, incluidas las diferidas "
+        f"({record['imports_ms']:.1f} ms en total)"
+    )
+    for name, _, cumulative, _ in top_level[:20]:
+        lines.append(f"  {cumulative / 1000.0:8.1f} ms  {name}")
+
+    lines.append("")
+    lines.append("Módulos más caros por sí mismos")
+    for name, own, _, _ in by_self[:15]:
+        lines.append(f"  {own / 1000.0:8.1f} ms  {name}")
+
+    report_path = os.path.join(folder, f"startup_{stamp:%Y%m%d_%H%M%S}.txt")
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+    with open(history_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+    return report_path
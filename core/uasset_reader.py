@@ -0,0 +1,399 @@
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from core.data_models import ColorEntry
+from core.json_reader import COLOR_MODULE_PREFIX
+
+# =====================================================
+# Lector nativo (solo lectura) de paquetes .uasset + .uexp
+#
+# Entiende lo justo para sacar los vectores de ColorOverLife/StartColor:
+# resumen del paquete, tabla de nombres, tabla de exports y propiedades
+# etiquetadas. Produce las mismas ColorEntry (valores y ubicaciones) que
+# json_reader sobre la exportación de UEJSON. Cualquier cosa que no
+# reconozca lanza UnsupportedPackage y la pipeline usa UEJSON.
+# =====================================================
+PACKAGE_TAG = 0x9E2A83C1
+
+# Versiones de objeto UE4 que cambian el formato
+_UE4_STRUCT_GUID_IN_PROPERTY_TAG = 441
+_UE4_SERIALIZE_TEXT_IN_PACKAGES = 459
+_UE4_COOKED_ASSETS_IN_EDITOR_SUPPORT = 485
+_UE4_ARRAY_PROPERTY_INNER_TAGS = 500
+_UE4_PROPERTY_GUID_IN_PROPERTY_TAG = 503
+_UE4_NAME_HASHES_SERIALIZED = 504
+_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS = 507
+_UE4_TEMPLATE_INDEX_IN_COOKED_EXPORTS = 508
+_UE4_PROPERTY_TAG_SET_MAP_SUPPORT = 509
+_UE4_64BIT_EXPORTMAP_SERIALSIZES = 511
+_UE4_ADDED_PACKAGE_SUMMARY_LOCALIZATION_ID = 516
+_UE4_LOAD_FOR_EDITOR_GAME = 365
+_UE4_MIN_SUPPORTED = 459
+
+# Versiones UE5
+_UE5_OPTIONAL_RESOURCES = 1003
+_UE5_REMOVE_OBJECT_EXPORT_PACKAGE_GUID = 1005
+_UE5_TRACK_OBJECT_EXPORT_IS_INHERITED = 1006
+_UE5_ADD_SOFTOBJECTPATH_LIST = 1008
+_UE5_PROPERTY_TAG_EXTENSION = 1011       # a partir de aquí: no soportado
+
+_PKG_FILTER_EDITOR_ONLY = 0x80000000
+
+_I32 = struct.Struct("<i")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_FNAME = struct.Struct("<ii")
+_VEC_F = struct.Struct("<3f")
+_VEC_D = struct.Struct("<3d")
+
+# Propiedad de color por prefijo de ObjectName (igual que json_reader)
+_COLOR_PROPERTIES = (
+    ("ParticleModuleColorOverLife", "ColorOverLife"),
+    (COLOR_MODULE_PREFIX, "StartColor"),
+)
+
+
+class UnsupportedPackage(ValueError):
+    """
+    Formato o versión que el lector no sabe interpretar con seguridad
+    """
+
+
+def shortest_float32(value: float) -> float:
+    """
+    Representación decimal más corta que reproduce el mismo float32
+    (lo que escribe UAssetAPI al exportar)
+    """
+    packed = struct.pack("<f", value)
+    for digits in range(1, 10):
+        candidate = float(f"{value:.{digits}g}")
+        if struct.pack("<f", candidate) == packed:
+            return candidate
+    return struct.unpack("<f", packed)[0]
+
+
+class _Package:
+    """
+    Resumen + tabla de nombres + tabla de exports de un .uasset
+    """
+
+    def __init__(self, buf):
+        self.buf = buf
+        pos = 0
+
+        tag, legacy = struct.unpack_from("<Ii", buf, pos)
+        pos += 8
+        if tag != PACKAGE_TAG:
+            raise UnsupportedPackage("No es un paquete de Unreal")
+        if not -8 <= legacy <= -3:
+            raise UnsupportedPackage(f"LegacyFileVersion {legacy}")
+
+        if legacy != -4:
+            pos += 4  # LegacyUE3Version
+        self.ue4, = _I32.unpack_from(buf, pos)
+        pos += 4
+        self.ue5 = 0
+        if legacy <= -8:
+            self.ue5, = _I32.unpack_from(buf, pos)
+            pos += 4
+        pos += 4  # licensee
+
+        if self.ue4 < _UE4_MIN_SUPPORTED:
+            raise UnsupportedPackage(f"Versión UE4 {self.ue4} (¿sin versionar?)")
+        if self.ue5 >= _UE5_PROPERTY_TAG_EXTENSION:
+            raise UnsupportedPackage(f"Versión UE5 {self.ue5}")
+
+        # Versiones personalizadas
+        count, = _I32.unpack_from(buf, pos)
+        pos += 4
+        for _ in range(self._count(count, 20)):
+            pos += 20
+            if legacy > -6:
+                _, pos = self._fstring(pos)  # nombre descriptivo
+
+        self.total_header_size, = _I32.unpack_from(buf, pos)
+        pos += 4
+        _, pos = self._fstring(pos)  # FolderName
+        flags, = _U32.unpack_from(buf, pos)
+        pos += 4
+        self.filter_editor_only = bool(flags & _PKG_FILTER_EDITOR_ONLY)
+
+        name_count, name_offset = struct.unpack_from("<ii", buf, pos)
+        pos += 8
+        if self.ue5 >= _UE5_ADD_SOFTOBJECTPATH_LIST:
+            pos += 8
+        if self.ue4 >= _UE4_ADDED_PACKAGE_SUMMARY_LOCALIZATION_ID and not self.filter_editor_only:
+            _, pos = self._fstring(pos)
+        if self.ue4 >= _UE4_SERIALIZE_TEXT_IN_PACKAGES:
+            pos += 8
+        export_count, export_offset = struct.unpack_from("<ii", buf, pos)
+
+        self.names = self._read_names(name_count, name_offset)
+        self.exports = self._read_exports(export_count, export_offset)
+
+    # -------------------------------------------------
+    def _count(self, count: int, item_size: int) -> int:
+        if count < 0 or count * item_size > len(self.buf):
+            raise UnsupportedPackage("Tabla con tamaño imposible")
+        return count
+
+    def _fstring(self, pos: int) -> Tuple[str, int]:
+        length, = _I32.unpack_from(self.buf, pos)
+        pos += 4
+        if length == 0:
+            return "", pos
+        if length > 0:
+            end = pos + length
+            if end > len(self.buf):
+                raise UnsupportedPackage("Cadena fuera del archivo")
+            return self.buf[pos:end - 1].decode("latin-1"), end
+        end = pos - 2 * length
+        if end > len(self.buf):
+            raise UnsupportedPackage("Cadena fuera del archivo")
+        return self.buf[pos:end - 2].decode("utf-16-le"), end
+
+    def _read_names(self, count: int, pos: int) -> List[str]:
+        names = []
+        hashes = 4 if self.ue4 >= _UE4_NAME_HASHES_SERIALIZED else 0
+        for _ in range(self._count(count, 5)):
+            text, pos = self._fstring(pos)
+            names.append(text)
+            pos += hashes
+        return names
+
+    def _export_layout(self) -> Tuple[struct.Struct, int]:
+        """
+        Struct para los campos que interesan de FObjectExport y los bytes
+        que quedan hasta el siguiente
+        """
+        fmt = "<i"                                   # ClassIndex
+        fmt += "i"                                   # SuperIndex
+        if self.ue4 >= _UE4_TEMPLATE_INDEX_IN_COOKED_EXPORTS:
+            fmt += "i"                               # TemplateIndex
+        fmt += "i"                                   # OuterIndex
+        fmt += "ii"                                  # ObjectName
+        fmt += "I"                                   # ObjectFlags
+        fmt += "qq" if self.ue4 >= _UE4_64BIT_EXPORTMAP_SERIALSIZES else "ii"
+
+        rest = 3 * 4                                 # bForcedExport, NotForClient/Server
+        if self.ue5 < _UE5_REMOVE_OBJECT_EXPORT_PACKAGE_GUID:
+            rest += 16
+        if self.ue5 >= _UE5_TRACK_OBJECT_EXPORT_IS_INHERITED:
+            rest += 4
+        rest += 4                                    # PackageFlags
+        if self.ue4 >= _UE4_LOAD_FOR_EDITOR_GAME:
+            rest += 4
+        if self.ue4 >= _UE4_COOKED_ASSETS_IN_EDITOR_SUPPORT:
+            rest += 4
+        if self.ue5 >= _UE5_OPTIONAL_RESOURCES:
+            rest += 4
+        if self.ue4 >= _UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS:
+            rest += 5 * 4
+
+        return struct.Struct(fmt), rest
+
+    def _read_exports(self, count: int, pos: int) -> List[Tuple[str, int, int]]:
+        """
+        [(ObjectName, SerialSize, SerialOffset)]
+        """
+        head, rest = self._export_layout()
+        exports = []
+        for _ in range(self._count(count, head.size + rest)):
+            fields = head.unpack_from(self.buf, pos)
+            pos += head.size + rest
+            name_index, number, _, size, offset = fields[-5:]
+            exports.append((self.name(name_index, number), size, offset))
+        return exports
+
+    def name(self, index: int, number: int = 0) -> str:
+        if not 0 <= index < len(self.names):
+            raise UnsupportedPackage(f"Índice de nombre {index} fuera de rango")
+        base = self.names[index]
+        # Igual que FName.ToString en UAssetAPI
+        return f"{base}_{number - 1}" if number > 0 else base
+
+
+class _PropertyReader:
+    """
+    Recorre listas de propiedades etiquetadas sin crear objetos por
+    propiedad: solo se decodifican los vectores de color.
+    """
+
+    def __init__(self, package: _Package, data, end: int):
+        self.package = package
+        self.data = data
+        self.end = end
+
+    def _fname(self, pos: int) -> Tuple[str, int]:
+        index, number = _FNAME.unpack_from(self.data, pos)
+        return self.package.name(index, number), pos + 8
+
+    def tags(self, pos: int, end: int):
+        """
+        (índice, nombre, tipo, nombre del struct, inicio del valor, tamaño)
+        de cada propiedad hasta "None"
+        """
+        ue4 = self.package.ue4
+        index = 0
+
+        while True:
+            if pos + 8 > end:
+                raise UnsupportedPackage("Lista de propiedades sin terminar")
+
+            name, pos = self._fname(pos)
+            if name == "None":
+                return
+
+            prop_type, pos = self._fname(pos)
+            size, _ = struct.unpack_from("<ii", self.data, pos)
+            pos += 8
+
+            struct_name = None
+            if prop_type == "StructProperty":
+                struct_name, pos = self._fname(pos)
+                if ue4 >= _UE4_STRUCT_GUID_IN_PROPERTY_TAG:
+                    pos += 16
+            elif prop_type == "BoolProperty":
+                pos += 1
+            elif prop_type in ("ByteProperty", "EnumProperty"):
+                pos += 8
+            elif prop_type == "ArrayProperty":
+                if ue4 >= _UE4_ARRAY_PROPERTY_INNER_TAGS:
+                    pos += 8
+            elif prop_type == "SetProperty":
+                if ue4 >= _UE4_PROPERTY_TAG_SET_MAP_SUPPORT:
+                    pos += 8
+            elif prop_type == "MapProperty":
+                if ue4 >= _UE4_PROPERTY_TAG_SET_MAP_SUPPORT:
+                    pos += 16
+
+            if ue4 >= _UE4_PROPERTY_GUID_IN_PROPERTY_TAG:
+                has_guid = self.data[pos]
+                pos += 1
+                if has_guid:
+                    pos += 16
+
+            if size < 0 or pos + size > end:
+                raise UnsupportedPackage(f"Propiedad {name} fuera del export")
+
+            yield index, name, prop_type, struct_name, pos, size
+            index += 1
+            pos += size
+
+    def vector(self, pos: int, size: int) -> Tuple[float, float, float]:
+        if size == _VEC_F.size:
+            return tuple(shortest_float32(v) for v in _VEC_F.unpack_from(self.data, pos))
+        if size == _VEC_D.size:
+            return _VEC_D.unpack_from(self.data, pos)
+        raise UnsupportedPackage(f"Vector de {size} bytes")
+
+
+def _open(path: str):
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise UnsupportedPackage("Archivo vacío")
+
+
+def read_color_entries(
+    uasset_path: str,
+    json_path: Optional[str] = None,
+) -> Tuple[List[ColorEntry], List[ColorEntry]]:
+    """
+    Equivalente a exportar con UEJSON + load_color_over_life_from_json,
+    sin conversor. asset de las entries = json_path (como en la pipeline).
+    """
+    json_path = json_path or os.path.splitext(uasset_path)[0] + ".json"
+    uexp_path = os.path.splitext(uasset_path)[0] + ".uexp"
+
+    min_entries: List[ColorEntry] = []
+    max_entries: List[ColorEntry] = []
+
+    header = _open(uasset_path)
+    try:
+        try:
+            package = _Package(header)
+        except struct.error:
+            raise UnsupportedPackage("Cabecera truncada")
+
+        body = _open(uexp_path) if os.path.exists(uexp_path) else None
+        try:
+            for export_index, (name, size, offset) in enumerate(package.exports):
+                prop = _color_property(name)
+                if prop is None:
+                    continue
+
+                # Con .uexp, los datos de export empiezan tras la cabecera
+                data = header
+                if body is not None and offset >= package.total_header_size:
+                    data = body
+                    offset -= package.total_header_size
+                if offset < 0 or offset + size > len(data):
+                    raise UnsupportedPackage(f"Export {name} fuera del archivo")
+
+                try:
+                    _read_color_export(
+                        package, data, offset, offset + size, json_path,
+                        export_index, name, prop, min_entries, max_entries,
+                    )
+                except struct.error:
+                    raise UnsupportedPackage(f"Export {name} truncado")
+        finally:
+            if body is not None:
+                body.close()
+    finally:
+        header.close()
+
+    return min_entries, max_entries
+
+
+def _color_property(object_name: str) -> Optional[str]:
+    for prefix, prop in _COLOR_PROPERTIES:
+        if object_name.startswith(prefix):
+            return prop
+    return None
+
+
+def _read_color_export(
+    package, data, start, end, json_path,
+    export_index, name, prop, min_entries, max_entries,
+):
+    reader = _PropertyReader(package, data, end)
+    found: Dict[str, Tuple[Tuple[float, float, float], Tuple[int, int, int]]] = {}
+
+    for prop_index, prop_name, prop_type, struct_name, pos, size in reader.tags(start, end):
+        if prop_name != prop:
+            continue
+        if prop_type != "StructProperty":
+            raise UnsupportedPackage(f"{prop} no es un struct")
+
+        # Como json_reader: solo cuenta la última aparición de cada vector
+        found.clear()
+        for value_index, vec_name, vec_type, vec_struct, vpos, vsize in reader.tags(pos, pos + size):
+            if vec_name in ("MinValueVec", "MaxValueVec"):
+                if vec_type != "StructProperty" or vec_struct != "Vector":
+                    raise UnsupportedPackage(f"{vec_name} con tipo {vec_type}/{vec_struct}")
+                found[vec_name] = (
+                    reader.vector(vpos, vsize),
+                    (export_index, prop_index, value_index),
+                )
+
+        for vec_name, mode, target in (
+            ("MinValueVec", "MIN", min_entries),
+            ("MaxValueVec", "MAX", max_entries),
+        ):
+            if vec_name in found:
+                (r, g, b), location = found[vec_name]
+                target.append(
+                    ColorEntry(
+                        asset=json_path,
+                        module=name,
+                        mode=mode,
+                        r=r, g=g, b=b,
+                        raw_ref=None,
+                        location=location,
+                    )
+                )
@@ -0,0 +1,174 @@
+"""
+Sustituto en Python de UEJSON para pruebas y benchmarks sin .NET.
+
+No entiende .uasset reales: trabaja con paquetes sintéticos divididos
+como los de UE. El .uasset es MAGIC + el documento JSON sin los valores
+de los FVector, y el .uexp guarda esos valores en binario (float32,
+uno tras otro). Habla el mismo CLI que UEJSON
+(-e / -i <ruta>) y además el protocolo de sesión --batch, así que sirve
+para ejercitar todos los backends de core.converter_backends en Linux:
+
+    python -m core.uejson_standin -e asset.uasset
+    python -m core.uejson_standin --batch
+"""
+import json
+import os
+import struct
+import sys
+
+from core.uasset_reader import shortest_float32
+
+MAGIC = b"CFSTANDIN\n"
+VERSION = "standin-2"
+
+_AXES = ("X", "Y", "Z")
+_VECTOR = struct.Struct("<4s3f")
+_VECTOR_TAG = b"VEC\0"
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _iter_vectors(node, stripped=False):
+    """
+    Dicts FVector (X/Y/Z numéricos, o nulos si ya se separaron) en orden
+    de documento
+    """
+    if isinstance(node, dict):
+        values = [node.get(axis, 0) for axis in _AXES]
+        if all(axis in node for axis in _AXES) and all(
+            v is None if stripped else _is_number(v) for v in values
+        ):
+            yield node
+            return
+        for value in node.values():
+            yield from _iter_vectors(value, stripped)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iter_vectors(value, stripped)
+
+
+def write_package(uasset_path: str, root) -> None:
+    """
+    Crea un paquete sintético (.uasset + .uexp) a partir de un documento JSON
+    """
+    vectors = list(_iter_vectors(root))
+    values = [tuple(vec[axis] for axis in _AXES) for vec in vectors]
+
+    with open(os.path.splitext(uasset_path)[0] + ".uexp", "wb") as f:
+        for xyz in values:
+            f.write(_VECTOR.pack(_VECTOR_TAG, *xyz))
+
+    # El esqueleto se guarda con los valores en nulo
+    for vec in vectors:
+        for axis in _AXES:
+            vec[axis] = None
+    try:
+        with open(uasset_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(json.dumps(root, ensure_ascii=False).encode("utf-8"))
+    finally:
+        for vec, xyz in zip(vectors, values):
+            for axis, value in zip(_AXES, xyz):
+                vec[axis] = value
+
+
+def export_package(uasset_path: str) -> str:
+    if not os.path.exists(uasset_path):
+        raise FileNotFoundError(uasset_path)
+
+    with open(uasset_path, "rb") as f:
+        data = f.read()
+
+    if not data.startswith(MAGIC):
+        raise ValueError(f"No es un paquete sintético: {uasset_path}")
+
+    root = json.loads(data[len(MAGIC):])
+
+    uexp_path = os.path.splitext(uasset_path)[0] + ".uexp"
+    with open(uexp_path, "rb") as f:
+        records = _VECTOR.iter_unpack(f.read())
+
+    for vec, (tag, *xyz) in zip(_iter_vectors(root, stripped=True), records):
+        if tag != _VECTOR_TAG:
+            raise ValueError(f".uexp corrupto: {uexp_path}")
+        for axis, value in zip(_AXES, xyz):
+            vec[axis] = shortest_float32(value)
+
+    json_path = os.path.splitext(uasset_path)[0] + ".json"
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(root, f, ensure_ascii=False, indent=2)
+
+    return json_path
+
+
+def import_package(json_path: str) -> str:
+    if not os.path.exists(json_path):
+        raise FileNotFoundError(json_path)
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        root = json.load(f)
+
+    uasset_path = os.path.splitext(json_path)[0] + ".uasset"
+    write_package(uasset_path, root)
+    return uasset_path
+
+
+def serve_batch(stdin, stdout) -> None:
+    """
+    Protocolo de sesión (una línea por petición, separada por tabuladores):
+
+        → e<TAB>ruta            ← ok<TAB>ruta_json   | err<TAB>mensaje
+        → i<TAB>ruta            ← ok<TAB>ruta_uasset | err<TAB>mensaje
+
+    Al arrancar se anuncia con "ready<TAB>versión".
+    """
+    stdout.write(f"ready\t{VERSION}\n")
+    stdout.flush()
+
+    for line in stdin:
+        line = line.rstrip("\r\n")
+        if not line:
+            continue
+
+        op, _, path = line.partition("\t")
+        try:
+            if op == "e":
+                out = export_package(path)
+            elif op == "i":
+                out = import_package(path)
+            else:
+                raise ValueError(f"Unknown option: {op}")
+            stdout.write(f"ok\t{out}\n")
+        except Exception as e:
+            message = str(e).replace("\n", " ").replace("\t", " ")
+            stdout.write(f"err\t{message}\n")
+        stdout.flush()
+
+
+def main(argv=None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+
+    if args == ["--batch"]:
+        serve_batch(sys.stdin, sys.stdout)
+        return 0
+
+    if len(args) != 2 or args[0] not in ("-e", "-i"):
+        print("Usage: uejson_standin -e|-i <file path> | --batch")
+        return 1
+
+    try:
+        if args[0] == "-e":
+            print(f"Exported asset to: {export_package(args[1])}")
+        else:
+            import_package(args[1])
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
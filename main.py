@@ -1,35 +1,31 @@
 import sys
 import os
-import json
+import time
 from datetime import datetime
-from PySide6.QtWidgets import QMenu
+
+# Primero: fija el instante cero del perfil de arranque
+from core import startup_profile
+
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QFileDialog,QLabel,
+    QApplication, QMainWindow, QLabel, QMenu, QFileDialog,
+    QAbstractItemView, QHeaderView, QSizePolicy,
 )
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import (
-    QFile, Qt, Signal, QTimer)
-
-from PySide6.QtGui import QColor
-from core.asset_pipeline import AssetPipeline
-from core.json_reader import load_color_over_life_from_root
-from widgets.colorpicker import ColorPickerDialog
+from PySide6.QtCore import QEvent, QSize, Qt, QTimer, QUrl, Signal
+from PySide6.QtGui import QDesktopServices, QIcon, QKeySequence, QShortcut
+
+from core.data_models import DirtyTracker, SiblingIndex
 from core.i18n_manager import I18N
-from core.settings_manager import SettingsManager
-from widgets.language_dialog import LanguageDialog
-from PySide6.QtGui import QColor, QIcon
-from PySide6.QtCore import QSize
-from widgets.color_over_life_tree import ColorOverLifeTreeWidget
-from PySide6.QtCore import QItemSelectionModel
-from PySide6.QtWidgets import QAbstractItemView
-from PySide6.QtWidgets import QHeaderView
-from PySide6.QtCore import Signal
 from core.resource_path import resource_path
-from PySide6.QtWidgets import QSizePolicy
-from PySide6.QtGui import QFont
-from PySide6.QtGui import QShortcut, QKeySequence
-from PySide6.QtGui import QDesktopServices
-from PySide6.QtCore import QUrl
+from core.selection_history import SelectionHistory
+from core.settings_manager import SettingsManager
+from widgets.color_over_life_tree import ColorOverLifeTreeView
+from widgets.ui_forms import setup_form
+from widgets.workers import AssetApplyWorker, AssetLoadWorker, start_worker
+
+# La pipeline (y sus cachés), el color picker y el diálogo de idioma se
+# importan al usarse por primera vez: no hacen falta para pintar la ventana.
+
+startup_profile.mark("imports_done")
 
 
 
@@ -122,30 +118,35 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # i18n temporal para que nada crashee antes del late init
-        self.i18n = I18N("es")
-
-        # 1) Cargar UI lo más rápido posible
-        loader = QUiLoader()
-        ui_path = os.path.join(os.path.dirname(__file__), "ui", "main_window.ui")
-        ui_file = QFile(ui_path)
-        ui_file.open(QFile.ReadOnly)
-        self.ui = loader.load(ui_file, self)
-        ui_file.close()
+        # Settings + idioma guardado: el catálogo se carga una sola vez
+        self.settings = SettingsManager()
+        self.i18n = I18N(self.settings.get("language") or "es")
 
-        self.setCentralWidget(self.ui.centralwidget)
+        # 1) Cargar UI lo más rápido posible (módulo compilado)
+        self.ui = setup_form(self, "ui/main_window.ui")
 
         # 2) Estado mínimo
         self.min_entries = []
         self.max_entries = []
         self.selected_color = None
-        self.json_roots = {}
+        self.dirty_tracker = DirtyTracker()
+        self.sibling_index = SiblingIndex()
+        self._asset_entries = {}
+        self._worker = None
+        self._worker_thread = None
+        self.pipeline = None
+        self._color_picker = None
+        self._close_pending = False
+        self._apply_snapshots = {}
+        self._loaded_paths = frozenset()
+        self._idle_tasks = []
 
         # 3) Conectar botones (sin depender del idioma aún)
         self.ui.btnSelectFolder.clicked.connect(self.load_folder)
         self.ui.btnSelectFiles.clicked.connect(self.load_files)
         self.ui.btnPickColor.clicked.connect(self.pick_color)
         self.ui.btnApply.clicked.connect(self.apply_changes)
+        self.ui.btnCancelLoad.clicked.connect(self.cancel_operation)
         self.ui.chkMin.stateChanged.connect(self.select_min_rows)
         self.ui.chkMax.stateChanged.connect(self.select_max_rows)
 
@@ -155,30 +156,35 @@ class MainWindow(QMainWindow):
         self.ui.txtLog.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
 
         self.ui.progressBar.setVisible(False)
+        self.ui.btnCancelLoad.setVisible(False)
 
         # 5) Cargar lo pesado después de que la ventana ya esté viva
         QTimer.singleShot(0, self._late_init)
+        startup_profile.mark("window_built")
+
+    def event(self, event):
+        # Primer pintado de la ventana (hito del perfil de arranque);
+        # llegan eventos antes de que termine __init__
+        if event.type() == QEvent.Paint and not getattr(self, "_first_paint", False):
+            self._first_paint = True
+            startup_profile.mark("first_paint")
+        return super().event(event)
 
     def _late_init(self):
-        # Settings + idioma
-        self.settings = SettingsManager()
-        lang = self.settings.get("language")
-
-        if not lang:
-            tmp_i18n = I18N("es")
-            dlg = LanguageDialog(tmp_i18n, self)
-            if dlg.exec():
-                lang = dlg.selected_language
-                self.settings.set("language", lang)
-            else:
-                lang = "es"
-                self.settings.set("language", lang)
+        # Idioma: solo se pregunta la primera vez
+        if not self.settings.get("language"):
+            from widgets.language_dialog import LanguageDialog
 
-        self.i18n = I18N(lang)
+            dlg = LanguageDialog(self.i18n, self)
+            lang = dlg.selected_language if dlg.exec() else "es"
+            self.settings.set("language", lang)
+            if lang != self.i18n.lang:
+                self.i18n.load(lang)
 
         # Tree
-        self.tree = ColorOverLifeTreeWidget(self)
+        self.tree = ColorOverLifeTreeView(self)
         self.tree.colorChanged.connect(self.on_tree_color_changed)
+        self.tree.colorEditRequested.connect(self.edit_entry_color)
         self.ui.chkSelectAll.stateChanged.connect(self.select_all_rows)
         self.tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.tree.setSelectionBehavior(QAbstractItemView.SelectItems)
@@ -187,11 +193,10 @@ class MainWindow(QMainWindow):
         parent_layout = self.ui.tabWidget.parentWidget().layout()
         parent_layout.replaceWidget(self.ui.tabWidget, self.tree)
         self.ui.tabWidget.deleteLater()
-        self.selection_undo_stack = []
-        self.selection_redo_stack = []
+        self.selection_history = SelectionHistory()
         QShortcut(QKeySequence.Undo, self, activated=self.undo_selection)
         QShortcut(QKeySequence.Redo, self, activated=self.redo_selection)
-        self.tree.itemSelectionChanged.connect(self._on_selection_changed)
+        self.tree.selectionDelta.connect(self._on_selection_delta)
 
         # Iconos
         icon_path = resource_path("assets/icons/neon-settings.ico")
@@ -203,14 +208,8 @@ class MainWindow(QMainWindow):
         )
         self.ui.btnSupport.setIconSize(QSize(18, 18))
 
-        # Pipeline (esto puede tardar la primera vez)
-        self.pipeline = AssetPipeline()
-
         # UI text
         self.apply_language()
-        self._setup_settings_menu()
-        self._setup_support_menu()
-
 
         self.log(self.i18n.t("log_app_started"))
         # =====================================================
@@ -219,6 +218,53 @@ class MainWindow(QMainWindow):
         if hasattr(self.ui, "progressStack"):
             self.ui.progressStack.setCurrentIndex(0)
 
+        startup_profile.mark("interactive")
+
+        # =====================================================
+        # Lo demás, en ratos libres del event loop (un paso por vuelta
+        # para no bloquear la entrada). Si el usuario lo necesita antes,
+        # se construye en ese momento.
+        # =====================================================
+        self._idle_tasks = [
+            self._ensure_pipeline,
+            self._setup_settings_menu,
+            self._setup_support_menu,
+            self._ensure_color_picker,
+        ]
+        QTimer.singleShot(0, self._run_idle_task)
+
+    def _run_idle_task(self):
+        if self._idle_tasks:
+            self._idle_tasks.pop(0)()
+            QTimer.singleShot(0, self._run_idle_task)
+        else:
+            startup_profile.mark("idle_done")
+
+    def _ensure_pipeline(self):
+        """
+        Crea la pipeline y sus cachés la primera vez que hacen falta
+        """
+        if self.pipeline is not None:
+            return self.pipeline
+
+        from core.asset_pipeline import AssetPipeline
+        from core.binary_patch import LayoutCache
+        from core.entry_cache import EntryCache
+
+        self.entry_cache = EntryCache(
+            max_bytes=int(self.settings.get("cache_max_mb", 256)) * 1024 * 1024
+        )
+        self.layout_cache = LayoutCache()
+        self.pipeline = AssetPipeline(
+            max_workers=self.settings.get("converter_workers"),
+            backend=self.settings.get("converter_backend", "auto"),
+            cache=self.entry_cache if self.settings.get("entry_cache", True) else None,
+            layouts=self.layout_cache if self.settings.get("binary_patch", True) else None,
+            # Desactivado hasta validarlo con assets reales
+            native_reader=self.settings.get("native_reader", False),
+        )
+        return self.pipeline
+
 
 
 
@@ -274,6 +320,7 @@ class MainWindow(QMainWindow):
 
         self.ui.btnPickColor.setText(t("choose_color"))
         self.ui.btnApply.setText(t("apply_changes"))
+        self.ui.btnCancelLoad.setText(t("cancel_loading"))
 
         self.ui.chkSelectAll.setText(t("select_all"))
         self.ui.chkSyncMinMax.setText(t("sync_min_max"))
@@ -303,6 +350,9 @@ class MainWindow(QMainWindow):
         self.ui.txtFilter.setPlaceholderText(t("search_placeholder"))
         self.ui.progressBar.setFormat(t("loading_progress"))
 
+        if self._color_picker is not None:
+            self._color_picker.apply_language()
+
     def _open_dropzone_dialog(self):
         menu = QMenu(self)
 
@@ -316,70 +366,31 @@ class MainWindow(QMainWindow):
         elif action == act_folder:
             self.load_folder()
 
-    def _on_selection_changed(self):
-        selected = {
-            id(it.entry)
-            for it in self.tree.selectedItems()
-            if hasattr(it, "entry")
-        }
-
-        # 🚫 Evitar duplicados consecutivos (INCLUSO vacío)
-        if self.selection_undo_stack and self.selection_undo_stack[-1] == selected:
-            return
-
-        self.selection_undo_stack.append(selected)
-
-        # 🔄 Cualquier nueva acción invalida redo
-        self.selection_redo_stack.clear()
-
-
+    def _on_selection_delta(self, added, removed):
+        # Solo lo que cambió; las claves sobreviven a recargar
+        self.selection_history.record(
+            [e.key for e in added], [e.key for e in removed]
+        )
 
-    def _restore_selection(self, state):
+    def _restore_selection(self, select_keys, deselect_keys):
+        # Sin registrar: es el propio historial moviéndose
         self.tree.blockSignals(True)
-        self.tree.clearSelection()
-
-        def walk(parent_item):
-            for i in range(parent_item.childCount()):
-                child = parent_item.child(i)
-                if hasattr(child, "entry") and id(child.entry) in state:
-                    child.setSelected(True)
-                walk(child)
-
-        for i in range(self.tree.topLevelItemCount()):
-            walk(self.tree.topLevelItem(i))
-
+        self.tree.change_selection(select_keys, deselect_keys)
         self.tree.blockSignals(False)
-        self.tree._refresh_color_selection_highlight()
-        self.tree.viewport().update()
 
     def undo_selection(self):
-        if len(self.selection_undo_stack) < 2:
-            return
-
-        # Estado actual → redo
-        current = self.selection_undo_stack.pop()
-        self.selection_redo_stack.append(current)
-
-        # Estado anterior → restaurar
-        prev = self.selection_undo_stack[-1]
-        self._restore_selection(prev)
-
-
+        step = self.selection_history.undo()
+        if step is not None:
+            self._restore_selection(*step)
 
     def redo_selection(self):
-        if not self.selection_redo_stack:
-            return
-
-        state = self.selection_redo_stack.pop()
-
-        # El estado actual vuelve a undo
-        self.selection_undo_stack.append(state)
-
-        self._restore_selection(state)
+        step = self.selection_history.redo()
+        if step is not None:
+            self._restore_selection(*step)
 
 
     def _setup_settings_menu(self):
-        if not hasattr(self.ui, "btnSettings"):
+        if not hasattr(self.ui, "btnSettings") or self.ui.btnSettings.menu():
             return
 
         menu = QMenu(self)
@@ -392,10 +403,14 @@ class MainWindow(QMainWindow):
         act_es.triggered.connect(lambda: self.change_language("es"))
         act_en.triggered.connect(lambda: self.change_language("en"))
 
+        menu.addSeparator()
+        act_purge = menu.addAction(self.i18n.t("purge_cache"))
+        act_purge.triggered.connect(self.purge_cache)
+
         self.ui.btnSettings.setMenu(menu)
 
     def _setup_support_menu(self):
-        if not hasattr(self.ui, "btnSupport"):
+        if not hasattr(self.ui, "btnSupport") or self.ui.btnSupport.menu():
             return
 
         menu = QMenu(self)
@@ -418,6 +433,11 @@ class MainWindow(QMainWindow):
         self.ui.btnSupport.setMenu(menu)
 
 
+    def purge_cache(self):
+        self._ensure_pipeline()
+        removed = self.entry_cache.purge() + self.layout_cache.purge()
+        self.log(self.i18n.t("log_cache_purged", count=removed), level="OK")
+
     def change_language(self, lang):
         self.i18n.load(lang)
         self.settings.set("language", lang)
@@ -541,10 +561,8 @@ class MainWindow(QMainWindow):
         self.load_assets(uassets)
 
     def load_assets(self, uassets):
-        if not hasattr(self, "pipeline"):
-            self.log("Inicializando... espera un segundo.", level="WARN")
-            return
-        
+        self._ensure_pipeline()
+
         # =====================================================
         # ❌ EXCLUIR ASSETS QUE CONTENGAN "moji"
         # =====================================================
@@ -569,110 +587,201 @@ class MainWindow(QMainWindow):
 
 
 
+        # Una operación en segundo plano a la vez
+        if self._worker is not None:
+            self.log(self.i18n.t("log_busy"), level="WARN")
+            return
+
         self.log(self.i18n.t("log_processing_assets", count=len(uassets)))
         self.min_entries.clear()
         self.max_entries.clear()
-        self.json_roots.clear()
+        self._asset_entries.clear()
+        self.dirty_tracker.clear()
+        self.sibling_index.clear()
+        self.tree.clear()
+
+        # Recargar lo mismo conserva deshacer / rehacer (las claves siguen
+        # valiendo); otro proyecto empieza de cero
+        paths = frozenset(uassets)
+        if paths != self._loaded_paths:
+            self._loaded_paths = paths
+            self.selection_history.clear()
 
+        if self.pipeline.cache is not None:
+            self.pipeline.cache.reset_stats()
+
+        # =====================================================
+        # Conversión en segundo plano; las filas llegan por señales
+        # =====================================================
+        worker = AssetLoadWorker(
+            self.pipeline,
+            uassets,
+            prefilter=self.settings.get("prefilter", True),
+        )
+        worker.prefiltered.connect(self._on_prefiltered)
+        worker.itemDone.connect(self._on_asset_loaded)
+        self._start_operation(worker, "status_loading_eta", self._on_load_finished)
+
+    # =====================================================
+    # OPERACIONES EN SEGUNDO PLANO (carga / aplicar)
+    # =====================================================
+    def _start_operation(self, worker, status_key, on_finished):
         # =====================================================
         # Mostrar progress bar y ocultar placeholder inferior
         # =====================================================
         if hasattr(self.ui, "progressStack"):
             self.ui.progressStack.setCurrentIndex(1)
 
-
-        self.ui.progressBar.setRange(0, len(uassets))
+        self.ui.progressBar.setRange(0, max(1, len(worker.items)))
         self.ui.progressBar.setValue(0)
         self.ui.progressBar.setVisible(True)
+        self.ui.btnCancelLoad.setEnabled(True)
+        self.ui.btnCancelLoad.setVisible(True)
+        self.ui.btnApply.setEnabled(False)
 
-        for index, uasset in enumerate(uassets):
-            json_path = self.pipeline.convert_uasset_to_json(uasset)
+        self._op_started = time.monotonic()
+        self._op_status_key = status_key
+        self._op_failures = []
 
-            with open(json_path, "r", encoding="utf-8") as f:
-                root = json.load(f)
+        worker.itemFailed.connect(self._on_asset_failed)
+        worker.progress.connect(self._on_operation_progress)
+        # Primero se restaura la interfaz ("listo") y después on_finished
+        # deja el estado final
+        worker.finished.connect(self._end_operation)
+        worker.finished.connect(on_finished)
 
-            self.json_roots[json_path] = root
-            mins, maxs = load_color_over_life_from_root(json_path, root)
-            self.min_entries.extend(mins)
-            self.max_entries.extend(maxs)
+        self._worker = worker
+        self._worker_thread = start_worker(worker, self)
 
-            self.ui.progressBar.setValue(index + 1)
-
-        self.ui.lblFileCount.setText(
-            self.i18n.t(
-                "files_loaded_count",
-                count=len(set(e.asset for e in self.min_entries))
-            )
-        )
-
-
-        self.tree.load_entries(self.min_entries, self.max_entries)
+    def _end_operation(self, cancelled):
+        self._worker = None
+        self._worker_thread = None
 
         self.ui.progressBar.setVisible(False)
+        self.ui.btnCancelLoad.setVisible(False)
+        self.ui.btnApply.setEnabled(True)
+        self.ui.lblStatus.setText(self.i18n.t("ready"))
         # =====================================================
         # Volver a mostrar placeholder inferior
         # =====================================================
         if hasattr(self.ui, "progressStack"):
             self.ui.progressStack.setCurrentIndex(0)
 
+        if self._close_pending:
+            QTimer.singleShot(0, self.close)
+
+    def closeEvent(self, event):
+        # No dejar conversores corriendo al cerrar: se cancela y la ventana
+        # se cierra cuando terminen los assets en curso (esperar aquí
+        # congelaría la interfaz)
+        if self._worker is not None:
+            if not self._close_pending:
+                self._close_pending = True
+                self.cancel_operation()
+                self.ui.lblStatus.setText(self.i18n.t("log_closing_wait"))
+                self.log(self.i18n.t("log_closing_wait"), level="WARN")
+            event.ignore()
+            return
 
-        self.log(self.i18n.t("log_assets_loaded"), level="OK")
+        super().closeEvent(event)
 
-    def select_all_rows(self, state):
-        self.tree.blockSignals(True)
-        self.tree.clearSelection()
+    def cancel_operation(self):
+        if self._worker is None:
+            return
 
-        if state == Qt.Checked:
-            def walk(parent_item):
-                for i in range(parent_item.childCount()):
-                    child = parent_item.child(i)
-                    if hasattr(child, "entry"):
-                        child.setSelected(True)
-                    walk(child)
+        self._worker.cancel()
+        self.ui.btnCancelLoad.setEnabled(False)
+        self.log(self.i18n.t("log_cancelling"), level="WARN")
 
-            for i in range(self.tree.topLevelItemCount()):
-                walk(self.tree.topLevelItem(i))
+    def _on_asset_failed(self, path, error):
+        # ❌ Un asset roto no aborta el resto del lote
+        self._op_failures.append(os.path.basename(path))
+        self.log(
+            self.i18n.t(
+                "log_asset_failed",
+                path=os.path.basename(path),
+                error=error,
+            ),
+            level="ERROR"
+        )
 
-        self.tree.blockSignals(False)
+    def _on_operation_progress(self, done, total):
+        # El total puede bajar tras el prefiltro
+        if self.ui.progressBar.maximum() != max(1, total):
+            self.ui.progressBar.setRange(0, max(1, total))
+        self.ui.progressBar.setValue(done)
 
-        # refrescar visual
-        self.tree._refresh_color_selection_highlight()
-        self.tree.viewport().update()
+        elapsed = time.monotonic() - self._op_started
+        if done and done < total:
+            eta = int(elapsed / done * (total - done))
+            self.ui.lblStatus.setText(
+                self.i18n.t(
+                    self._op_status_key,
+                    done=done,
+                    total=total,
+                    eta=f"{eta // 60}:{eta % 60:02d}",
+                )
+            )
 
+    def _on_prefiltered(self, candidates, skipped):
+        self.log(
+            self.i18n.t("log_prefilter", candidates=candidates, skipped=skipped)
+        )
 
-    def _select_by_mode(self, mode: str):
-        self.tree.blockSignals(True)
+    def _on_asset_loaded(self, result):
+        loaded = result.output
+        entries = loaded.min_entries + loaded.max_entries
+        self._asset_entries.setdefault(loaded.json_path, []).extend(entries)
+        self.dirty_tracker.track(entries)
+        self.sibling_index.add(entries)
 
-        # Mejor limpiar con selectionModel (más fiable)
-        sel = self.tree.selectionModel()
-        sel.clearSelection()
+        self.min_entries.extend(loaded.min_entries)
+        self.max_entries.extend(loaded.max_entries)
 
-        def walk(parent_item):
-            for i in range(parent_item.childCount()):
-                child = parent_item.child(i)
+        self.tree.append_entries(loaded.min_entries, loaded.max_entries)
 
-                if hasattr(child, "entry") and child.entry.mode == mode:
-                    child.setSelected(True)
+    def _on_load_finished(self, cancelled):
+        if self.pipeline.cache is not None:
+            self.log(
+                self.i18n.t(
+                    "log_cache_stats",
+                    hits=self.pipeline.cache.hits,
+                    misses=self.pipeline.cache.misses,
+                ),
+                level="DEBUG"
+            )
 
-                walk(child)
+        self.ui.lblFileCount.setText(
+            self.i18n.t(
+                "files_loaded_count",
+                count=len(set(e.asset for e in self.min_entries))
+            )
+        )
 
-        for i in range(self.tree.topLevelItemCount()):
-            walk(self.tree.topLevelItem(i))
+        if cancelled:
+            self.log(self.i18n.t("log_load_cancelled"), level="WARN")
+        else:
+            self.log(self.i18n.t("log_assets_loaded"), level="OK")
 
-        self.tree.blockSignals(False)
+    def select_all_rows(self, state):
+        # stateChanged entrega un int: compararlo con Qt.Checked da False.
+        # Es un solo cambio de selección: entra como un paso de deshacer
+        if Qt.CheckState(state) == Qt.Checked:
+            self.tree.selectAll()
+        else:
+            self.tree.clearSelection()
 
-        self.tree._refresh_color_selection_highlight()
-        self.tree.viewport().update()
+
+    def _select_by_mode(self, mode: str):
+        self.tree.select_mode(mode)
 
 
 
 
     def select_min_rows(self, state):
-        if state != Qt.Checked:
+        if Qt.CheckState(state) != Qt.Checked:
             # 🔑 LIMPIAR selección al quitar el check
             self.tree.clearSelection()
-            self.tree._refresh_color_selection_highlight()
-            self.tree.viewport().update()
             return
 
         self.ui.chkSelectAll.blockSignals(True)
@@ -688,11 +797,9 @@ class MainWindow(QMainWindow):
 
 
     def select_max_rows(self, state):
-        if state != Qt.Checked:
+        if Qt.CheckState(state) != Qt.Checked:
             # 🔑 LIMPIAR selección al quitar el check
             self.tree.clearSelection()
-            self.tree._refresh_color_selection_highlight()
-            self.tree.viewport().update()
             return
 
         self.ui.chkSelectAll.blockSignals(True)
@@ -708,11 +815,40 @@ class MainWindow(QMainWindow):
 
 
 
+    def _ensure_color_picker(self):
+        """
+        Crea el color picker compartido la primera vez que hace falta
+        (normalmente en un rato libre tras el arranque)
+        """
+        if self._color_picker is None:
+            from widgets.colorpicker import ColorPickerDialog
+
+            dlg = ColorPickerDialog(self.i18n, self)
+            dlg.restore_state(self.settings.get("color_picker") or {})
+            dlg.finished.connect(self._save_color_picker_state)
+            dlg.warm_up()
+            self._color_picker = dlg
+        return self._color_picker
+
+    def color_picker(self):
+        """
+        El color picker de la ventana, listo para abrirse otra vez
+        """
+        dlg = self._ensure_color_picker()
+        dlg.reset()
+        return dlg
+
+    def _save_color_picker_state(self):
+        # Historial y último color, para la próxima vez (y la próxima sesión)
+        state = self._color_picker.state()
+        if state != self.settings.get("color_picker"):
+            self.settings.set("color_picker", state)
+
     def pick_color(self):
-        items = [it for it in self.tree.selectedItems() if hasattr(it, "entry")]
+        entries = self.tree.selected_entries()
 
         # Si no hay selección, pero hay un checkbox activo, generamos la selección automáticamente
-        if not items:
+        if not entries:
             if self.ui.chkSelectAll.isChecked():
                 self.select_all_rows(Qt.Checked)
             elif self.ui.chkMin.isChecked():
@@ -720,16 +856,34 @@ class MainWindow(QMainWindow):
             elif self.ui.chkMax.isChecked():
                 self._select_by_mode("MAX")
 
-            items = [it for it in self.tree.selectedItems() if hasattr(it, "entry")]
+            entries = self.tree.selected_entries()
 
-        # ❌ Si sigue sin haber items, ahora sí es error real
-        if not items:
+        # ❌ Si sigue sin haber entries, ahora sí es error real
+        if not entries:
             self.log(self.i18n.t("log_select_row_warning"), level="WARN")
             return
 
         # ✅ SIEMPRE abrir el picker
-        dlg = ColorPickerDialog(self.i18n, self)
-        if not dlg.exec():
+        dlg = self.color_picker()
+
+        # Vista previa en vivo: las filas muestran el color mientras se
+        # elige; las entries solo cambian al aceptar
+        live = self.settings.get("live_preview", True)
+        if live:
+            previewed = list(entries)
+            if self.ui.chkSyncMinMax.isChecked():
+                for entry in entries:
+                    previewed.extend(self.sibling_index.siblings(entry))
+            self.tree.begin_preview(previewed)
+            dlg.colorPreviewed.connect(self.tree.set_preview_color)
+
+        accepted = dlg.exec()
+
+        if live:
+            dlg.colorPreviewed.disconnect(self.tree.set_preview_color)
+            self.tree.end_preview()
+
+        if not accepted:
             return
 
         rgb = dlg.get_color()
@@ -738,17 +892,12 @@ class MainWindow(QMainWindow):
 
         r, g, b = rgb
 
-        for item in items:
-            entry = item.entry
+        # Las celdas se calculan al pintar: basta con cambiar la entry
+        for entry in entries:
             entry.set_rgb(r, g, b)
 
-            item.setText(2, f"{r:.4f}")
-            item.setText(3, f"{g:.4f}")
-            item.setText(4, f"{b:.4f}")
-            item.setBackground(1, QColor.fromRgbF(r, g, b))
-
-            # Sync MIN/MAX si aplica
-            self.on_tree_color_changed(entry)
+        # Sync MIN/MAX si aplica, todo de una vez
+        self._sync_min_max(entries)
 
         self.selected_color = rgb
 
@@ -756,8 +905,7 @@ class MainWindow(QMainWindow):
             f"background-color: rgb({int(r*255)},{int(g*255)},{int(b*255)});"
         )
 
-        # 🔄 Refrescar visual
-        self.tree._refresh_color_selection_highlight()
+        # 🔄 Refrescar visual (los colores se leen de las entries al pintar)
         self.tree.viewport().update()
 
         self.log(self.i18n.t("log_color_selected"))
@@ -766,69 +914,156 @@ class MainWindow(QMainWindow):
 
 
 
+    def edit_entry_color(self, entry):
+        # Doble clic en una celda Color del árbol
+        dlg = self.color_picker()
+        if not dlg.exec():
+            return
+
+        rgb = dlg.get_color()
+        if not rgb:
+            return
+
+        self.tree.set_entry_color(entry, *rgb)
+
     def on_tree_color_changed(self, entry):
         # Si Sync Min / Max no está activo, no hacemos nada
-        if not self.ui.chkSyncMinMax.isChecked():
+        if not self._sync_min_max([entry]):
             return
 
-        # Buscar el hermano MIN <-> MAX del mismo asset y módulo
-        for e in (self.min_entries + self.max_entries):
-            if (
-                e is not entry
-                and e.asset == entry.asset
-                and e.module == entry.module
-                and e.mode != entry.mode
-            ):
-                e.set_rgb(entry.r, entry.g, entry.b)
-
         # NO reconstruyas el árbol: eso destruye la selección.
         # Solo refresca la vista.
-
-        self.tree._refresh_color_selection_highlight()
         self.tree.viewport().update()
 
-        # Si quieres mantener Select All, no lo recalcules aquí.
-        # (Opcional: puedes dejarlo fuera)
+    def _sync_min_max(self, entries) -> bool:
+        """
+        Copia el color de cada entry a su hermano MIN <-> MAX (mismo asset
+        y módulo). Devuelve False si Sync Min / Max no está activo.
+        """
+        if not self.ui.chkSyncMinMax.isChecked():
+            return False
+
+        for entry in entries:
+            for sibling in self.sibling_index.siblings(entry):
+                sibling.set_rgb(entry.r, entry.g, entry.b)
+        return True
 
 
 
 
 
     def apply_changes(self):
-        if not hasattr(self, "pipeline"):
-            self.log("Inicializando... espera un segundo.", level="WARN")
+        if self._worker is not None:
+            self.log(self.i18n.t("log_busy"), level="WARN")
             return
+
         self.log(self.i18n.t("log_applying_changes"))
 
-        # 1) Detectar qué JSONs hay que guardar
-        touched_jsons = set()
-        for entry in (self.min_entries + self.max_entries):
-            touched_jsons.add(entry.asset)  # entry.asset aquí es el json_path
+        # 1) Solo los assets cuyos valores efectivos cambiaron
+        dirty = self.dirty_tracker.dirty_assets()
+        skipped = len(self._asset_entries) - len(dirty)
 
-        # 2) Guardar cada JSON y reconvertir a UASSET
-        for json_path in touched_jsons:
-            root = self.json_roots.get(json_path)
-            if root is None:
-                continue
+        if skipped:
+            self.log(self.i18n.t("log_apply_skipped", count=skipped))
 
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(root, f, ensure_ascii=False, indent=4)
+        if not dirty:
+            self.ui.lblStatus.setText(self.i18n.t("log_nothing_to_apply"))
+            self.log(self.i18n.t("log_nothing_to_apply"), level="OK")
+            return
 
-            self.pipeline.convert_json_to_uasset(json_path)
+        # 2) Reconstrucción en paralelo y en segundo plano
+        self.log(self.i18n.t("log_applying_assets", count=len(dirty)))
 
-            try:
-                os.remove(json_path)
-            except Exception:
-                pass
+        # El worker escribe copias con los valores de este momento: el
+        # árbol sigue editable y lo que cambie mientras tanto seguirá sucio
+        # (entry.asset aquí es el json_path)
+        self._apply_snapshots = {
+            path: [(entry, entry.snapshot()) for entry in self._asset_entries[path]]
+            for path in dirty
+        }
+        worker = AssetApplyWorker(
+            self.pipeline,
+            {
+                path: [snapshot for _, snapshot in pairs]
+                for path, pairs in self._apply_snapshots.items()
+            },
+        )
+        worker.itemDone.connect(self._on_asset_applied)
+        self._start_operation(worker, "status_applying_eta", self._on_apply_finished)
 
-        self.ui.lblStatus.setText(self.i18n.t("log_changes_applied"))
-        self.log(self.i18n.t("log_changes_applied"), level="OK")
+    def _on_asset_applied(self, result):
+        # Limpias respecto a lo que se escribió, no a su valor actual
+        for entry, snapshot in self._apply_snapshots.pop(result.source, ()):
+            entry.mark_clean((snapshot.r, snapshot.g, snapshot.b))
 
+        self.log(
+            self.i18n.t("log_asset_applied", path=os.path.basename(result.output)),
+            level="DEBUG"
+        )
+
+    def _on_apply_finished(self, cancelled):
+        # Los assets que fallaron o no llegaron a lanzarse siguen sucios
+        self._apply_snapshots = {}
+        failures = self._op_failures
+        pending = len(self.dirty_tracker.dirty_assets())
+
+        # Resumen en vez de abortar a mitad de lote
+        if failures:
+            self.log(
+                self.i18n.t(
+                    "log_apply_failed_summary",
+                    count=len(failures),
+                    assets=", ".join(failures[:10]) + (" …" if len(failures) > 10 else ""),
+                ),
+                level="ERROR"
+            )
+
+        if cancelled:
+            self.log(self.i18n.t("log_apply_cancelled", pending=pending), level="WARN")
+            return
+
+        if not failures:
+            self.ui.lblStatus.setText(self.i18n.t("log_changes_applied"))
+            self.log(self.i18n.t("log_changes_applied"), level="OK")
 
 if __name__ == "__main__":
+    if "--purge-cache" in sys.argv:
+        from core.binary_patch import LayoutCache
+        from core.entry_cache import EntryCache
+
+        removed = EntryCache().purge() + LayoutCache().purge()
+        print(f"ChromaFlux: {removed} cache file(s) removed")
+        sys.exit(0)
+
+    if "--profile-startup" in sys.argv:
+        from core.settings_manager import get_appdata_dir
+
+        report = startup_profile.profile_startup(
+            os.path.abspath(__file__),
+            os.path.join(get_appdata_dir(), "startup"),
+        )
+        with open(report, "r", encoding="utf-8") as f:
+            print(f.read())
+        print(f"ChromaFlux: report written to {report}")
+        sys.exit(0)
+
     app = QApplication(sys.argv)
     app.setApplicationName("ChromaFlux")
     app.setOrganizationName("ChromaFlux")
+    startup_profile.mark("qapp_ready")
     w = MainWindow()
     w.show()
+
+    # Ejecución hija de --profile-startup: guardar hitos y salir
+    milestones_file = startup_profile.milestones_path(sys.argv)
+    if milestones_file:
+        def _finish_profile():
+            if "idle_done" in startup_profile.milestones():
+                startup_profile.write_milestones(milestones_file)
+                app.quit()
+            else:
+                QTimer.singleShot(10, _finish_profile)
+
+        QTimer.singleShot(0, _finish_profile)
+
     sys.exit(app.exec())
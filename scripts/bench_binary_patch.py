@@ -0,0 +1,75 @@
+"""
+Compara aplicar colores con la conversión completa (JSON → UASSET) frente
+al parcheo binario de core.binary_patch:
+
+    python scripts/bench_binary_patch.py --count 1250
+
+Cada asset sintético tiene 4 vectores de color, así que 1250 assets son
+5000 ediciones. La primera pasada con parcheo incluye la sonda (una
+importación por asset); las siguientes son solo E/S.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.asset_pipeline import AssetPipeline  # noqa: E402
+from core.binary_patch import LayoutCache  # noqa: E402
+from core.converter_backends import PythonStandInBackend, SpawnBackend  # noqa: E402
+from synthetic_assets import write_standin_assets  # noqa: E402
+
+STANDIN = [sys.executable, "-m", "core.uejson_standin"]
+
+
+def apply_pass(pipeline, assets, value):
+    edits = 0
+    start = time.perf_counter()
+    for json_path, entries in assets:
+        for e in entries:
+            e.set_rgb(value, 1.0 - value, 0.5)
+            edits += 1
+        pipeline.rebuild_asset(json_path, entries)
+        for e in entries:
+            e.mark_clean()
+    return time.perf_counter() - start, edits
+
+
+def load(pipeline, paths):
+    assets = []
+    for path in paths:
+        loaded = pipeline.load_asset(path)
+        assets.append((loaded.json_path, loaded.min_entries + loaded.max_entries))
+    return assets
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1250)
+    parser.add_argument("--spawn", action="store_true", help="UEJSON por proceso en vez de en proceso")
+    args = parser.parse_args()
+
+    os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    backend = SpawnBackend(STANDIN) if args.spawn else PythonStandInBackend()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_standin_assets(os.path.join(tmp, "assets"), args.count)
+
+        full = AssetPipeline(backend=backend)
+        t_full, edits = apply_pass(full, load(full, paths), 0.25)
+
+        fast = AssetPipeline(backend=backend, layouts=LayoutCache(os.path.join(tmp, "layouts")))
+        assets = load(fast, paths)
+        t_probe, _ = apply_pass(fast, assets, 0.5)
+        t_patch, _ = apply_pass(fast, assets, 0.75)
+
+        print(f"{args.count} assets, {edits} ediciones, backend={backend.name}")
+        print(f"  JSON → UASSET    {t_full * 1000:9.1f} ms")
+        print(f"  sonda + parcheo  {t_probe * 1000:9.1f} ms")
+        print(f"  solo parcheo     {t_patch * 1000:9.1f} ms  ({t_full / t_patch:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
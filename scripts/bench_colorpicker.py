@@ -0,0 +1,175 @@
+"""
+Mide el tiempo por fotograma de los widgets del color picker al
+arrastrar (evento de ratón + repintado):
+
+    python scripts/bench_colorpicker.py --frames 200
+
+- SV: mover el cursor por el plano saturación / valor
+- SV: cambiar de tono (el plano se vuelve a generar)
+- rueda: arrastrar el cursor alrededor y mover el tono con set_hue
+- diálogo completo: arrastrar el slider de tono y el plano SV
+- tiempo hasta ver el diálogo: construirlo en cada apertura frente a
+  reutilizar uno ya construido y precalentado (reset + mostrar)
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PySide6.QtCore import QEvent, QPointF, Qt  # noqa: E402
+from PySide6.QtGui import QMouseEvent  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from widgets.colorpicker.sv_picker_widget import SVPickerWidget  # noqa: E402
+from widgets.colorpicker.wheel_widget import ColorWheelWidget  # noqa: E402
+
+
+def drag(widget, points):
+    """
+    Un fotograma por punto: press en el primero, move en el resto
+    """
+    for i, (x, y) in enumerate(points):
+        kind = QEvent.MouseButtonPress if i == 0 else QEvent.MouseMove
+        pos = QPointF(x, y)
+        event = QMouseEvent(
+            kind, pos, widget.mapToGlobal(pos), Qt.LeftButton, Qt.LeftButton, Qt.NoModifier
+        )
+        QApplication.sendEvent(widget, event)
+        yield
+
+
+FRAME_S = 1 / 60
+
+
+def frame_times(app, frames):
+    """
+    ms de cada fotograma: lo que hace el paso + pintar lo pendiente.
+    Los fotogramas van a 60 Hz (la espera no cuenta) para que los
+    temporizadores de la interfaz corran como con un arrastre real.
+    """
+    samples = []
+    frames = iter(frames)
+    while True:
+        start = time.perf_counter()
+        if next(frames, StopIteration) is StopIteration:
+            return samples
+        app.processEvents()
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed * 1000.0)
+        time.sleep(max(0.0, FRAME_S - elapsed))
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<30}{statistics.median(samples):9.2f} ms{p95:9.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--opens", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    n = args.frames
+
+    sv = SVPickerWidget()
+    sv.resize(180, 180)
+    sv.show()
+    app.processEvents()
+
+    print(f"{'':<32}{'median':>9}{'p95':>12}")
+
+    # Diagonal de ida y vuelta por el plano
+    points = [(10 + (i * 7) % 160, 10 + (i * 3) % 160) for i in range(n)]
+    report("SV cursor drag", frame_times(app, drag(sv, points)))
+
+    def hue_steps():
+        for i in range(n):
+            sv.set_hue((i * 3) % 360)
+            yield
+
+    report("SV hue change", frame_times(app, hue_steps()))
+
+    wheel = ColorWheelWidget()
+    wheel.resize(180, 180)
+    wheel.show()
+    app.processEvents()
+
+    # Vuelta a la rueda, 3 grados por fotograma
+    around = [
+        (90 + 80 * math.cos(math.radians(i * 3)), 90 + 80 * math.sin(math.radians(i * 3)))
+        for i in range(n)
+    ]
+    report("wheel hue drag", frame_times(app, drag(wheel, around)))
+
+    def wheel_steps():
+        for i in range(n):
+            wheel.set_hue(i * 3)
+            yield
+
+    report("wheel set_hue", frame_times(app, wheel_steps()))
+
+    from core.i18n_manager import I18N
+    from widgets.colorpicker import ColorPickerDialog
+
+    dialog = ColorPickerDialog(I18N("en"))
+    dialog.show()
+    app.processEvents()
+
+    def slider_steps():
+        slider = dialog.ui.sliderHue
+        slider.setSliderDown(True)
+        for i in range(n):
+            slider.setValue((i * 3) % 360)
+            yield
+        slider.setSliderDown(False)
+
+    report("dialog hue slider drag", frame_times(app, slider_steps()))
+    report("dialog SV drag", frame_times(app, drag(dialog.svPicker, points)))
+    dialog.close()
+
+    i18n = I18N("en")
+
+    def open_new():
+        dlg = ColorPickerDialog(i18n)
+        dlg.show()
+        app.processEvents()
+        return dlg
+
+    def close_new(dlg):
+        dlg.close()
+        dlg.deleteLater()
+
+    shared = ColorPickerDialog(i18n)
+    shared.warm_up()
+
+    def open_shared():
+        shared.reset()
+        shared.show()
+        app.processEvents()
+        return shared
+
+    # Solo cuenta hasta que el diálogo está pintado (no el cierre)
+    def time_to_open(open_fn, close_fn):
+        samples = []
+        for _ in range(args.opens):
+            start = time.perf_counter()
+            dlg = open_fn()
+            samples.append((time.perf_counter() - start) * 1000.0)
+            close_fn(dlg)
+            app.processEvents()
+        return samples
+
+    print()
+    report("open: new dialog", time_to_open(open_new, close_new))
+    report("open: shared dialog", time_to_open(open_shared, lambda dlg: dlg.close()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Mide el coste por asset de cada backend de conversión.
+
+Usa el sustituto en Python de UEJSON, así que corre en Linux sin .NET:
+
+    python scripts/bench_converter_backends.py --count 1000
+
+spawn   → un proceso por asset (comportamiento clásico)
+session → un único proceso --batch que recibe todas las peticiones
+python  → conversión en proceso (límite inferior)
+
+Las cifras valen para el sustituto: UEJSON.exe no tiene modo --batch,
+con él "auto" acaba siempre en spawn.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.asset_pipeline import AssetPipeline  # noqa: E402
+from core.converter_backends import (  # noqa: E402
+    PythonStandInBackend,
+    SessionBackend,
+    SpawnBackend,
+)
+from synthetic_assets import write_standin_assets  # noqa: E402
+
+STANDIN = [sys.executable, "-m", "core.uejson_standin"]
+
+
+def run(backend, paths, workers):
+    pipeline = AssetPipeline(max_workers=workers, backend=backend)
+    start = time.perf_counter()
+    failed = sum(not r.ok for r in pipeline.convert_many_to_json(paths))
+    elapsed = time.perf_counter() - start
+    pipeline.close()
+    return elapsed, failed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_standin_assets(tmp, args.count)
+
+        backends = [
+            ("spawn", lambda: SpawnBackend(STANDIN)),
+            ("session", lambda: SessionBackend(STANDIN, args.workers)),
+            ("python", PythonStandInBackend),
+        ]
+
+        print(f"{args.count} assets, {args.workers} worker(s)")
+        results = {}
+        for name, factory in backends:
+            elapsed, failed = run(factory(), paths, args.workers)
+            results[name] = elapsed
+            print(
+                f"  {name:8s} {elapsed:8.2f} s  "
+                f"{elapsed / args.count * 1000:8.2f} ms/asset  fallos={failed}"
+            )
+
+        print(f"  spawn/session: {results['spawn'] / results['session']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compara json.load + load_color_over_life_from_root con el extractor en
+streaming de json_reader sobre documentos UEJSON de varios MB:
+
+    python scripts/bench_json_reader.py --modules 8 --props 4000
+
+Mide tiempo y pico de memoria (tracemalloc) y comprueba que ambos
+caminos devuelven exactamente las mismas entries y ubicaciones.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.json_reader import load_color_over_life_from_json  # noqa: E402
+from synthetic_assets import make_root  # noqa: E402
+
+
+def measure(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, best, peak
+
+
+def signature(result):
+    mins, maxs = result
+    return [
+        (e.module, e.mode, e.r, e.g, e.b, e.location)
+        for e in mins + maxs
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", type=int, default=8)
+    parser.add_argument("--fillers", type=int, default=6)
+    parser.add_argument("--props", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    root = make_root(args.modules, args.fillers, args.props)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "P_Big.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(root, f, indent=2)
+        del root
+
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"{size_mb:.1f} MB, {args.modules} módulos de color")
+
+        full, t_full, m_full = measure(
+            lambda: load_color_over_life_from_json(path), args.repeat
+        )
+        stream, t_stream, m_stream = measure(
+            lambda: load_color_over_life_from_json(path, streaming=True), args.repeat
+        )
+
+        assert signature(full) == signature(stream), "Los resultados difieren"
+
+        print(f"  json.load  {t_full * 1000:8.1f} ms  pico {m_full / 1e6:8.1f} MB")
+        print(f"  streaming  {t_stream * 1000:8.1f} ms  pico {m_stream / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
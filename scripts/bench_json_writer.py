@@ -0,0 +1,105 @@
+"""
+Compara guardar con json.load + json.dump (indent=4) frente al parcheo
+en bloque de json_writer.splice_numbers sobre un documento UEJSON grande:
+
+    python scripts/bench_json_writer.py --modules 8 --props 4000
+
+Comprueba que ambos caminos dan el mismo documento y que el parcheado
+solo difiere del original dentro de los literales reescritos.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.json_reader import load_color_over_life_from_json  # noqa: E402
+from core.json_writer import (  # noqa: E402
+    _vector_values,
+    apply_entries_to_root,
+    find_number_spans,
+    splice_numbers,
+)
+from synthetic_assets import make_root  # noqa: E402
+
+
+def full_rewrite(path, entries):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    apply_entries_to_root(data, entries)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+def best_of(func, prepare, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        prepare()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", type=int, default=8)
+    parser.add_argument("--fillers", type=int, default=6)
+    parser.add_argument("--props", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "P_Big.source.json")
+        with open(source, "w", encoding="utf-8") as f:
+            json.dump(make_root(args.modules, args.fillers, args.props), f, ensure_ascii=False, indent=4)
+
+        mins, maxs = load_color_over_life_from_json(source, streaming=True)
+        entries = mins + maxs
+        rng = random.Random(1)
+        for e in entries:
+            e.set_rgb(rng.random(), rng.random(), rng.random())
+
+        dumped = os.path.join(tmp, "P_Big.dump.json")
+        spliced = os.path.join(tmp, "P_Big.splice.json")
+
+        size_mb = os.path.getsize(source) / (1024 * 1024)
+        print(f"{size_mb:.1f} MB, {len(entries)} vectores")
+
+        t_dump = best_of(
+            lambda: full_rewrite(dumped, entries),
+            lambda: shutil.copyfile(source, dumped),
+            args.repeat,
+        )
+        t_splice = best_of(
+            lambda: splice_numbers(spliced, _vector_values(entries)),
+            lambda: shutil.copyfile(source, spliced),
+            args.repeat,
+        )
+
+        # Mismo documento lógico
+        with open(dumped, "r", encoding="utf-8") as a, open(spliced, "r", encoding="utf-8") as b:
+            assert json.load(a) == json.load(b), "Los documentos difieren"
+
+        # Byte a byte idéntico fuera de los literales parcheados
+        values = _vector_values(entries)
+        spans = find_number_spans(source, values.keys())
+        with open(source, "rb") as f:
+            expected = f.read()
+        for target, (start, end, _) in sorted(spans.items(), key=lambda s: -s[1][0]):
+            literal = json.dumps(values[target]).encode("ascii")
+            expected = expected[:start] + literal + expected[end:]
+        with open(spliced, "rb") as f:
+            assert f.read() == expected, "Texto alterado fuera de los números"
+
+        print(f"  json.dump  {t_dump * 1000:8.1f} ms")
+        print(f"  splice     {t_splice * 1000:8.1f} ms  ({t_dump / t_splice:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
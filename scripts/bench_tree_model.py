@@ -0,0 +1,146 @@
+"""
+Mide el árbol de Color Over Life (modelo + vista) con un proyecto
+sintético grande:
+
+    python scripts/bench_tree_model.py --entries 100000
+
+- carga incremental (append_entries por asset, como al cargar) + pintado
+- seleccionar todo / solo MIN y leer la selección
+- clic con Ctrl sobre una fila con todo lo demás seleccionado
+- vista previa del color picker sobre --preview filas seleccionadas
+  (por fotograma), frente a cambiar las entries en cada fotograma
+- recorrer la vista hasta el final (fetchMore de los assets pendientes)
+- memoria residente añadida
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PySide6.QtCore import QItemSelectionModel  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from core.data_models import ColorEntry  # noqa: E402
+from widgets.color_over_life_tree import ColorOverLifeTreeView  # noqa: E402
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return float("nan")
+
+
+def make_project(entries: int, modules_per_asset: int):
+    """
+    [(min_entries, max_entries)] por asset
+    """
+    assets = []
+    per_asset = modules_per_asset * 2
+    for a in range((entries + per_asset - 1) // per_asset):
+        path = f"/project/Content/FX/P_Bench_{a:06d}.json"
+        mins, maxs = [], []
+        for m in range(modules_per_asset):
+            module = f"ParticleModuleColorOverLife_{m}"
+            v = ((a * 7 + m) % 100) / 100.0
+            mins.append(ColorEntry(path, module, "MIN", v, 0.5, 1 - v, None, (m, 1, 0)))
+            maxs.append(ColorEntry(path, module, "MAX", 1 - v, v, 0.5, None, (m, 2, 0)))
+        assets.append((mins, maxs))
+    return assets
+
+
+def timed(label, fn, app):
+    start = time.perf_counter()
+    result = fn()
+    app.processEvents()
+    print(f"  {label:<34}{(time.perf_counter() - start) * 1000:10.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--modules", type=int, default=5, help="módulos por asset")
+    parser.add_argument("--preview", type=int, default=20_000, help="filas en la vista previa")
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    project = make_project(args.entries, args.modules)
+    total = sum(len(a) + len(b) for a, b in project)
+    print(f"{len(project)} assets, {total} entries")
+
+    view = ColorOverLifeTreeView()
+    view.set_headers(["Type", "Color", "R", "G", "B"])
+    view.resize(900, 700)
+    view.show()
+    app.processEvents()
+
+    base = rss_mb()
+
+    def load():
+        for mins, maxs in project:
+            view.append_entries(mins, maxs)
+
+    timed("append_entries (all assets)", load, app)
+    timed("first paint", lambda: view.viewport().repaint(), app)
+
+    count = timed("select all + selected_entries", lambda: (
+        view.selectAll(), len(view.selected_entries()))[1], app)
+    print(f"  {'':<34}{count:10d} selected")
+
+    def toggle_clicks(repeat=100):
+        model = view.model()
+        cell = model.index(0, 1, model.index(0, 0, model.index(0, 0)))
+        for _ in range(repeat):
+            view.selectionModel().select(cell, QItemSelectionModel.Toggle)
+            app.processEvents()
+
+    timed("100 Ctrl+clicks (all selected)", toggle_clicks, app)
+
+    def frames(step):
+        samples = []
+        for i in range(args.frames):
+            start = time.perf_counter()
+            step(((i * 3) % 100) / 100.0)
+            app.processEvents()
+            samples.append((time.perf_counter() - start) * 1000.0)
+        return f"{statistics.median(samples):10.1f} ms/frame"
+
+    previewed = view.selected_entries()[: args.preview]
+    label = f"preview {len(previewed)} rows"
+
+    def set_entries(v):
+        for entry in previewed:
+            entry.set_rgb(v, v, 1 - v)
+        view.viewport().update()
+
+    print(f"  {label + ', set_rgb':<34}{frames(set_entries)}")
+
+    view.begin_preview(previewed)
+    print(f"  {label + ', overlay':<34}{frames(lambda v: view.set_preview_color((v, v, 1 - v)))}")
+    timed("cancel preview", view.end_preview, app)
+
+    timed("select MIN", lambda: view.select_mode("MIN"), app)
+    timed("select MAX", lambda: view.select_mode("MAX"), app)
+    timed("clear selection", view.clearSelection, app)
+
+    def scroll_to_end():
+        bar = view.verticalScrollBar()
+        for _ in range(10_000):
+            bar.setValue(bar.maximum())
+            app.processEvents()
+            if not view.model().canFetchMore(view.rootIndex()):
+                break
+
+    timed("scroll to the end", scroll_to_end, app)
+    print(f"  {'resident memory added':<34}{rss_mb() - base:10.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compara el coste de construir la interfaz con los módulos compilados
+(pyside6-uic) frente a leer los .ui con QUiLoader en cada apertura:
+
+    python scripts/bench_ui_forms.py --repeat 20
+
+- construcción de MainWindow (solo __init__, sin late init)
+- apertura del color picker (construir + mostrar + cerrar)
+- apertura del diálogo de idioma
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from core.i18n_manager import I18N  # noqa: E402
+from widgets import ui_forms  # noqa: E402
+
+
+def _time(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    from main import MainWindow
+    from widgets.colorpicker import ColorPickerDialog
+    from widgets.language_dialog import LanguageDialog
+
+    i18n = I18N("en")
+
+    # Las ventanas viven hasta el final: su late init corre en el event loop
+    windows = []
+
+    def build_window():
+        windows.append(MainWindow())
+
+    def open_dialog(cls):
+        def run():
+            dlg = cls(i18n)
+            dlg.show()
+            app.processEvents()
+            dlg.close()
+            dlg.deleteLater()
+        return run
+
+    cases = [
+        ("MainWindow.__init__", build_window),
+        ("ColorPickerDialog open", open_dialog(ColorPickerDialog)),
+        ("LanguageDialog open", open_dialog(LanguageDialog)),
+    ]
+
+    print(f"{'':<26}{'QUiLoader':>12}{'compiled':>12}{'speedup':>10}")
+    for name, fn in cases:
+        results = {}
+        for compiled in (False, True):
+            ui_forms.USE_COMPILED = compiled
+            fn()  # calentar
+            results[compiled] = _time(fn, args.repeat)
+            app.processEvents()
+            for w in windows:
+                w.deleteLater()
+            windows.clear()
+            app.processEvents()
+        print(
+            f"{name:<26}{results[False]:10.2f}ms{results[True]:10.2f}ms"
+            f"{results[False] / results[True]:9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
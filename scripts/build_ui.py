@@ -0,0 +1,102 @@
+"""
+Compila los .ui a módulos Python con pyside6-uic:
+
+    python scripts/build_ui.py            # regenera los módulos
+    python scripts/build_ui.py --check    # falla si alguno está desfasado
+
+Cada módulo lleva al final el hash del .ui del que salió
+(UI_SOURCE_SHA256); la app lo usa para decidir si puede usar el
+compilado o tiene que leer el .ui con QUiLoader.
+"""
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from widgets.ui_forms import FORMS, ROOT, source_hash  # noqa: E402
+
+
+# uic escribe los caracteres fuera del BMP (emojis) como pares suplentes
+# \ud83c\uddea, que en Python son dos caracteres sueltos inválidos
+_SURROGATE_PAIR = re.compile(r"\\u(d[89ab][0-9a-f]{2})\\u(d[c-f][0-9a-f]{2})", re.IGNORECASE)
+
+
+def _join_surrogates(match) -> str:
+    high, low = int(match.group(1), 16), int(match.group(2), 16)
+    return f"\\U{0x10000 + ((high - 0xD800) << 10) + (low - 0xDC00):08x}"
+
+
+def _module_path(module_name: str) -> str:
+    return os.path.join(ROOT, *module_name.split(".")) + ".py"
+
+
+def _uic() -> list:
+    tool = shutil.which("pyside6-uic")
+    if tool is None:
+        raise SystemExit("pyside6-uic no encontrado (pip install PySide6)")
+    return [tool]
+
+
+def compile_form(form: str) -> str:
+    """
+    Texto del módulo compilado (finales de línea LF)
+    """
+    ui_path = os.path.join(ROOT, form)
+    result = subprocess.run(
+        _uic() + [ui_path], capture_output=True, text=True, check=True
+    )
+    with open(ui_path, "rb") as f:
+        digest = source_hash(f.read())
+
+    code = result.stdout.replace("\r\n", "\n").rstrip("\n")
+    code = _SURROGATE_PAIR.sub(_join_surrogates, code)
+    return f"{code}\n\nUI_SOURCE_SHA256 = \"{digest}\"\n"
+
+
+def _strip_header(code: str) -> str:
+    # La cabecera lleva la versión de uic: no cuenta como desfase
+    return "\n".join(
+        line for line in code.replace("\r\n", "\n").splitlines()
+        if not line.startswith("##")
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="solo comprobar, sin escribir")
+    args = parser.parse_args()
+
+    stale = []
+    for form, (module_name, _) in FORMS.items():
+        path = _module_path(module_name)
+        code = compile_form(form)
+
+        current = None
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                current = f.read()
+
+        up_to_date = current is not None and _strip_header(current) == _strip_header(code)
+
+        if args.check:
+            if not up_to_date:
+                stale.append(form)
+            print(f"{'ok   ' if up_to_date else 'STALE'}  {form} -> {os.path.relpath(path, ROOT)}")
+        elif not up_to_date:
+            # Mismos finales de línea que el resto del repo
+            with open(path, "w", encoding="utf-8", newline="\r\n") as f:
+                f.write(code)
+            print(f"built  {form} -> {os.path.relpath(path, ROOT)}")
+
+    if stale:
+        print(f"\n{len(stale)} form(s) out of date: run python scripts/build_ui.py")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
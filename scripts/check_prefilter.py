@@ -0,0 +1,142 @@
+"""
+Comprueba que el prefiltro de paquetes (core.package_scan) no descarta
+nunca un asset con módulos de color, sobre un corpus sintético:
+
+    python scripts/check_prefilter.py --count 2000
+
+- paquetes del sustituto de UEJSON, con y sin módulos de color; la
+  verdad se obtiene convirtiendo y extrayendo con json_reader
+- paquetes binarios al estilo UE (cabecera + tabla de nombres) con el
+  nombre en ASCII, en UTF-16LE, al final del archivo o ausente
+
+Informa de los descartes y del tiempo del prefiltro en paralelo.
+"""
+import argparse
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core import uejson_standin  # noqa: E402
+from core.asset_pipeline import AssetPipeline  # noqa: E402
+from core.json_reader import load_color_over_life_from_json  # noqa: E402
+from synthetic_assets import make_root  # noqa: E402
+
+PACKAGE_TAG = 0x9E2A83C1
+
+OTHER_NAMES = [
+    "ParticleModuleSize", "ParticleModuleVelocity", "ParticleModuleLifetime",
+    "ParticleModuleSpawn", "StaticMesh", "Material", "Texture2D", "Core",
+    "ColorOverLife", "ParticleModule", "ParticleModuleColour",
+]
+
+
+def _fname(text):
+    # FString: longitud positiva (ASCII) o negativa (UTF-16LE), con nulo final
+    try:
+        raw = text.encode("ascii") + b"\0"
+        return struct.pack("<i", len(raw)) + raw + b"\0\0\0\0"
+    except UnicodeEncodeError:
+        raw = text.encode("utf-16-le") + b"\0\0"
+        return struct.pack("<i", -(len(raw) // 2)) + raw + b"\0\0\0\0"
+
+
+def write_binary_package(path, names, rng, tail=b""):
+    body = b"".join(_fname(n) for n in names)
+    padding = bytes(rng.getrandbits(8) for _ in range(rng.randint(0, 4096)))
+    with open(path, "wb") as f:
+        f.write(struct.pack("<Ii", PACKAGE_TAG, len(names)))
+        f.write(body)
+        f.write(padding)
+        f.write(tail)
+
+
+def build_corpus(folder, count, rng):
+    """
+    Devuelve [(ruta, tiene_color)]
+    """
+    corpus = []
+
+    for i in range(count):
+        kind = i % 6
+        path = os.path.join(folder, f"P_{i:05d}.uasset")
+
+        if kind == 0:
+            # Sustituto con módulos de color
+            uejson_standin.write_package(path, make_root(color_modules=1 + i % 3, seed=i))
+            corpus.append((path, None))
+        elif kind == 1:
+            # Sustituto sin módulos de color
+            root = make_root(color_modules=0, seed=i)
+            root["Imports"] = [{"ObjectName": "ParticleModuleSize"}]
+            uejson_standin.write_package(path, root)
+            corpus.append((path, None))
+        else:
+            names = rng.sample(OTHER_NAMES, 6)
+            tail = b""
+            has_color = True
+            if kind == 2:
+                names.append("ParticleModuleColorOverLife")
+            elif kind == 3:
+                names.append("ParticleModuleColor_Ñandú")      # UTF-16LE
+            elif kind == 4:
+                tail = _fname("ParticleModuleColor")           # al final del archivo
+            else:
+                has_color = False
+            rng.shuffle(names)
+            write_binary_package(path, names, rng, tail)
+            corpus.append((path, has_color))
+
+    return corpus
+
+
+def ground_truth(path):
+    json_path = uejson_standin.export_package(path)
+    mins, maxs = load_color_over_life_from_json(json_path)
+    os.remove(json_path)
+    return bool(mins or maxs)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = [
+            (path, ground_truth(path) if truth is None else truth)
+            for path, truth in build_corpus(tmp, args.count, rng)
+        ]
+
+        pipeline = AssetPipeline(max_workers=args.workers, backend="python")
+        start = time.perf_counter()
+        candidates, skipped = pipeline.prefilter(path for path, _ in corpus)
+        elapsed = time.perf_counter() - start
+
+        kept = set(candidates)
+        false_negatives = [path for path, truth in corpus if truth and path not in kept]
+        false_positives = [path for path, truth in corpus if not truth and path in kept]
+        positives = sum(truth for _, truth in corpus)
+
+        print(f"{len(corpus)} paquetes, {positives} con módulos de color")
+        print(f"  candidatos       {len(candidates)}")
+        print(f"  descartados      {skipped}")
+        print(f"  falsos negativos {len(false_negatives)}")
+        print(f"  falsos positivos {len(false_positives)}")
+        print(f"  tiempo           {elapsed * 1000:.1f} ms")
+
+        if false_negatives:
+            for path in false_negatives[:10]:
+                print(f"    ✗ {os.path.basename(path)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Comprueba core.uasset_reader frente a json_reader sobre paquetes UE
+sintéticos (UE4.27 float32 y UE5 double) y mide su coste:
+
+    python scripts/check_uasset_reader.py --count 500
+
+Para cada paquete, las entries del lector nativo deben coincidir
+(módulo, modo, valores y ubicación) con load_color_over_life_from_root
+sobre el documento que lo generó. También verifica que un paquete que
+no entiende lanza UnsupportedPackage (la pipeline usa UEJSON).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core import uejson_standin  # noqa: E402
+from core.json_reader import load_color_over_life_from_json, load_color_over_life_from_root  # noqa: E402
+from core.uasset_reader import UnsupportedPackage, read_color_entries  # noqa: E402
+from synthetic_assets import make_root, write_ue_package  # noqa: E402
+
+
+def signature(result):
+    mins, maxs = result
+    return [(e.module, e.mode, e.r, e.g, e.b, e.location) for e in mins + maxs]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = []
+        for i in range(args.count):
+            root = make_root(color_modules=i % 5, filler_exports=3, filler_props=40, seed=i)
+            path = os.path.join(tmp, f"P_UE_{i:05d}.uasset")
+            write_ue_package(path, root, ue5=bool(i % 2))
+            cases.append((path, signature(load_color_over_life_from_root(path[:-7] + ".json", root))))
+
+        start = time.perf_counter()
+        results = [signature(read_color_entries(path)) for path, _ in cases]
+        t_native = time.perf_counter() - start
+
+        mismatches = [path for (path, expected), got in zip(cases, results) if got != expected]
+
+        # Referencia: exportar a JSON (sustituto en proceso) + json_reader
+        standin = []
+        for i, (path, _) in enumerate(cases[:100]):
+            p = os.path.join(tmp, f"P_SI_{i:05d}.uasset")
+            uejson_standin.write_package(p, make_root(color_modules=i % 5, filler_exports=3, filler_props=40, seed=i))
+            standin.append(p)
+        start = time.perf_counter()
+        for p in standin:
+            load_color_over_life_from_json(uejson_standin.export_package(p), streaming=True)
+        t_export = (time.perf_counter() - start) / len(standin) * len(cases)
+
+        try:
+            read_color_entries(standin[0])
+            unsupported = False
+        except UnsupportedPackage:
+            unsupported = True
+
+        print(f"{len(cases)} paquetes UE sintéticos")
+        print(f"  discrepancias        {len(mismatches)}")
+        print(f"  no soportado → UEJSON {'sí' if unsupported else 'NO'}")
+        print(f"  lector nativo        {t_native * 1000:8.1f} ms")
+        print(f"  exportar + json      {t_export * 1000:8.1f} ms (sustituto en proceso, extrapolado)")
+
+        if mismatches or not unsupported:
+            for path in mismatches[:10]:
+                print(f"    ✗ {os.path.basename(path)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
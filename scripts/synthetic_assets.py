@@ -0,0 +1,233 @@
+"""
+Generador de documentos UEJSON sintéticos para benchmarks.
+
+Imita la forma que produce UAssetAPI (Exports → Data → StructProperty
+ColorOverLife / StartColor → MinValueVec / MaxValueVec → FVector) y
+añade exports de relleno para simular assets grandes.
+"""
+import os
+import random
+import re
+import struct
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core import uejson_standin  # noqa: E402
+
+_STRUCT = "UAssetAPI.PropertyTypes.Structs.StructPropertyData, UAssetAPI"
+_VECTOR = "UAssetAPI.PropertyTypes.Structs.VectorPropertyData, UAssetAPI"
+_FLOAT = "UAssetAPI.PropertyTypes.Objects.FloatPropertyData, UAssetAPI"
+_EXPORT = "UAssetAPI.ExportTypes.NormalExport, UAssetAPI"
+
+
+def _vec_prop(name, rng):
+    return {
+        "$type": _STRUCT,
+        "StructType": "Vector",
+        "Name": name,
+        "Value": [
+            {
+                "$type": _VECTOR,
+                "Name": name,
+                "Value": {
+                    "$type": "UAssetAPI.UnrealTypes.FVector, UAssetAPI",
+                    "X": round(rng.random(), 6),
+                    "Y": round(rng.random(), 6),
+                    "Z": round(rng.random(), 6),
+                },
+            }
+        ],
+    }
+
+
+def _color_export(kind, index, rng):
+    prop = "ColorOverLife" if kind == "ParticleModuleColorOverLife" else "StartColor"
+    return {
+        "$type": _EXPORT,
+        "Data": [
+            {"$type": _FLOAT, "Name": "SpawnTime", "Value": 0.0},
+            {
+                "$type": _STRUCT,
+                "StructType": "RawDistributionVector",
+                "Name": prop,
+                "Value": [
+                    {"$type": _FLOAT, "Name": "MinValue", "Value": 0.0},
+                    {"$type": _FLOAT, "Name": "MaxValue", "Value": 1.0},
+                    _vec_prop("MinValueVec", rng),
+                    _vec_prop("MaxValueVec", rng),
+                ],
+            },
+        ],
+        "ObjectName": f"{kind}_{index}",
+        "ClassIndex": -3,
+        "OuterIndex": 1,
+    }
+
+
+def _filler_export(index, props, rng):
+    return {
+        "$type": _EXPORT,
+        "Data": [
+            {"$type": _FLOAT, "Name": f"Curve_{i}", "Value": rng.random()}
+            for i in range(props)
+        ],
+        "ObjectName": f"DistributionFloatConstantCurve_{index}",
+        "ClassIndex": -5,
+        "OuterIndex": 1,
+    }
+
+
+def make_root(color_modules=2, filler_exports=4, filler_props=16, seed=0):
+    rng = random.Random(seed)
+    exports = []
+
+    for i in range(color_modules):
+        kind = "ParticleModuleColorOverLife" if i % 2 == 0 else "ParticleModuleColor"
+        exports.append(_color_export(kind, i, rng))
+        for j in range(filler_exports):
+            exports.append(_filler_export(i * filler_exports + j, filler_props, rng))
+
+    return {
+        "Info": "Synthetic asset for ChromaFlux benchmarks",
+        "NameMap": [f"Name_{i}" for i in range(filler_props * 4)],
+        "Imports": [{"ObjectName": "ParticleModuleColorOverLife"}],
+        "Exports": exports,
+    }
+
+
+def write_standin_assets(folder, count, **kwargs):
+    """
+    Escribe `count` paquetes del sustituto (core.uejson_standin)
+    """
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+
+    for i in range(count):
+        path = os.path.join(folder, f"P_Synthetic_{i:05d}.uasset")
+        uejson_standin.write_package(path, make_root(seed=i, **kwargs))
+        paths.append(path)
+
+    return paths
+
+
+# =====================================================
+# Paquetes binarios al estilo UE (resumen + nombres + exports en .uasset,
+# propiedades etiquetadas en .uexp) para core.uasset_reader
+# =====================================================
+PACKAGE_TAG = 0x9E2A83C1
+_NUMBERED = re.compile(r"^(.*)_(0|[1-9]\d*)$")
+
+
+def _split_fname(text):
+    match = _NUMBERED.match(text)
+    if match:
+        return match.group(1), int(match.group(2)) + 1
+    return text, 0
+
+
+def _fstring(text):
+    raw = text.encode("ascii") + b"\0"
+    return struct.pack("<i", len(raw)) + raw
+
+
+class _UEWriter:
+    def __init__(self, ue5, doubles):
+        self.ue5 = ue5
+        self.doubles = doubles
+        self.names = {}
+
+    def fname(self, text):
+        base, number = _split_fname(text)
+        if base not in self.names:
+            self.names[base] = len(self.names)
+        return struct.pack("<ii", self.names[base], number)
+
+    def tag(self, name, prop_type, size, struct_name=None):
+        out = self.fname(name) + self.fname(prop_type) + struct.pack("<ii", size, 0)
+        if struct_name is not None:
+            out += self.fname(struct_name) + bytes(16)
+        return out + b"\0"  # HasPropertyGuid
+
+    def properties(self, items):
+        out = b""
+        for item in items:
+            kind = item["$type"]
+            if "FloatPropertyData" in kind:
+                out += self.tag(item["Name"], "FloatProperty", 4) + struct.pack("<f", item["Value"])
+            elif item.get("StructType") == "Vector":
+                vec = item["Value"][0]["Value"]
+                fmt = "<3d" if self.doubles else "<3f"
+                data = struct.pack(fmt, vec["X"], vec["Y"], vec["Z"])
+                out += self.tag(item["Name"], "StructProperty", len(data), "Vector") + data
+            else:
+                data = self.properties(item["Value"])
+                out += self.tag(item["Name"], "StructProperty", len(data), item["StructType"]) + data
+        return out + self.fname("None")
+
+
+def write_ue_package(uasset_path, root, ue5=False, doubles=None):
+    """
+    Escribe root (mismo esquema que make_root) como .uasset + .uexp UE4.27
+    (o UE5.1 con ue5=True, con vectores double por defecto)
+    """
+    doubles = ue5 if doubles is None else doubles
+    writer = _UEWriter(ue5, doubles)
+    writer.fname("None")
+
+    bodies = []
+    for export in root["Exports"]:
+        bodies.append(writer.properties(export["Data"]) + bytes(4))
+        writer.fname(export["ObjectName"])
+
+    # Tamaños fijos para calcular offsets antes de escribir
+    export_size = (4 * 4 + 8 + 4 + 16) + (3 * 4) + (0 if ue5 else 16) + (4 if ue5 else 0) \
+        + 4 + 4 + 4 + (4 if ue5 else 0) + 5 * 4
+
+    def summary(total, name_offset, export_offset):
+        out = struct.pack("<Ii", PACKAGE_TAG, -8 if ue5 else -7)
+        out += struct.pack("<ii", 864, 522)
+        if ue5:
+            out += struct.pack("<i", 1009)
+        out += struct.pack("<ii", 0, 0)                     # licensee, custom versions
+        out += struct.pack("<i", total)
+        out += _fstring("None")
+        out += struct.pack("<I", 0x80000000)                # PKG_FilterEditorOnly
+        out += struct.pack("<ii", len(writer.names), name_offset)
+        if ue5:
+            out += struct.pack("<ii", 0, 0)                 # soft object paths
+        out += struct.pack("<ii", 0, 0)                     # gatherable text
+        out += struct.pack("<ii", len(bodies), export_offset)
+        out += struct.pack("<iii", 0, 0, 0)                 # imports, depends
+        return out + bytes(64)
+
+    name_map = b"".join(_fstring(n) + bytes(4) for n in writer.names)
+    head = len(summary(0, 0, 0))
+    name_offset = head
+    export_offset = name_offset + len(name_map)
+    total = export_offset + export_size * len(bodies)
+
+    export_map = b""
+    offset = total
+    for export, body in zip(root["Exports"], bodies):
+        entry = struct.pack("<iiii", export.get("ClassIndex", 0), 0, 0, export.get("OuterIndex", 0))
+        entry += writer.fname(export["ObjectName"])
+        entry += struct.pack("<Iqq", 0, len(body), offset)
+        entry += struct.pack("<iii", 0, 0, 0)
+        if not ue5:
+            entry += bytes(16)                              # PackageGuid
+        else:
+            entry += struct.pack("<i", 0)                   # bIsInheritedInstance
+        entry += struct.pack("<Iii", 0, 0, 1)               # flags, editor game, asset
+        if ue5:
+            entry += struct.pack("<i", 0)                   # bGeneratePublicHash
+        entry += struct.pack("<5i", -1, 0, 0, 0, 0)
+        assert len(entry) == export_size
+        export_map += entry
+        offset += len(body)
+
+    with open(uasset_path, "wb") as f:
+        f.write(summary(total, name_offset, export_offset) + name_map + export_map)
+
+    with open(os.path.splitext(uasset_path)[0] + ".uexp", "wb") as f:
+        f.write(b"".join(bodies) + struct.pack("<I", PACKAGE_TAG))
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'language_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QLabel, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_LanguageDialog(object):
+    def setupUi(self, LanguageDialog):
+        if not LanguageDialog.objectName():
+            LanguageDialog.setObjectName(u"LanguageDialog")
+        LanguageDialog.setModal(True)
+        LanguageDialog.setMinimumWidth(320)
+        self.verticalLayout = QVBoxLayout(LanguageDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.lblTitle = QLabel(LanguageDialog)
+        self.lblTitle.setObjectName(u"lblTitle")
+        self.lblTitle.setAlignment(Qt.AlignCenter)
+
+        self.verticalLayout.addWidget(self.lblTitle)
+
+        self.lblSubtitle = QLabel(LanguageDialog)
+        self.lblSubtitle.setObjectName(u"lblSubtitle")
+        self.lblSubtitle.setAlignment(Qt.AlignCenter)
+
+        self.verticalLayout.addWidget(self.lblSubtitle)
+
+        self.spacerItem = QSpacerItem(20, 10, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout.addItem(self.spacerItem)
+
+        self.btnSpanish = QPushButton(LanguageDialog)
+        self.btnSpanish.setObjectName(u"btnSpanish")
+        self.btnSpanish.setMinimumHeight(36)
+
+        self.verticalLayout.addWidget(self.btnSpanish)
+
+        self.btnEnglish = QPushButton(LanguageDialog)
+        self.btnEnglish.setObjectName(u"btnEnglish")
+        self.btnEnglish.setMinimumHeight(36)
+
+        self.verticalLayout.addWidget(self.btnEnglish)
+
+
+        self.retranslateUi(LanguageDialog)
+
+        QMetaObject.connectSlotsByName(LanguageDialog)
+    # setupUi
+
+    def retranslateUi(self, LanguageDialog):
+        LanguageDialog.setWindowTitle(QCoreApplication.translate("LanguageDialog", u"Select Language", None))
+        self.lblTitle.setText(QCoreApplication.translate("LanguageDialog", u"<h3>Choose your language</h3>", None))
+        self.lblSubtitle.setText(QCoreApplication.translate("LanguageDialog", u"Elige tu idioma", None))
+        self.btnSpanish.setText(QCoreApplication.translate("LanguageDialog", u"\U0001f1ea\U0001f1f8 Espa\u00f1ol", None))
+        self.btnEnglish.setText(QCoreApplication.translate("LanguageDialog", u"\U0001f1fa\U0001f1f8 English", None))
+    # retranslateUi
+
+UI_SOURCE_SHA256 = "b978e4a1f8c3555b1d2d95c6abe39515880d23246ea970859b9c7ab39e675ca9"
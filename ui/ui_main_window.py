@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'main_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QHBoxLayout, QLabel,
+    QLineEdit, QMainWindow, QPlainTextEdit, QProgressBar,
+    QPushButton, QSizePolicy, QSpacerItem, QStackedLayout,
+    QTabWidget, QVBoxLayout, QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1000, 650)
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.mainVertical = QVBoxLayout(self.centralwidget)
+        self.mainVertical.setObjectName(u"mainVertical")
+        self.topBarLayout = QHBoxLayout()
+        self.topBarLayout.setObjectName(u"topBarLayout")
+        self.btnSelectFolder = QPushButton(self.centralwidget)
+        self.btnSelectFolder.setObjectName(u"btnSelectFolder")
+
+        self.topBarLayout.addWidget(self.btnSelectFolder)
+
+        self.btnSelectFiles = QPushButton(self.centralwidget)
+        self.btnSelectFiles.setObjectName(u"btnSelectFiles")
+
+        self.topBarLayout.addWidget(self.btnSelectFiles)
+
+        self.lblFileCount = QLabel(self.centralwidget)
+        self.lblFileCount.setObjectName(u"lblFileCount")
+
+        self.topBarLayout.addWidget(self.lblFileCount)
+
+        self.btnPickColor = QPushButton(self.centralwidget)
+        self.btnPickColor.setObjectName(u"btnPickColor")
+
+        self.topBarLayout.addWidget(self.btnPickColor)
+
+        self.lblChosenColor = QLabel(self.centralwidget)
+        self.lblChosenColor.setObjectName(u"lblChosenColor")
+        self.lblChosenColor.setMinimumSize(QSize(26, 26))
+        self.lblChosenColor.setMaximumSize(QSize(26, 26))
+        self.lblChosenColor.setStyleSheet(u"\n"
+"background-color: #ffffff;\n"
+"border: 1px solid #777;\n"
+"border-radius: 3px;\n"
+"         ")
+
+        self.topBarLayout.addWidget(self.lblChosenColor)
+
+        self.chkSelectAll = QCheckBox(self.centralwidget)
+        self.chkSelectAll.setObjectName(u"chkSelectAll")
+
+        self.topBarLayout.addWidget(self.chkSelectAll)
+
+        self.chkMin = QCheckBox(self.centralwidget)
+        self.chkMin.setObjectName(u"chkMin")
+
+        self.topBarLayout.addWidget(self.chkMin)
+
+        self.chkMax = QCheckBox(self.centralwidget)
+        self.chkMax.setObjectName(u"chkMax")
+
+        self.topBarLayout.addWidget(self.chkMax)
+
+        self.chkSyncMinMax = QCheckBox(self.centralwidget)
+        self.chkSyncMinMax.setObjectName(u"chkSyncMinMax")
+
+        self.topBarLayout.addWidget(self.chkSyncMinMax)
+
+        self.btnSupport = QPushButton(self.centralwidget)
+        self.btnSupport.setObjectName(u"btnSupport")
+        self.btnSupport.setMaximumWidth(32)
+
+        self.topBarLayout.addWidget(self.btnSupport)
+
+        self.btnSettings = QPushButton(self.centralwidget)
+        self.btnSettings.setObjectName(u"btnSettings")
+        self.btnSettings.setMaximumWidth(32)
+
+        self.topBarLayout.addWidget(self.btnSettings)
+
+        self.spacerItem = QSpacerItem(0, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.topBarLayout.addItem(self.spacerItem)
+
+
+        self.mainVertical.addLayout(self.topBarLayout)
+
+        self.contentLayout = QHBoxLayout()
+        self.contentLayout.setObjectName(u"contentLayout")
+        self.leftPanel = QWidget(self.centralwidget)
+        self.leftPanel.setObjectName(u"leftPanel")
+        self.leftPanel.setMinimumWidth(220)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.leftPanel.sizePolicy().hasHeightForWidth())
+        self.leftPanel.setSizePolicy(sizePolicy)
+        self.leftPanelLayout = QVBoxLayout(self.leftPanel)
+        self.leftPanelLayout.setObjectName(u"leftPanelLayout")
+        self.leftPanelLayout.setContentsMargins(0, 0, 0, 0)
+        self.dropZone = QLabel(self.leftPanel)
+        self.dropZone.setObjectName(u"dropZone")
+        self.dropZone.setMinimumHeight(160)
+        self.dropZone.setAlignment(Qt.AlignCenter)
+        self.dropZone.setStyleSheet(u"\n"
+"border: 2px dashed #666;\n"
+"color: #aaa;\n"
+"font-size: 14px;\n"
+"            ")
+
+        self.leftPanelLayout.addWidget(self.dropZone)
+
+        self.txtLog = QPlainTextEdit(self.leftPanel)
+        self.txtLog.setObjectName(u"txtLog")
+        self.txtLog.setReadOnly(True)
+
+        self.leftPanelLayout.addWidget(self.txtLog)
+
+
+        self.contentLayout.addWidget(self.leftPanel)
+
+        self.rightPanelLayout = QVBoxLayout()
+        self.rightPanelLayout.setObjectName(u"rightPanelLayout")
+        self.txtFilter = QLineEdit(self.centralwidget)
+        self.txtFilter.setObjectName(u"txtFilter")
+
+        self.rightPanelLayout.addWidget(self.txtFilter)
+
+        self.tabWidget = QTabWidget(self.centralwidget)
+        self.tabWidget.setObjectName(u"tabWidget")
+
+        self.rightPanelLayout.addWidget(self.tabWidget)
+
+
+        self.contentLayout.addLayout(self.rightPanelLayout)
+
+
+        self.mainVertical.addLayout(self.contentLayout)
+
+        self.progressStack = QStackedLayout()
+        self.progressStack.setObjectName(u"progressStack")
+        self.lblCenterPlaceholder = QLabel(self.centralwidget)
+        self.lblCenterPlaceholder.setObjectName(u"lblCenterPlaceholder")
+        self.lblCenterPlaceholder.setAlignment(Qt.AlignCenter)
+        self.lblCenterPlaceholder.setStyleSheet(u"\n"
+"color: #4FC3F7;\n"
+"font-size: 13px;\n"
+"font-weight: 500;\n"
+"     ")
+
+        self.progressStack.addWidget(self.lblCenterPlaceholder)
+
+        self.progressBar = QProgressBar(self.centralwidget)
+        self.progressBar.setObjectName(u"progressBar")
+
+        self.progressStack.addWidget(self.progressBar)
+
+
+        self.mainVertical.addLayout(self.progressStack)
+
+        self.bottomLayout = QHBoxLayout()
+        self.bottomLayout.setObjectName(u"bottomLayout")
+        self.btnApply = QPushButton(self.centralwidget)
+        self.btnApply.setObjectName(u"btnApply")
+
+        self.bottomLayout.addWidget(self.btnApply)
+
+        self.btnCancelLoad = QPushButton(self.centralwidget)
+        self.btnCancelLoad.setObjectName(u"btnCancelLoad")
+
+        self.bottomLayout.addWidget(self.btnCancelLoad)
+
+        self.spacerItem1 = QSpacerItem(0, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.bottomLayout.addItem(self.spacerItem1)
+
+        self.lblStatus = QLabel(self.centralwidget)
+        self.lblStatus.setObjectName(u"lblStatus")
+
+        self.bottomLayout.addWidget(self.lblStatus)
+
+
+        self.mainVertical.addLayout(self.bottomLayout)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+#if QT_CONFIG(tooltip)
+        self.btnSupport.setToolTip(QCoreApplication.translate("MainWindow", u"Support the project", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblCenterPlaceholder.setText(QCoreApplication.translate("MainWindow", u"Made by Alejandro (aweoopoe)", None))
+        pass
+    # retranslateUi
+
+UI_SOURCE_SHA256 = "d3c6acb8359bdf426b7b13e34f6ae63578f55dc3d74ceda910c0348e54c6a276"
@@ -1,14 +1,12 @@
-from collections import defaultdict
-from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem
-from PySide6.QtGui import QColor
-from PySide6.QtCore import Qt
-from widgets.colorpicker import ColorPickerDialog
-from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem, QAbstractItemView
 import os
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QStyledItemDelegate
-from PySide6.QtGui import QPen
-from PySide6.QtWidgets import QHeaderView
+from PySide6.QtCore import (
+    QAbstractItemModel, QEvent, QItemSelection, QItemSelectionModel,
+    QModelIndex, QPoint, Qt, QTimer, Signal,
+)
+from PySide6.QtGui import QBrush, QColor, QPen
+from PySide6.QtWidgets import (
+    QAbstractItemView, QHeaderView, QStyledItemDelegate, QTreeView,
+)
 
 
 class ColorCellDelegate(QStyledItemDelegate):
@@ -19,7 +17,7 @@ class ColorCellDelegate(QStyledItemDelegate):
             return
 
         # Obtener el brush real
-        brush = index.data(Qt.BackgroundRole)
+        brush = index.data(BACKGROUND_ROLE)
         if not brush:
             # No es una celda de color → no dibujamos nada especial
             super().paint(painter, option, index)
@@ -41,7 +39,7 @@ class ColorCellDelegate(QStyledItemDelegate):
         painter.drawRect(rect)
 
         # 🔹 Borde celeste si está seleccionada
-        if index.data(Qt.UserRole):
+        if index.data(HIGHLIGHT_ROLE):
             pen = QPen(QColor("#00E5FF"))
             pen.setWidth(2)
             painter.setPen(pen)
@@ -50,9 +48,472 @@ class ColorCellDelegate(QStyledItemDelegate):
         painter.restore()
 
 
-class ColorOverLifeTreeWidget(QTreeWidget):
+# =====================================================
+# Modelo: Asset → Módulo → filas MIN / MAX
+#
+# Solo los assets y los módulos tienen nodo (_Group); cada fila de color
+# es un ordinal (posición de la entry en el orden de carga). Cada
+# QModelIndex guarda en internalId el grupo PADRE, así que no hay
+# objetos por fila y todo se calcula al pintar.
+# =====================================================
+ROOT, ASSET, MODULE = 0, 1, 2
+
+COL_COLOR = 1
+COLUMN_COUNT = 5
+
+# data() se llama por cada celda pintada y leer Qt.<rol> cuesta una
+# búsqueda de atributo en PySide: se leen una vez aquí
+DISPLAY_ROLE = Qt.DisplayRole
+BACKGROUND_ROLE = Qt.BackgroundRole
+FOREGROUND_ROLE = Qt.ForegroundRole
+FONT_ROLE = Qt.FontRole
+ALIGNMENT_ROLE = Qt.TextAlignmentRole
+HIGHLIGHT_ROLE = Qt.UserRole
+ALIGN_CENTER = Qt.AlignCenter
+
+
+class _Group:
+    __slots__ = ("kind", "name", "parent", "row", "children", "by_name")
+
+    def __init__(self, kind, name, parent, row):
+        self.kind = kind
+        self.name = name
+        self.parent = parent      # gid del grupo padre
+        self.row = row            # fila dentro del padre
+        self.children = []        # gids (root/asset) u ordinales (módulo)
+        self.by_name = {}         # nombre del hijo → gid
+
+
+class ColorOverLifeModel(QAbstractItemModel):
+    """
+    Modelo sobre las entries cargadas. Los assets se exponen por tandas
+    con fetchMore a medida que la vista los necesita.
+    """
+
+    FETCH_BATCH = 512
+
+    # Qt pide flags de cada fila visible en cada maquetación
+    _ENTRY_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+    _GROUP_FLAGS = Qt.ItemIsEnabled
+
+    _ASSET_FG = QBrush(QColor("#E6E6E6"))
+    _MODULE_FG = QBrush(QColor("#B0B0B0"))
+    _MAX_FG = QBrush(QColor("#FF6A6A"))   # rojo suave
+    _MIN_FG = QBrush(QColor("#6AE6FF"))   # cyan suave
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = [""] * COLUMN_COUNT
+        self._asset_font = None
+        self._module_font = None
+        self._reset_groups()
+
+    def _reset_groups(self):
+        self._groups = [_Group(ROOT, "", -1, 0)]
+        self._root_fetched = 0
+        self._entries = []        # ordinal → ColorEntry
+        # Índices para las selecciones en bloque (se rehacen en cada carga)
+        self._ordinal_by_key = {}  # ColorEntry.key → ordinal
+        self._by_mode = {}        # "MIN"/"MAX" → set de ordinales
+        self._highlighted = set()
+        # Vista previa del color picker: color que muestran esos ordinales
+        # sin tocar sus entries
+        self._previewed = set()
+        self._preview_rgb = None
+
+    def set_fonts(self, asset_font, module_font):
+        self._asset_font = asset_font
+        self._module_font = module_font
+
+    def set_headers(self, headers):
+        self._headers = list(headers) + [""] * (COLUMN_COUNT - len(headers))
+        self.headerDataChanged.emit(Qt.Horizontal, 0, COLUMN_COUNT - 1)
+
+    # --------------------------------------------------
+    # Carga
+    # --------------------------------------------------
+    def clear(self):
+        self.beginResetModel()
+        self._reset_groups()
+        self.endResetModel()
+
+    def append_entries(self, min_entries, max_entries):
+        """
+        Añade entries sin reconstruir lo ya cargado. Los assets con el
+        mismo nombre se juntan, como antes en el QTreeWidget.
+        """
+        batches = {}
+        for e in min_entries + max_entries:
+            asset_name = os.path.splitext(os.path.basename(e.asset))[0]
+            batches.setdefault(asset_name, {}).setdefault(e.module, []).append(e)
+
+        root = self._groups[0]
+
+        for asset_name, modules in batches.items():
+            asset_gid = root.by_name.get(asset_name)
+            if asset_gid is None:
+                # Los assets nuevos quedan pendientes hasta el fetchMore
+                asset_gid = self._new_group(ASSET, asset_name, 0)
+                root.by_name[asset_name] = asset_gid
+
+            asset = self._groups[asset_gid]
+            exposed = asset.row < self._root_fetched
+
+            # Módulos nuevos: se crean ya con sus filas
+            new_modules = [m for m in modules if m not in asset.by_name]
+            if new_modules:
+                if exposed:
+                    first = len(asset.children)
+                    self.beginInsertRows(self.group_index(asset_gid), first, first + len(new_modules) - 1)
+                for module in new_modules:
+                    module_gid = self._new_group(MODULE, module, asset_gid)
+                    asset.by_name[module] = module_gid
+                    self._groups[module_gid].children.extend(self._add_entries(modules[module]))
+                if exposed:
+                    self.endInsertRows()
+
+            # Módulos existentes: filas al final
+            for module, entries in modules.items():
+                if module in new_modules:
+                    continue
+                module_gid = asset.by_name[module]
+                group = self._groups[module_gid]
+                rows = self._add_entries(entries)
+
+                if exposed:
+                    first = len(group.children)
+                    self.beginInsertRows(self.group_index(module_gid), first, first + len(rows) - 1)
+                    group.children.extend(rows)
+                    self.endInsertRows()
+                else:
+                    group.children.extend(rows)
+
+    def _add_entries(self, entries):
+        """
+        Registra entries (MAX antes que MIN) y devuelve sus ordinales
+        """
+        first = len(self._entries)
+        self._entries.extend(sorted(entries, key=lambda e: e.mode))
+        for ordinal in range(first, len(self._entries)):
+            entry = self._entries[ordinal]
+            self._ordinal_by_key[entry.key] = ordinal
+            self._by_mode.setdefault(entry.mode, set()).add(ordinal)
+        return list(range(first, len(self._entries)))
+
+    def _new_group(self, kind, name, parent_gid):
+        parent = self._groups[parent_gid]
+        gid = len(self._groups)
+        self._groups.append(_Group(kind, name, parent_gid, len(parent.children)))
+        parent.children.append(gid)
+        return gid
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._root_fetched < len(self._groups[0].children)
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        total = len(self._groups[0].children)
+        last = min(total, self._root_fetched + self.FETCH_BATCH) - 1
+        if last < self._root_fetched:
+            return
+        self.beginInsertRows(QModelIndex(), self._root_fetched, last)
+        self._root_fetched = last + 1
+        self.endInsertRows()
+
+    # --------------------------------------------------
+    # Navegación
+    # --------------------------------------------------
+    def _group_at(self, index):
+        """
+        gid del grupo que representa index (None si es una fila de color)
+        """
+        if not index.isValid():
+            return 0
+        owner = self._groups[index.internalId()]
+        if owner.kind == MODULE:
+            return None
+        return owner.children[index.row()]
+
+    def group_id(self, index):
+        return self._group_at(index) if index.isValid() else None
+
+    def group_index(self, gid, column=0):
+        group = self._groups[gid]
+        return self.createIndex(group.row, column, group.parent)
+
+    def ordinal(self, index):
+        """
+        Ordinal de la entry en index (None si es un asset o un módulo)
+        """
+        if not index.isValid():
+            return None
+        owner = self._groups[index.internalId()]
+        if owner.kind != MODULE:
+            return None
+        return owner.children[index.row()]
+
+    def entry(self, index):
+        ordinal = self.ordinal(index)
+        return None if ordinal is None else self._entries[ordinal]
+
+    def entry_at(self, ordinal):
+        return self._entries[ordinal]
+
+    def entry_count(self):
+        return len(self._entries)
+
+    def mode_ordinals(self, mode):
+        return self._by_mode.get(mode, frozenset())
+
+    def ordinals_of(self, keys):
+        """
+        Ordinales de las entries (por ColorEntry.key) que están cargadas
+        """
+        lookup = self._ordinal_by_key
+        return {lookup[k] for k in keys if k in lookup}
+
+    def module_rows(self, gid):
+        """
+        Ordinales de las filas del grupo gid (None si no es un módulo)
+        """
+        group = self._groups[gid]
+        return group.children if group.kind == MODULE else None
+
+    def index(self, row, column, parent=QModelIndex()):
+        gid = self._group_at(parent)
+        if gid is None or row < 0 or column < 0 or column >= COLUMN_COUNT:
+            return QModelIndex()
+        if row >= (self._root_fetched if gid == 0 else len(self._groups[gid].children)):
+            return QModelIndex()
+        return self.createIndex(row, column, gid)
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        pid = index.internalId()
+        if pid == 0:
+            return QModelIndex()
+        group = self._groups[pid]
+        return self.createIndex(group.row, 0, group.parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        gid = self._group_at(parent)
+        if gid is None:
+            return 0
+        if gid == 0:
+            return self._root_fetched
+        return len(self._groups[gid].children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return COLUMN_COUNT
+
+    def flags(self, index):
+        if index.isValid() and self._groups[index.internalId()].kind == MODULE:
+            return self._ENTRY_FLAGS
+        return self._GROUP_FLAGS
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section < COLUMN_COUNT:
+            return self._headers[section]
+        return None
+
+    # --------------------------------------------------
+    # Datos (calculados al pedirlos)
+    # --------------------------------------------------
+    def data(self, index, role=Qt.DisplayRole):
+        owner = self._groups[index.internalId()]
+        column = index.column()
+
+        if owner.kind == MODULE:
+            ordinal = owner.children[index.row()]
+            entry = self._entries[ordinal]
+
+            if self._preview_rgb is not None and ordinal in self._previewed:
+                r, g, b = self._preview_rgb
+            else:
+                r, g, b = entry.r, entry.g, entry.b
+
+            if role == DISPLAY_ROLE:
+                if column == 0:
+                    return entry.mode
+                if column == 2:
+                    return f"{r:.4f}"
+                if column == 3:
+                    return f"{g:.4f}"
+                if column == 4:
+                    return f"{b:.4f}"
+            elif role == BACKGROUND_ROLE and column == COL_COLOR:
+                return QColor.fromRgbF(r, g, b)
+            elif role == HIGHLIGHT_ROLE and column == COL_COLOR:
+                return ordinal in self._highlighted
+            elif role == FOREGROUND_ROLE and column == 0:
+                return self._MAX_FG if entry.mode == "MAX" else self._MIN_FG
+            elif role == ALIGNMENT_ROLE and column >= 2:
+                return ALIGN_CENTER
+            return None
+
+        if column != 0:
+            return None
+
+        group = self._groups[owner.children[index.row()]]
+        if role == DISPLAY_ROLE:
+            return f"Asset: {group.name}" if group.kind == ASSET else group.name
+        if role == FONT_ROLE:
+            return self._asset_font if group.kind == ASSET else self._module_font
+        if role == FOREGROUND_ROLE:
+            return self._ASSET_FG if group.kind == ASSET else self._MODULE_FG
+        return None
+
+    def update_highlighted(self, added, removed):
+        """
+        Ordinales cuya celda Color lleva el marco de selección
+        """
+        self._highlighted.difference_update(removed)
+        self._highlighted.update(added)
+
+    def begin_preview(self, ordinals):
+        self._previewed = set(ordinals)
+        self._preview_rgb = None
+
+    def set_preview_color(self, rgb):
+        self._preview_rgb = rgb
+
+    def previewed(self):
+        return self._previewed
+
+    def end_preview(self):
+        """
+        Quita la vista previa; devuelve los ordinales que la tenían
+        """
+        previewed = self._previewed
+        self._previewed = set()
+        self._preview_rgb = None
+        return previewed
+
+
+# =====================================================
+# Selección por ordinales
+#
+# Cada módulo es un padre distinto, así que una selección de miles de
+# filas son miles de QItemSelectionRange, y QItemSelectionModel compara
+# la selección vieja con la nueva rango a rango (cuadrático). Aquí la
+# selección es un set de ordinales: los clics, Shift, Ctrl y el arrastre
+# siguen llegando por select() con la semántica de Qt (Current, Toggle,
+# Clear...), pero el coste depende de las filas que cambian.
+# =====================================================
+class EntrySelectionModel(QItemSelectionModel):
+    # (ordinales añadidos, ordinales quitados)
+    entriesChanged = Signal(object, object)
+
+    def __init__(self, model, parent=None):
+        super().__init__(model, parent)
+        self._entry_model = model
+        self._selected = set()
+        # Filas que ha cambiado la operación en curso (rango de Shift o
+        # arrastre): un comando con Current la sustituye
+        self._current_changed = set()
+        # Antes del reset: las entries quitadas aún se pueden leer
+        model.modelAboutToBeReset.connect(self._on_model_reset)
+
+    def selected_ordinals(self):
+        return self._selected
+
+    def is_ordinal_selected(self, ordinal):
+        return ordinal in self._selected
+
+    def _ordinals_in(self, selection):
+        model = self._entry_model
+        ordinals = []
+        for selection_range in selection:
+            gid = model.group_id(selection_range.parent())
+            rows = None if gid is None else model.module_rows(gid)
+            if rows:
+                ordinals.extend(rows[selection_range.top():selection_range.bottom() + 1])
+        return ordinals
+
+    def select(self, selection, command):
+        if isinstance(selection, QModelIndex):
+            selection = QItemSelection(selection, selection) if selection.isValid() else QItemSelection()
+        self.select_ordinals(self._ordinals_in(selection), command)
+
+    def select_ordinals(self, ordinals, command):
+        """
+        Aplica command (flags de QItemSelectionModel) a los ordinales
+        """
+        command = QItemSelectionModel.SelectionFlag(command)
+        if command == QItemSelectionModel.NoUpdate:
+            return
+
+        # Todo con operaciones de set: changed acaba siendo la diferencia
+        # simétrica entre la selección de antes y la de después
+        ordinals = ordinals if isinstance(ordinals, (set, frozenset)) else set(ordinals)
+        selected = self._selected
+        changed = set()
+
+        # Current: deshacer la operación en curso antes de rehacerla
+        if command & QItemSelectionModel.Current:
+            selected ^= self._current_changed
+            changed ^= self._current_changed
+
+        if command & QItemSelectionModel.Clear:
+            changed ^= selected
+            selected.clear()
+
+        if command & QItemSelectionModel.Toggle:
+            flips = set(ordinals)
+        elif command & QItemSelectionModel.Select:
+            flips = ordinals - selected
+        elif command & QItemSelectionModel.Deselect:
+            flips = ordinals & selected
+        else:
+            flips = set()
+
+        selected ^= flips
+        changed ^= flips
+        self._current_changed = flips
+
+        if changed:
+            added = changed & selected
+            self.entriesChanged.emit(added, changed - added)
+
+    def clearSelection(self):
+        # La de Qt no hace nada si sus propios rangos están vacíos
+        self.select_ordinals((), QItemSelectionModel.Clear)
+
+    def clear(self):
+        self.clearSelection()
+        self.clearCurrentIndex()
+
+    def reset(self):
+        super().reset()
+        self._on_model_reset()
+
+    def _on_model_reset(self):
+        removed = self._selected
+        self._selected = set()
+        self._current_changed = set()
+        if removed:
+            self.entriesChanged.emit(set(), removed)
+
+
+class ColorOverLifeTreeView(QTreeView):
+    """
+    Vista del modelo. Los grupos se ven expandidos por defecto, pero se
+    expanden al entrar en pantalla: el coste de maquetar depende de lo
+    visible, no del tamaño del proyecto.
+    """
     colorChanged = Signal(object)
+    # Doble clic en una celda Color: quien aloja la vista elige el color
+    # (con set_entry_color)
+    colorEditRequested = Signal(object)
+    itemSelectionChanged = Signal()
+    # (entries añadidas, entries quitadas) en cada cambio de selección
+    selectionDelta = Signal(object, object)
 
+    _COLOR_ROLES = [DISPLAY_ROLE, BACKGROUND_ROLE]
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -74,45 +535,72 @@ class ColorOverLifeTreeWidget(QTreeWidget):
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setUniformRowHeights(True)
         self.setStyleSheet("""
-            QTreeWidget {
+            QTreeView {
                 background-color: #2B2B2B;
                 alternate-background-color: #2B2B2B;
             }
 
-            QTreeWidget::item {
+            QTreeView::item {
                 background-color: #2B2B2B;
                 height: 32px;
             }
 
-            QTreeWidget::item:selected {
+            QTreeView::item:selected {
                 background: transparent;
                 color: inherit;
             }
 
-            QTreeWidget::item:selected:active {
+            QTreeView::item:selected:active {
                 background: transparent;
             }
 
-            QTreeWidget::item:selected:!active {
+            QTreeView::item:selected:!active {
                 background: transparent;
             }
             """)
 
-        
+
         self.setIndentation(24)
 
-        self.itemDoubleClicked.connect(self._on_item_double_clicked)
+        # Estilo visual de Asset y Módulo
+        asset_font = self.font()
+        asset_font.setBold(True)
+        asset_font.setPointSize(asset_font.pointSize() + 1)
+        module_font = self.font()
+        module_font.setPointSize(11)
+        module_font.setBold(True)
+
+        self._model = ColorOverLifeModel(self)
+        self._model.set_fonts(asset_font, module_font)
+        self.setModel(self._model)
+
+        default_selection = self.selectionModel()
+        self._selection = EntrySelectionModel(self._model, self)
+        self.setSelectionModel(self._selection)
+        default_selection.deleteLater()
+        self._selection.entriesChanged.connect(self._on_entries_selection_changed)
+        self._ctrl_drag_flag = None
+
+        self.doubleClicked.connect(self._on_item_double_clicked)
         self.setSelectionBehavior(QAbstractItemView.SelectItems)
 
 
-        
-        self.setItemDelegateForColumn(1, ColorCellDelegate(self))
 
-        # Cada vez que cambia selección, marcamos SOLO la columna Color
-        self.itemSelectionChanged.connect(self._refresh_color_selection_highlight)
+        self.setItemDelegateForColumn(1, ColorCellDelegate(self))
 
         # Constantes de columnas
-        self.COL_COLOR = 1
+        self.COL_COLOR = COL_COLOR
+
+        # Grupos ya expandidos automáticamente (si el usuario los pliega,
+        # se quedan plegados)
+        self._auto_expanded = set()
+        self._expand_timer = QTimer(self)
+        self._expand_timer.setSingleShot(True)
+        self._expand_timer.timeout.connect(self._expand_visible)
+
+        self.verticalScrollBar().valueChanged.connect(self._schedule_expand)
+        self._model.rowsInserted.connect(self._schedule_expand)
+        self._model.modelReset.connect(self._schedule_expand)
 
 
 
@@ -121,50 +609,23 @@ class ColorOverLifeTreeWidget(QTreeWidget):
     # --------------------------------------------------
     def load_entries(self, min_entries, max_entries):
         self.clear()
+        self.append_entries(min_entries, max_entries)
 
-        tree = defaultdict(lambda: defaultdict(list))
+    def clear(self):
+        self._auto_expanded.clear()
+        self._model.clear()
 
-        for e in min_entries + max_entries:
-            asset_name = os.path.splitext(os.path.basename(e.asset))[0]
-            tree[asset_name][e.module].append(e)
-
-        for asset, modules in tree.items():
-            asset_item = QTreeWidgetItem([f"Asset: {asset}"])
-            asset_item.setFirstColumnSpanned(True)
-            asset_item.setFlags(Qt.ItemIsEnabled)
-            font = asset_item.font(0)
-            font.setBold(True)
-            font.setPointSize(font.pointSize() + 1)
-            asset_item.setFont(0, font)
-
-            asset_item.setForeground(0, QColor("#E6E6E6"))
-            self.addTopLevelItem(asset_item)
-
-
-            for module, entries in modules.items():
-                module_item = QTreeWidgetItem(asset_item)
-                module_item.setText(0, module)
-                module_item.setFlags(Qt.ItemIsEnabled)
-                
-
-                # Estilo visual de Módulo
-                font = module_item.font(0)
-                font.setPointSize(11)
-                font.setBold(True)
-                module_item.setFont(0, font)
-
-                module_item.setForeground(0, QColor("#B0B0B0"))
-
-                for entry in sorted(entries, key=lambda e: e.mode):
-                    self._add_entry_row(module_item, entry)
-
-                module_item.setExpanded(True)
+    # --------------------------------------------------
+    # Añadir entries sin reconstruir lo ya cargado
+    # --------------------------------------------------
+    def append_entries(self, min_entries, max_entries):
+        self._model.append_entries(min_entries, max_entries)
 
-            asset_item.setExpanded(True)
+        # Que la vista pida la siguiente tanda si queda hueco
+        self.updateGeometries()
 
     def set_headers(self, headers: list[str]):
-        self.setColumnCount(len(headers))
-        self.setHeaderLabels(headers)
+        self._model.set_headers(headers)
 
         header = self.header()
 
@@ -180,91 +641,175 @@ class ColorOverLifeTreeWidget(QTreeWidget):
         self.setColumnWidth(3, 70)  #G
         self.setColumnWidth(4, 70)  #B
 
-
-
     # --------------------------------------------------
-    # Crear fila MIN / MAX
+    # Expandido por defecto, bajo demanda
     # --------------------------------------------------
-    def _add_entry_row(self, parent, entry):
-        item = QTreeWidgetItem(parent)
-
-        for col in (2, 3, 4):
-            item.setTextAlignment(col, Qt.AlignCenter)
-        item.setText(0, entry.mode)
-        if entry.mode == "MAX":
-            item.setForeground(0, QColor("#FF6A6A"))  # rojo suave
-        else:
-            item.setForeground(0, QColor("#6AE6FF"))  # cyan suave
-
-        item.setText(2, f"{entry.r:.4f}")
-        item.setText(3, f"{entry.g:.4f}")
-        item.setText(4, f"{entry.b:.4f}")
-
-        color = QColor.fromRgbF(entry.r, entry.g, entry.b)
-        item.setBackground(1, color)
+    def _schedule_expand(self, *args):
+        self._expand_timer.start(0)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_expand()
+
+    def _expand_visible(self):
+        # Con una maquetación pendiente expand() solo lo apunta y los
+        # hijos no aparecerían debajo
+        self.executeDelayedItemsLayout()
+
+        for index in self._visible_rows():
+            gid = self._model.group_id(index)
+            if gid is not None and gid not in self._auto_expanded:
+                self._auto_expanded.add(gid)
+                # "Asset: ..." ocupa toda la fila (cada llamada rehace la
+                # maquetación, por eso solo con las filas visibles)
+                if not index.parent().isValid():
+                    self.setFirstColumnSpanned(index.row(), QModelIndex(), True)
+                self.expand(index)
+
+    def _visible_rows(self):
+        """
+        Índices (columna 0) de las filas en pantalla, de arriba abajo
+        """
+        index = self.indexAt(QPoint(0, 0))
+        bottom = self.viewport().height()
+
+        while index.isValid() and self.visualRect(index).top() <= bottom:
+            yield index
+            index = self.indexBelow(index)
 
-        # 🔑 Guardamos referencia REAL
-        item.entry = entry
-
-        item.setFlags(
-            Qt.ItemIsSelectable |
-            Qt.ItemIsEnabled
-        )
-
-    def _refresh_color_selection_highlight(self):
-        # Recorremos todo y limpiamos highlight anterior en columna Color
-        def walk(parent):
-            for i in range(parent.childCount()):
-                child = parent.child(i)
-                # Si es fila editable (tiene entry), limpiamos/ponemos highlight
-                if hasattr(child, "entry"):
-                    self._set_color_cell_selected(child, child.isSelected())
-                walk(child)
-
-        for i in range(self.topLevelItemCount()):
-            walk(self.topLevelItem(i))
-
-
-    def _set_color_cell_selected(self, item, selected: bool):
-        # NO tocar el color base nunca
-        entry = item.entry
-        base = QColor.fromRgbF(entry.r, entry.g, entry.b)
-        item.setBackground(self.COL_COLOR, base)
+    # --------------------------------------------------
+    # Selección
+    # --------------------------------------------------
+    def _on_entries_selection_changed(self, added, removed):
+        # El marco de la celda Color se actualiza con lo que cambió, sin
+        # recorrer el resto de filas
+        self._model.update_highlighted(added, removed)
+        self._repaint_color_cells(added | removed)
+
+        entry_at = self._model.entry_at
+        self.selectionDelta.emit([entry_at(o) for o in added], [entry_at(o) for o in removed])
+        self.itemSelectionChanged.emit()
+
+    def _repaint_color_cells(self, ordinals):
+        # Solo las celdas en pantalla; las demás se pintan al llegar
+        viewport = self.viewport()
+        for index in self._visible_rows():
+            if self._model.ordinal(index) in ordinals:
+                viewport.update(self.visualRect(index.siblingAtColumn(COL_COLOR)))
+
+    def _refresh_rows(self, ordinals):
+        """
+        dataChanged (columnas Color..B) de las filas en pantalla que están
+        en ordinals, por tramos de filas seguidas del mismo módulo
+        """
+        model = self._model
+        runs = []
+        for index in self._visible_rows():
+            if model.ordinal(index) not in ordinals:
+                continue
+            if runs and runs[-1][1].row() + 1 == index.row() and runs[-1][1].parent() == index.parent():
+                runs[-1][1] = index
+            else:
+                runs.append([index, index])
+
+        for first, last in runs:
+            model.dataChanged.emit(
+                first.siblingAtColumn(COL_COLOR),
+                last.siblingAtColumn(COLUMN_COUNT - 1),
+                self._COLOR_ROLES,
+            )
+
+    def clearSelection(self):
+        self._selection.clearSelection()
+
+    def selectAll(self):
+        # Ctrl+A: todas las entries, no solo las filas ya maquetadas
+        self._select_only(set(range(self._model.entry_count())))
+
+    def select_mode(self, mode):
+        self._select_only(self._model.mode_ordinals(mode))
+
+    def change_selection(self, select_keys, deselect_keys):
+        """
+        Marca / desmarca entries por ColorEntry.key (deshacer / rehacer)
+        """
+        model = self._model
+        self._selection.select_ordinals(model.ordinals_of(deselect_keys), QItemSelectionModel.Deselect)
+        self._selection.select_ordinals(model.ordinals_of(select_keys), QItemSelectionModel.Select)
+
+    def _select_only(self, ordinals):
+        # Selecciones en bloque: un solo select() con los ordinales del índice
+        self._selection.select_ordinals(ordinals, QItemSelectionModel.ClearAndSelect)
+
+    def selectionCommand(self, index, event=None):
+        command = super().selectionCommand(index, event)
+
+        # Con Ctrl, Qt decide si marcar o desmarcar con isSelected(), que
+        # no ve la selección por ordinales: se decide aquí
+        if event is None or not command & QItemSelectionModel.Toggle:
+            return command
+        if event.type() == QEvent.MouseButtonPress:
+            ordinal = self._model.ordinal(index)
+            selected = ordinal is not None and self._selection.is_ordinal_selected(ordinal)
+            self._ctrl_drag_flag = QItemSelectionModel.Deselect if selected else QItemSelectionModel.Select
+        elif event.type() != QEvent.MouseMove:
+            return command
+        if self._ctrl_drag_flag is None:
+            return command
+        return (command & ~QItemSelectionModel.Toggle) | self._ctrl_drag_flag
+
+    def selected_entries(self):
+        """
+        Entries seleccionadas, en orden de carga
+        """
+        model = self._model
+        return [model.entry_at(o) for o in sorted(self._selection.selected_ordinals())]
+
+    def select_entries(self, predicate):
+        """
+        Sustituye la selección por las entries que cumplen predicate
+        (también las de assets que la vista aún no ha pedido)
+        """
+        model = self._model
+        self._select_only({o for o in range(model.entry_count()) if predicate(model.entry_at(o))})
 
-        # Solo marcar si está seleccionado (para el delegate)
-        item.setData(self.COL_COLOR, Qt.UserRole, selected)
 
 
 
 
-    def _on_item_double_clicked(self, item, column):
-        if not hasattr(item, "entry"):
+    # --------------------------------------------------
+    # Vista previa del color picker
+    # --------------------------------------------------
+    def begin_preview(self, entries):
+        """
+        Las entries muestran el color de set_preview_color hasta
+        end_preview. Las entries no se tocan: cancelar no tiene nada que
+        restaurar.
+        """
+        self._model.begin_preview(self._model.ordinals_of(e.key for e in entries))
+
+    def set_preview_color(self, rgb):
+        # Solo se repintan las filas en pantalla, sea cual sea la selección
+        self._model.set_preview_color(rgb)
+        self._refresh_rows(self._model.previewed())
+
+    def end_preview(self):
+        self._refresh_rows(self._model.end_preview())
+
+    def _on_item_double_clicked(self, index):
+        entry = self._model.entry(index)
+        if entry is None:
             return
 
         # Solo si se hace doble click en la columna Color (columna 1)
-        if column != 1:
-            return
-
-        main = self.window()  # MainWindow
-        dlg = ColorPickerDialog(main.i18n, self)
-
-        if not dlg.exec():
-            return
-
-        new_color = dlg.get_color()
-        if not new_color:
+        if index.column() != 1:
             return
 
-        r, g, b = new_color
-        entry = item.entry
+        self.colorEditRequested.emit(entry)
 
+    def set_entry_color(self, entry, r, g, b):
         entry.set_rgb(r, g, b)
-
-        item.setText(2, f"{r:.4f}")
-        item.setText(3, f"{g:.4f}")
-        item.setText(4, f"{b:.4f}")
-        item.setBackground(1, QColor.fromRgbF(r, g, b))
+        self._refresh_rows(self._model.ordinals_of([entry.key]))
 
         # 🔔 avisar al main
         self.colorChanged.emit(entry)
-
@@ -1,8 +1,6 @@
-import os
 from PySide6.QtWidgets import QDialog, QPushButton, QApplication, QVBoxLayout
-from PySide6.QtGui import QColor
-from PySide6.QtCore import QFile
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtGui import QColor, QPainter
+from PySide6.QtCore import QEvent, QTimer, Signal
 from .wheel_widget import ColorWheelWidget
 from .sv_picker_widget import SVPickerWidget
 from .formats import (
@@ -22,6 +20,7 @@ from .formats import (
     hex_to_qcolor,
 )
 from .history import ColorHistoryWidget
+from widgets.ui_forms import setup_form
 
 
 
@@ -41,33 +40,25 @@ def parse_tuple(text, expected_len):
 
 
 class ColorPickerDialog(QDialog):
+    # (r, g, b) en 0–1, como mucho una vez por fotograma (vista previa)
+    colorPreviewed = Signal(object)
+
+    # Como mucho una actualización de la interfaz por fotograma
+    SYNC_INTERVAL_MS = 16
+
+    _PREVIEW_BORDER = QColor("#333")
+
+    # Color con el que se abre si nunca se aceptó ninguno
+    DEFAULT_COLOR = "#00F5FF"
+
     def __init__(self, i18n, parent=None):
         super().__init__(parent)
         self.i18n = i18n
-        
-        self.setWindowTitle(self.i18n.t("color_picker_title"))
-
-
 
         # ==============================
-        # Cargar UI (FORMA CORRECTA)
+        # Cargar UI (módulo compilado; .ui como respaldo)
         # ==============================
-        ui_path = os.path.join(os.path.dirname(__file__), "colorpicker_dialog.ui")
-        loader = QUiLoader()
-        ui_file = QFile(ui_path)
-
-        if not ui_file.open(QFile.ReadOnly):
-            raise RuntimeError(f"No se pudo abrir UI: {ui_path}")
-
-        ui = loader.load(ui_file)
-        ui_file.close()
-
-        if not ui:
-            raise RuntimeError("No se pudo cargar colorpicker_dialog.ui")
-
-        # 🔑 Anclar el layout del UI al QDialog real
-        self.setLayout(ui.layout())
-        self.ui = ui
+        self.ui = setup_form(self, "widgets/colorpicker/colorpicker_dialog.ui")
 
         # ==============================
         # SV Picker
@@ -84,9 +75,24 @@ class ColorPickerDialog(QDialog):
         # ==============================
         # Estado central del color
         # ==============================
-        self.color = QColor("#00F5FF")
-        self.previous_color = QColor("#000000")
-    
+        self.color = QColor(self.DEFAULT_COLOR)
+        self._previewed_color = QColor(self.color)
+        # Último color aceptado (inválido = ninguno; se ve en negro)
+        self.previous_color = QColor()
+
+        # La vista previa se pinta a mano: cambiar de color no re-parsea
+        # hojas de estilo
+        self._preview_colors = {}
+        for frame in (self.ui.previewCurrent, self.ui.previewPrevious):
+            frame.setStyleSheet("")
+            frame.installEventFilter(self)
+
+        # Los cambios que lleguen dentro de un fotograma se juntan
+        self._sync_pending = False
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(self.SYNC_INTERVAL_MS)
+        self._sync_timer.timeout.connect(self._on_sync_timer)
 
 
         # ==============================
@@ -103,9 +109,19 @@ class ColorPickerDialog(QDialog):
         
         self.colorWheel.hueChanged.connect(self._on_wheel_changed)
 
-        self.ui.btnCopy.setText(self.i18n.t("colorpicker_copy"))
-        self.ui.btnOk.setText(self.i18n.t("colorpicker_ok"))
-        self.ui.btnCancel.setText(self.i18n.t("colorpicker_cancel"))
+        # El historial recibe el color al soltar un arrastre (o al aceptar),
+        # no en cada paso intermedio
+        self.svPicker.dragFinished.connect(self._commit_history)
+        self.colorWheel.dragFinished.connect(self._commit_history)
+        for slider in (
+            self.ui.sliderHue,
+            self.ui.sliderSat,
+            self.ui.sliderVal,
+            self.ui.sliderAlpha,
+        ):
+            slider.sliderReleased.connect(self._commit_history)
+
+        self.apply_language()
         # ==============================
         # BOTONES (ESTO FALTABA)
         # ==============================
@@ -136,7 +152,7 @@ class ColorPickerDialog(QDialog):
         self.history.colorSelected.connect(self._on_history_selected)
 
         # Inicializar UI al final
-        self._sync_from_color()
+        self._flush_sync()
 
 
 
@@ -149,6 +165,67 @@ class ColorPickerDialog(QDialog):
 
     def get_hex(self):
         return qcolor_to_hex(self.color)
+
+    def accept(self):
+        self._flush_sync()
+        self._commit_history()
+        self.previous_color = QColor(self.color)
+        super().accept()
+
+    def apply_language(self):
+        # Después de cargar la UI (trae su propio título)
+        self.setWindowTitle(self.i18n.t("color_picker_title"))
+        self.ui.btnCopy.setText(self.i18n.t("colorpicker_copy"))
+        self.ui.btnOk.setText(self.i18n.t("colorpicker_ok"))
+        self.ui.btnCancel.setText(self.i18n.t("colorpicker_cancel"))
+
+    def reset(self):
+        """
+        Deja el diálogo listo para otro uso: vuelve al último color
+        aceptado y descarta lo que quedó a medias (cancelar incluido)
+        """
+        self._sync_timer.stop()
+        self._sync_pending = False
+
+        for edit in (self.ui.editRGB, self.ui.editHSV, self.ui.editHSL, self.ui.editCMYK):
+            self._mark_invalid(edit, False)
+
+        self.color = QColor(
+            self.previous_color if self.previous_color.isValid() else self.DEFAULT_COLOR
+        )
+        # El color de partida no es un cambio que previsualizar
+        self._previewed_color = QColor(self.color)
+        self._flush_sync()
+
+    def warm_up(self):
+        """
+        Adelanta lo que costaría la primera vez que se abre: estilos,
+        layout y los fondos de la rueda y el plano SV
+        """
+        self.ensurePolished()
+        self.resize(self.sizeHint())
+        self.layout().activate()
+        self.colorWheel._wheel_pixmap()
+        self.svPicker._plane()
+
+    def state(self) -> dict:
+        """
+        Lo que se guarda entre sesiones (historial y último color)
+        """
+        return {
+            "history": list(self.history.colors),
+            "previous": qcolor_to_hex(self.previous_color)
+            if self.previous_color.isValid()
+            else None,
+        }
+
+    def restore_state(self, state: dict):
+        self.history.set_colors(state.get("history") or [])
+
+        previous = state.get("previous")
+        if isinstance(previous, str) and is_valid_hex(previous):
+            self.previous_color = hex_to_qcolor(previous)
+        self.reset()
         # =====================================================
         # FORMATOS → COLOR (PASO 5)
         # =====================================================
@@ -293,10 +370,7 @@ class ColorPickerDialog(QDialog):
             h = 0
 
         self.color.setHsv(h, s, v, a)
-
-        # SOLO actualiza lo mínimo mientras arrastras
-        self.svPicker.set_sv(s, v)
-        self._update_preview()
+        self._sync_from_color()
 
 
 
@@ -305,30 +379,37 @@ class ColorPickerDialog(QDialog):
     # =====================================================
 
     def _sync_from_color(self):
+        # Al primer cambio se actualiza ya; los que lleguen en el mismo
+        # fotograma se vuelcan juntos al final
+        if self._sync_timer.isActive():
+            self._sync_pending = True
+            return
+        self._flush_sync()
+        self._sync_timer.start()
+
+    def _on_sync_timer(self):
+        if self._sync_pending:
+            self._sync_pending = False
+            self._flush_sync()
+            self._sync_timer.start()
+
+    def _flush_sync(self):
+        # Solo se toca lo que cambió
         h, s, v, a = self.color.getHsv()
         if h < 0:
             h = 0
 
-        for w in (
-            self.ui.sliderHue,
-            self.ui.sliderSat,
-            self.ui.sliderVal,
-            self.ui.sliderAlpha,
+        for slider, value in (
+            (self.ui.sliderHue, h),
+            (self.ui.sliderSat, s),
+            (self.ui.sliderVal, v),
+            (self.ui.sliderAlpha, a),
         ):
-            w.blockSignals(True)
-
-        self.ui.sliderHue.setValue(h)
-        self.ui.sliderSat.setValue(s)
-        self.ui.sliderVal.setValue(v)
-        self.ui.sliderAlpha.setValue(a)
-
-        for w in (
-            self.ui.sliderHue,
-            self.ui.sliderSat,
-            self.ui.sliderVal,
-            self.ui.sliderAlpha,
-    ):
-            w.blockSignals(False)
+            # El que se está arrastrando ya tiene su valor
+            if slider.value() != value and not slider.isSliderDown():
+                slider.blockSignals(True)
+                slider.setValue(value)
+                slider.blockSignals(False)
 
         wheel_h = (540 - h) % 360
         self.colorWheel.set_hue(wheel_h)
@@ -338,15 +419,23 @@ class ColorPickerDialog(QDialog):
 
         self._update_preview()
         self._update_hex_field()
-        formats = self.get_all_formats()
-        self.history.add_color(self.color)
 
+        for edit, value in (
+            (self.ui.editRGB, qcolor_to_rgb_255(self.color)),
+            (self.ui.editHSV, qcolor_to_hsv(self.color)),
+            (self.ui.editHSL, qcolor_to_hsl(self.color)),
+            (self.ui.editCMYK, qcolor_to_cmyk(self.color)),
+        ):
+            text = str(value)
+            if edit.text() != text:
+                edit.setText(text)
 
-        self.ui.editRGB.setText(str(formats["RGB_255"]))
-        self.ui.editHSV.setText(str(formats["HSV"]))
-        self.ui.editHSL.setText(str(formats["HSL"]))
-        self.ui.editCMYK.setText(str(formats["CMYK"]))
+        if self.color != self._previewed_color:
+            self._previewed_color = QColor(self.color)
+            self.colorPreviewed.emit(self.get_color())
 
+    def _commit_history(self):
+        self.history.add_color(self.color)
 
     def _on_history_selected(self, color: QColor):
         if color.isValid():
@@ -354,12 +443,24 @@ class ColorPickerDialog(QDialog):
             self._sync_from_color()
 
     def _update_preview(self):
-        self.ui.previewCurrent.setStyleSheet(
-            f"background-color: {qcolor_to_hex(self.color)};"
-        )
-        self.ui.previewPrevious.setStyleSheet(
-            f"background-color: {qcolor_to_hex(self.previous_color)};"
-        )
+        for frame, color in (
+            (self.ui.previewCurrent, self.color),
+            (self.ui.previewPrevious, self.previous_color),
+        ):
+            opaque = QColor(color.rgb())
+            if self._preview_colors.get(frame.objectName()) != opaque:
+                self._preview_colors[frame.objectName()] = opaque
+                frame.update()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and obj.objectName() in self._preview_colors:
+            painter = QPainter(obj)
+            rect = obj.rect().adjusted(0, 0, -1, -1)
+            painter.fillRect(rect, self._preview_colors[obj.objectName()])
+            painter.setPen(self._PREVIEW_BORDER)
+            painter.drawRect(rect)
+            return True
+        return super().eventFilter(obj, event)
 
     def _update_hex_field(self):
         hex_color = qcolor_to_hex(self.color)
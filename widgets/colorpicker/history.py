@@ -1,6 +1,35 @@
-from PySide6.QtWidgets import QWidget, QPushButton, QHBoxLayout
-from PySide6.QtGui import QColor
-from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget, QAbstractButton, QHBoxLayout
+from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtCore import Qt, Signal
+from .utils import is_valid_hex
+
+
+class _HistorySwatch(QAbstractButton):
+    """
+    Botón de color pintado a mano: cambiar el color no re-parsea una
+    hoja de estilo
+    """
+
+    _BORDER = QColor("#333")
+    _HOVER = QColor("#00f5ff")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(22, 22)
+        self.setAttribute(Qt.WA_Hover)  # repinta al entrar / salir
+        self.color = QColor()
+
+    def set_color(self, color: QColor):
+        if color != self.color:
+            self.color = QColor(color)
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(self._HOVER if self.underMouse() else self._BORDER, 1))
+        painter.setBrush(self.color)
+        painter.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), 4, 4)
 
 
 class ColorHistoryWidget(QWidget):
@@ -15,11 +44,22 @@ class ColorHistoryWidget(QWidget):
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(6)
 
+        # Botones fijos; al añadir un color solo se repintan
+        self._swatches = []
+        for i in range(max_items):
+            swatch = _HistorySwatch(self)
+            swatch.clicked.connect(lambda _=False, i=i: self._on_swatch_clicked(i))
+            swatch.hide()
+            self.layout.addWidget(swatch)
+            self._swatches.append(swatch)
+
     def add_color(self, color: QColor):
         if not color.isValid():
             return
 
         hex_color = color.name().upper()
+        if self.colors and self.colors[0] == hex_color:
+            return
 
         # evitar duplicados
         if hex_color in self.colors:
@@ -28,30 +68,25 @@ class ColorHistoryWidget(QWidget):
         self.colors.insert(0, hex_color)
         self.colors = self.colors[: self.max_items]
 
-        self._rebuild()
-
-    def _rebuild(self):
-        while self.layout.count():
-            item = self.layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        for hex_color in self.colors:
-            btn = QPushButton()
-            btn.setFixedSize(22, 22)
-            btn.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background: {hex_color};
-                    border-radius: 4px;
-                    border: 1px solid #333;
-                }}
-                QPushButton:hover {{
-                    border: 1px solid #00f5ff;
-                }}
-                """
-            )
-            btn.clicked.connect(
-                lambda _, c=hex_color: self.colorSelected.emit(QColor(c))
-            )
-            self.layout.addWidget(btn)
+        self._refresh()
+
+    def set_colors(self, colors):
+        """
+        Sustituye el historial (p. ej. el guardado en la sesión anterior)
+        """
+        self.colors = [
+            c.upper() for c in colors if isinstance(c, str) and is_valid_hex(c)
+        ][: self.max_items]
+        self._refresh()
+
+    def _refresh(self):
+        for i, swatch in enumerate(self._swatches):
+            if i < len(self.colors):
+                swatch.set_color(QColor(self.colors[i]))
+                swatch.show()
+            else:
+                swatch.hide()
+
+    def _on_swatch_clicked(self, i):
+        if i < len(self.colors):
+            self.colorSelected.emit(QColor(self.colors[i]))
@@ -1,10 +1,59 @@
+from collections import OrderedDict
+
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QPainter, QColor
-from PySide6.QtCore import Qt, QPoint, Signal
+from PySide6.QtGui import QPainter, QColor, QImage, QLinearGradient
+from PySide6.QtCore import Qt, QPoint, QRect, Signal
+
+try:
+    import numpy as np
+except ImportError:  # opcional: sin numpy se pinta con degradados
+    np = None
+
+
+def render_sv_plane(hue: int, width: int, height: int) -> QImage:
+    """
+    Plano saturación (x) / valor (y) de un tono, en píxeles de dispositivo
+    """
+    hue_color = QColor.fromHsv(hue % 360, 255, 255)
+
+    if np is not None:
+        # HSV → RGB con el tono fijo: v * ((1 - s) + s * color_del_tono)
+        s = np.arange(width, dtype=np.float32) / width
+        v = 1.0 - np.arange(height, dtype=np.float32) / height
+        tone = np.array(
+            [hue_color.redF(), hue_color.greenF(), hue_color.blueF()], dtype=np.float32
+        )
+        rgb = (1.0 - s)[:, None] + s[:, None] * tone            # (w, 3)
+        pixels = (v[:, None, None] * rgb[None, :, :] * 255.0 + 0.5).astype(np.uint8)
+
+        image = QImage(pixels.tobytes(), width, height, width * 3, QImage.Format_RGB888)
+        return image.copy()  # que la imagen no dependa del buffer temporal
+
+    # Sin numpy: blanco → tono en horizontal y transparente → negro encima
+    image = QImage(width, height, QImage.Format_RGB32)
+    painter = QPainter(image)
+
+    horizontal = QLinearGradient(0, 0, width, 0)
+    horizontal.setColorAt(0, Qt.white)
+    horizontal.setColorAt(1, hue_color)
+    painter.fillRect(0, 0, width, height, horizontal)
+
+    vertical = QLinearGradient(0, 0, 0, height)
+    vertical.setColorAt(0, QColor(0, 0, 0, 0))
+    vertical.setColorAt(1, Qt.black)
+    painter.fillRect(0, 0, width, height, vertical)
+
+    painter.end()
+    return image
 
 
 class SVPickerWidget(QWidget):
     colorChanged = Signal(int, int)  # s, v
+    dragFinished = Signal()
+
+    CURSOR_RADIUS = 6
+    # Planos recientes (p. ej. al ir y volver con el tono)
+    CACHE_SIZE = 8
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -16,35 +65,63 @@ class SVPickerWidget(QWidget):
 
         self._dragging = False
 
+        # (tono, ancho, alto, devicePixelRatio) → QImage
+        self._planes = OrderedDict()
+
     def set_hue(self, h):
+        if h == self.hue:
+            return
         self.hue = h
         self.update()
 
     def set_sv(self, s, v):
+        if (s, v) == (self.sat, self.val):
+            return
+        old = self._cursor_rect()
         self.sat = s
         self.val = v
-        self.update()
+        self._update_cursor(old)
+
+    def _plane(self) -> QImage:
+        dpr = self.devicePixelRatioF()
+        width = max(1, round(self.width() * dpr))
+        height = max(1, round(self.height() * dpr))
+        key = (self.hue, width, height, dpr)
+
+        image = self._planes.get(key)
+        if image is None:
+            image = render_sv_plane(self.hue, width, height)
+            image.setDevicePixelRatio(dpr)
+            self._planes[key] = image
+            if len(self._planes) > self.CACHE_SIZE:
+                self._planes.popitem(last=False)
+        else:
+            self._planes.move_to_end(key)
+        return image
+
+    def _cursor_pos(self) -> QPoint:
+        cx = int((self.sat / 255) * self.width())
+        cy = int((1 - self.val / 255) * self.height())
+        return QPoint(cx, cy)
+
+    def _cursor_rect(self) -> QRect:
+        r = self.CURSOR_RADIUS + 2  # grosor del trazo y antialias
+        return QRect(self._cursor_pos() - QPoint(r, r), self._cursor_pos() + QPoint(r, r))
+
+    def _update_cursor(self, old_rect: QRect):
+        # Mover el cursor solo repinta donde estaba y donde está
+        self.update(old_rect.united(self._cursor_rect()))
 
     def paintEvent(self, event):
         painter = QPainter(self)
 
-        # Fondo HSV
-        for x in range(self.width()):
-            for y in range(self.height()):
-                s = int((x / self.width()) * 255)
-                v = int((1 - y / self.height()) * 255)
-                c = QColor()
-                c.setHsv(self.hue, s, v)
-                painter.setPen(c)
-                painter.drawPoint(x, y)
+        # Fondo HSV (cacheado: el cursor solo vuelve a copiarlo)
+        painter.drawImage(self.rect(), self._plane())
 
         # Cursor
-        cx = int((self.sat / 255) * self.width())
-        cy = int((1 - self.val / 255) * self.height())
-
         painter.setPen(Qt.white)
         painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(QPoint(cx, cy), 6, 6)
+        painter.drawEllipse(self._cursor_pos(), self.CURSOR_RADIUS, self.CURSOR_RADIUS)
 
     def mousePressEvent(self, event):
         self._dragging = True
@@ -55,7 +132,9 @@ class SVPickerWidget(QWidget):
             self._update_from_pos(event.position().toPoint())
 
     def mouseReleaseEvent(self, event):
-        self._dragging = False
+        if self._dragging:
+            self._dragging = False
+            self.dragFinished.emit()
 
     def _update_from_pos(self, pos):
         x = max(0, min(pos.x(), self.width()))
@@ -64,8 +143,9 @@ class SVPickerWidget(QWidget):
         s = int((x / self.width()) * 255)
         v = int((1 - y / self.height()) * 255)
 
+        old = self._cursor_rect()
         self.sat = s
         self.val = v
 
         self.colorChanged.emit(s, v)
-        self.update()
+        self._update_cursor(old)
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'colorpicker_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.8.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QFrame,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QSlider, QSpacerItem,
+    QVBoxLayout, QWidget)
+class Ui_ColorPickerDialog(object):
+    def setupUi(self, ColorPickerDialog):
+        if not ColorPickerDialog.objectName():
+            ColorPickerDialog.setObjectName(u"ColorPickerDialog")
+        self.verticalLayout = QVBoxLayout(ColorPickerDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.hboxLayout = QHBoxLayout()
+        self.hboxLayout.setObjectName(u"hboxLayout")
+        self.hboxLayout1 = QHBoxLayout()
+        self.hboxLayout1.setObjectName(u"hboxLayout1")
+        self.label = QLabel(ColorPickerDialog)
+        self.label.setObjectName(u"label")
+
+        self.hboxLayout1.addWidget(self.label)
+
+        self.editHex = QLineEdit(ColorPickerDialog)
+        self.editHex.setObjectName(u"editHex")
+
+        self.hboxLayout1.addWidget(self.editHex)
+
+        self.btnCopy = QPushButton(ColorPickerDialog)
+        self.btnCopy.setObjectName(u"btnCopy")
+
+        self.hboxLayout1.addWidget(self.btnCopy)
+
+
+        self.hboxLayout.addLayout(self.hboxLayout1)
+
+        self.presetLayout = QHBoxLayout()
+        self.presetLayout.setObjectName(u"presetLayout")
+
+        self.hboxLayout.addLayout(self.presetLayout)
+
+
+        self.verticalLayout.addLayout(self.hboxLayout)
+
+        self.hboxLayout2 = QHBoxLayout()
+        self.hboxLayout2.setObjectName(u"hboxLayout2")
+        self.wheelPlaceholder = QWidget(ColorPickerDialog)
+        self.wheelPlaceholder.setObjectName(u"wheelPlaceholder")
+        self.wheelPlaceholder.setMinimumSize(QSize(200, 200))
+        self.vboxLayout = QVBoxLayout(self.wheelPlaceholder)
+        self.vboxLayout.setObjectName(u"vboxLayout")
+        self.vboxLayout.setContentsMargins(0, 0, 0, 0)
+
+        self.hboxLayout2.addWidget(self.wheelPlaceholder)
+
+        self.vboxLayout1 = QVBoxLayout()
+        self.vboxLayout1.setObjectName(u"vboxLayout1")
+        self.previewPrevious = QFrame(ColorPickerDialog)
+        self.previewPrevious.setObjectName(u"previewPrevious")
+        self.previewPrevious.setMinimumHeight(90)
+
+        self.vboxLayout1.addWidget(self.previewPrevious)
+
+        self.previewCurrent = QFrame(ColorPickerDialog)
+        self.previewCurrent.setObjectName(u"previewCurrent")
+        self.previewCurrent.setMinimumHeight(90)
+
+        self.vboxLayout1.addWidget(self.previewCurrent)
+
+
+        self.hboxLayout2.addLayout(self.vboxLayout1)
+
+
+        self.verticalLayout.addLayout(self.hboxLayout2)
+
+        self.hboxLayout3 = QHBoxLayout()
+        self.hboxLayout3.setObjectName(u"hboxLayout3")
+        self.svPickerPlaceholder = QWidget(ColorPickerDialog)
+        self.svPickerPlaceholder.setObjectName(u"svPickerPlaceholder")
+        self.svPickerPlaceholder.setMinimumSize(QSize(220, 220))
+        self.vboxLayout2 = QVBoxLayout(self.svPickerPlaceholder)
+        self.vboxLayout2.setObjectName(u"vboxLayout2")
+        self.vboxLayout2.setContentsMargins(0, 0, 0, 0)
+
+        self.hboxLayout3.addWidget(self.svPickerPlaceholder)
+
+        self.formatGroup = QGroupBox(ColorPickerDialog)
+        self.formatGroup.setObjectName(u"formatGroup")
+        self.formLayout = QFormLayout(self.formatGroup)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label1 = QLabel(self.formatGroup)
+        self.label1.setObjectName(u"label1")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label1)
+
+        self.editRGB = QLineEdit(self.formatGroup)
+        self.editRGB.setObjectName(u"editRGB")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.editRGB)
+
+        self.label2 = QLabel(self.formatGroup)
+        self.label2.setObjectName(u"label2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label2)
+
+        self.editHSV = QLineEdit(self.formatGroup)
+        self.editHSV.setObjectName(u"editHSV")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.editHSV)
+
+        self.label3 = QLabel(self.formatGroup)
+        self.label3.setObjectName(u"label3")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label3)
+
+        self.editHSL = QLineEdit(self.formatGroup)
+        self.editHSL.setObjectName(u"editHSL")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.editHSL)
+
+        self.label4 = QLabel(self.formatGroup)
+        self.label4.setObjectName(u"label4")
+
+        self.formLayout.setWidget(3, QFormLayout.LabelRole, self.label4)
+
+        self.editCMYK = QLineEdit(self.formatGroup)
+        self.editCMYK.setObjectName(u"editCMYK")
+
+        self.formLayout.setWidget(3, QFormLayout.FieldRole, self.editCMYK)
+
+
+        self.hboxLayout3.addWidget(self.formatGroup)
+
+
+        self.verticalLayout.addLayout(self.hboxLayout3)
+
+        self.hboxLayout4 = QHBoxLayout()
+        self.hboxLayout4.setObjectName(u"hboxLayout4")
+        self.formLayout1 = QFormLayout()
+        self.formLayout1.setObjectName(u"formLayout1")
+        self.label5 = QLabel(ColorPickerDialog)
+        self.label5.setObjectName(u"label5")
+
+        self.formLayout1.setWidget(0, QFormLayout.LabelRole, self.label5)
+
+        self.sliderHue = QSlider(ColorPickerDialog)
+        self.sliderHue.setObjectName(u"sliderHue")
+        self.sliderHue.setOrientation(Qt.Horizontal)
+        self.sliderHue.setMaximum(359)
+
+        self.formLayout1.setWidget(0, QFormLayout.FieldRole, self.sliderHue)
+
+        self.label6 = QLabel(ColorPickerDialog)
+        self.label6.setObjectName(u"label6")
+
+        self.formLayout1.setWidget(1, QFormLayout.LabelRole, self.label6)
+
+        self.sliderSat = QSlider(ColorPickerDialog)
+        self.sliderSat.setObjectName(u"sliderSat")
+        self.sliderSat.setOrientation(Qt.Horizontal)
+        self.sliderSat.setMaximum(255)
+
+        self.formLayout1.setWidget(1, QFormLayout.FieldRole, self.sliderSat)
+
+        self.label7 = QLabel(ColorPickerDialog)
+        self.label7.setObjectName(u"label7")
+
+        self.formLayout1.setWidget(2, QFormLayout.LabelRole, self.label7)
+
+        self.sliderVal = QSlider(ColorPickerDialog)
+        self.sliderVal.setObjectName(u"sliderVal")
+        self.sliderVal.setOrientation(Qt.Horizontal)
+        self.sliderVal.setMaximum(255)
+
+        self.formLayout1.setWidget(2, QFormLayout.FieldRole, self.sliderVal)
+
+        self.label8 = QLabel(ColorPickerDialog)
+        self.label8.setObjectName(u"label8")
+
+        self.formLayout1.setWidget(3, QFormLayout.LabelRole, self.label8)
+
+        self.sliderAlpha = QSlider(ColorPickerDialog)
+        self.sliderAlpha.setObjectName(u"sliderAlpha")
+        self.sliderAlpha.setOrientation(Qt.Horizontal)
+        self.sliderAlpha.setMaximum(255)
+        self.sliderAlpha.setValue(255)
+
+        self.formLayout1.setWidget(3, QFormLayout.FieldRole, self.sliderAlpha)
+
+
+        self.hboxLayout4.addLayout(self.formLayout1)
+
+        self.historyPlaceholder = QWidget(ColorPickerDialog)
+        self.historyPlaceholder.setObjectName(u"historyPlaceholder")
+        self.historyPlaceholder.setMinimumWidth(160)
+        self.vboxLayout3 = QVBoxLayout(self.historyPlaceholder)
+        self.vboxLayout3.setObjectName(u"vboxLayout3")
+        self.vboxLayout3.setContentsMargins(0, 0, 0, 0)
+
+        self.hboxLayout4.addWidget(self.historyPlaceholder)
+
+
+        self.verticalLayout.addLayout(self.hboxLayout4)
+
+        self.hboxLayout5 = QHBoxLayout()
+        self.hboxLayout5.setObjectName(u"hboxLayout5")
+        self.spacerItem = QSpacerItem(0, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.hboxLayout5.addItem(self.spacerItem)
+
+        self.btnCancel = QPushButton(ColorPickerDialog)
+        self.btnCancel.setObjectName(u"btnCancel")
+
+        self.hboxLayout5.addWidget(self.btnCancel)
+
+        self.btnOk = QPushButton(ColorPickerDialog)
+        self.btnOk.setObjectName(u"btnOk")
+
+        self.hboxLayout5.addWidget(self.btnOk)
+
+
+        self.verticalLayout.addLayout(self.hboxLayout5)
+
+
+        self.retranslateUi(ColorPickerDialog)
+
+        QMetaObject.connectSlotsByName(ColorPickerDialog)
+    # setupUi
+
+    def retranslateUi(self, ColorPickerDialog):
+        ColorPickerDialog.setWindowTitle(QCoreApplication.translate("ColorPickerDialog", u"Color Picker", None))
+        self.label.setText(QCoreApplication.translate("ColorPickerDialog", u"HEX", None))
+        self.editHex.setPlaceholderText(QCoreApplication.translate("ColorPickerDialog", u"#00F5FF", None))
+        self.btnCopy.setText(QCoreApplication.translate("ColorPickerDialog", u"Copy", None))
+        self.previewPrevious.setStyleSheet(QCoreApplication.translate("ColorPickerDialog", u"background:#000;border:1px solid #333;", None))
+        self.previewCurrent.setStyleSheet(QCoreApplication.translate("ColorPickerDialog", u"background:#000;border:1px solid #333;", None))
+        self.formatGroup.setTitle(QCoreApplication.translate("ColorPickerDialog", u"Formats", None))
+        self.label1.setText(QCoreApplication.translate("ColorPickerDialog", u"RGB", None))
+        self.label2.setText(QCoreApplication.translate("ColorPickerDialog", u"HSV", None))
+        self.label3.setText(QCoreApplication.translate("ColorPickerDialog", u"HSL", None))
+        self.label4.setText(QCoreApplication.translate("ColorPickerDialog", u"CMYK", None))
+        self.label5.setText(QCoreApplication.translate("ColorPickerDialog", u"Hue", None))
+        self.label6.setText(QCoreApplication.translate("ColorPickerDialog", u"Saturation", None))
+        self.label7.setText(QCoreApplication.translate("ColorPickerDialog", u"Value", None))
+        self.label8.setText(QCoreApplication.translate("ColorPickerDialog", u"Alpha", None))
+        self.btnCancel.setText(QCoreApplication.translate("ColorPickerDialog", u"Cancel", None))
+        self.btnOk.setText(QCoreApplication.translate("ColorPickerDialog", u"OK", None))
+    # retranslateUi
+
+UI_SOURCE_SHA256 = "eb48eba14f881923d7ea8a05f069796ebd2b932e6481399fdcd2be5e74c8c0a7"
@@ -1,28 +1,51 @@
 import math
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QPainter, QColor, QConicalGradient
-from PySide6.QtCore import Qt, QPointF, Signal
+from PySide6.QtGui import QPainter, QColor, QConicalGradient, QPixmap
+from PySide6.QtCore import Qt, QPointF, QRect, QRectF, Signal
 
 
 class ColorWheelWidget(QWidget):
     hueChanged = Signal(int)  # 0–359
+    dragFinished = Signal()
+
+    CURSOR_RADIUS = 6
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(180, 180)
         self.hue = 0
 
+        # La rueda solo depende del tamaño: se pinta una vez
+        self._wheel = None
+        self._wheel_key = None
+
     def set_hue(self, h: int):
-        self.hue = h % 360
-        self.update()
+        h %= 360
+        if h == self.hue:
+            return
+        old = self._cursor_rect()
+        self.hue = h
+        self._update_cursor(old)
+
+    def _radius(self) -> int:
+        rect = self.rect()
+        return min(rect.width(), rect.height()) // 2 - 6
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def _wheel_pixmap(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if self._wheel_key == key:
+            return self._wheel
+
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        rect = self.rect()
-        center = rect.center()
-        radius = min(rect.width(), rect.height()) // 2 - 6
+        center = self.rect().center()
+        radius = self._radius()
 
         # Rueda HSV
         gradient = QConicalGradient(center, -90)
@@ -34,15 +57,39 @@ class ColorWheelWidget(QWidget):
         painter.setBrush(gradient)
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(center, radius, radius)
+        painter.end()
 
-        # Cursor
+        self._wheel = pixmap
+        self._wheel_key = key
+        return pixmap
+
+    def _cursor_center(self) -> QPointF:
+        center = self.rect().center()
+        radius = self._radius()
         angle = math.radians(self.hue - 90)
-        cx = center.x() + math.cos(angle) * radius
-        cy = center.y() + math.sin(angle) * radius
+        return QPointF(
+            center.x() + math.cos(angle) * radius,
+            center.y() + math.sin(angle) * radius,
+        )
+
+    def _cursor_rect(self) -> QRect:
+        r = self.CURSOR_RADIUS + 2  # trazo y antialias
+        c = self._cursor_center()
+        return QRectF(c.x() - r, c.y() - r, 2 * r, 2 * r).toAlignedRect()
+
+    def _update_cursor(self, old_rect: QRect):
+        # Solo se repinta donde estaba el cursor y donde está ahora
+        self.update(old_rect.united(self._cursor_rect()))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._wheel_pixmap())
 
+        # Cursor
+        painter.setRenderHint(QPainter.Antialiasing)
         painter.setBrush(Qt.white)
         painter.setPen(Qt.black)
-        painter.drawEllipse(QPointF(cx, cy), 6, 6)
+        painter.drawEllipse(self._cursor_center(), self.CURSOR_RADIUS, self.CURSOR_RADIUS)
 
     def mousePressEvent(self, event):
         self._update_from_pos(event.position())
@@ -51,6 +98,10 @@ class ColorWheelWidget(QWidget):
         if event.buttons() & Qt.LeftButton:
             self._update_from_pos(event.position())
 
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.dragFinished.emit()
+
     def _update_from_pos(self, pos: QPointF):
         center = self.rect().center()
         dx = pos.x() - center.x()
@@ -63,7 +114,7 @@ class ColorWheelWidget(QWidget):
         hue = int(angle) % 360
 
         if hue != self.hue:
+            old = self._cursor_rect()
             self.hue = hue
             self.hueChanged.emit(hue)
-            self.update()
-
+            self._update_cursor(old)
@@ -1,9 +1,8 @@
 from PySide6.QtWidgets import QDialog
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QFile
 from PySide6.QtGui import QIcon
 
 from core.resource_path import resource_path
+from widgets.ui_forms import setup_form
 
 
 class LanguageDialog(QDialog):
@@ -17,17 +16,8 @@ class LanguageDialog(QDialog):
         self.setWindowIcon(QIcon(resource_path("assets/icons/neon-settings.ico")))
         self.setWindowTitle("ChromaFlux")
 
-        # ✅ Cargar UI usando resource_path (CRÍTICO)
-        loader = QUiLoader()
-        ui_path = resource_path("ui/language_dialog.ui")
-
-        ui_file = QFile(ui_path)
-        ui_file.open(QFile.ReadOnly)
-        self.ui = loader.load(ui_file, self)
-        ui_file.close()
-
-        # ✅ Layout correcto
-        self.setLayout(self.ui.layout())
+        # ✅ Cargar UI (módulo compilado; .ui como respaldo)
+        self.ui = setup_form(self, "ui/language_dialog.ui")
         self.adjustSize()
 
         # ✅ Textos i18n
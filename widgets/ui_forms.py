@@ -0,0 +1,106 @@
+import hashlib
+import importlib
+import os
+
+from PySide6.QtCore import QFile, Qt
+from PySide6.QtWidgets import QMainWindow
+
+# =====================================================
+# Formularios .ui
+#
+# Cada .ui tiene un módulo compilado con pyside6-uic al lado
+# (scripts/build_ui.py). El módulo guarda el hash del .ui del que salió:
+# si el .ui cambió y nadie recompiló, se usa QUiLoader como respaldo
+# para no mostrar una interfaz vieja.
+# =====================================================
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# .ui (relativo a la raíz) -> (módulo compilado, clase Ui_*)
+FORMS = {
+    "ui/main_window.ui": ("ui.ui_main_window", "Ui_MainWindow"),
+    "ui/language_dialog.ui": ("ui.ui_language_dialog", "Ui_LanguageDialog"),
+    "widgets/colorpicker/colorpicker_dialog.ui": (
+        "widgets.colorpicker.ui_colorpicker_dialog", "Ui_ColorPickerDialog",
+    ),
+}
+
+# Para comparar tiempos (scripts/bench_ui_forms.py)
+USE_COMPILED = True
+
+_compiled_cache = {}
+
+
+def source_hash(data: bytes) -> str:
+    """
+    Hash del .ui sin depender de los finales de línea
+    """
+    return hashlib.sha256(data.replace(b"\r\n", b"\n")).hexdigest()
+
+
+def _compiled_class(form: str):
+    if form in _compiled_cache:
+        return _compiled_cache[form]
+
+    module_name, class_name = FORMS[form]
+    ui_class = None
+    try:
+        module = importlib.import_module(module_name)
+        ui_path = os.path.join(ROOT, form)
+
+        # Sin .ui al lado (p. ej. empaquetado) se confía en el compilado
+        fresh = True
+        if os.path.exists(ui_path):
+            with open(ui_path, "rb") as f:
+                fresh = source_hash(f.read()) == getattr(module, "UI_SOURCE_SHA256", None)
+
+        if fresh:
+            ui_class = getattr(module, class_name)
+    except ImportError:
+        pass
+
+    _compiled_cache[form] = ui_class
+    return ui_class
+
+
+def _load_runtime(target, form: str):
+    from PySide6.QtUiTools import QUiLoader
+
+    ui_path = os.path.join(ROOT, form)
+    ui_file = QFile(ui_path)
+    if not ui_file.open(QFile.ReadOnly):
+        raise RuntimeError(f"No se pudo abrir UI: {ui_path}")
+
+    loader = QUiLoader()
+    ui = loader.load(ui_file, target)
+    ui_file.close()
+
+    if not ui:
+        raise RuntimeError(f"No se pudo cargar {form}")
+
+    # Pasar el contenido al widget real. Con QMainWindow se usa el
+    # atributo (nombre por defecto de Designer): pasar por centralWidget()
+    # deja inválidos los wrappers de los layouts hijos
+    if isinstance(target, QMainWindow):
+        target.setCentralWidget(ui.centralwidget)
+    else:
+        target.setLayout(ui.layout())
+    return ui
+
+
+def setup_form(target, form: str):
+    """
+    Construye el formulario sobre target y devuelve el objeto con los
+    widgets como atributos (self.ui.btnOk, ...), venga del módulo
+    compilado o de QUiLoader.
+    """
+    ui_class = _compiled_class(form) if USE_COMPILED else None
+    if ui_class is None:
+        return _load_runtime(target, form)
+
+    ui = ui_class()
+    ui.setupUi(target)
+
+    # setupUi aplica la geometría del .ui; como con QUiLoader, el tamaño
+    # inicial lo decide el layout
+    target.setAttribute(Qt.WA_Resized, False)
+    return ui
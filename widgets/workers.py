@@ -0,0 +1,142 @@
+import abc
+import threading
+import time
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+# Mínimo intervalo entre dos avisos de progreso (segundos)
+PROGRESS_INTERVAL = 0.1
+
+
+class _WorkerMeta(abc.ABCMeta, type(QObject)):
+    """
+    Metaclase de QObject con soporte de métodos abstractos
+    """
+
+
+class BatchWorker(QObject, metaclass=_WorkerMeta):
+    """
+    Base de las operaciones por lotes fuera del hilo de la GUI: recorre
+    los BatchResult de la pipeline, avisa de cada asset y del progreso
+    (con límite de frecuencia) y admite cancelación.
+    """
+    itemDone = Signal(object)           # BatchResult correcto
+    itemFailed = Signal(str, str)       # ruta, error
+    progress = Signal(int, int)         # hechos, total
+    finished = Signal(bool)             # True si se canceló
+
+    def __init__(self, pipeline, items):
+        # Shiboken crea la instancia sin pasar por la comprobación de ABCMeta
+        if self.__abstractmethods__:
+            missing = ", ".join(sorted(self.__abstractmethods__))
+            raise TypeError(f"{type(self).__name__} no implementa: {missing}")
+
+        super().__init__()
+        self.pipeline = pipeline
+        self.items = list(items)
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def _prepare(self):
+        """
+        Trabajo previo en el hilo del worker (puede cambiar self.items)
+        """
+
+    @abc.abstractmethod
+    def _results(self):
+        """
+        Iterable de BatchResult a recorrer
+        """
+
+    def run(self):
+        # finished se emite siempre: de él dependen el hilo y el estado de la GUI
+        try:
+            self._prepare()
+            total = len(self.items)
+            self.progress.emit(0, total)
+
+            done = 0
+            last_emit = 0.0
+
+            for result in self._results():
+                done += 1
+
+                if result.ok:
+                    self.itemDone.emit(result)
+                else:
+                    self.itemFailed.emit(result.source, str(result.error))
+
+                # Progreso con límite de frecuencia
+                now = time.monotonic()
+                if now - last_emit >= PROGRESS_INTERVAL or done == total:
+                    last_emit = now
+                    self.progress.emit(done, total)
+
+            self.progress.emit(done, total)
+        finally:
+            self.finished.emit(self.cancelled)
+
+
+class AssetLoadWorker(BatchWorker):
+    """
+    Carga assets y va emitiendo cada uno en cuanto termina, para poblar
+    el árbol de forma incremental. Con prefilter, antes descarta los
+    paquetes que no pueden tener módulos de color.
+    """
+    prefiltered = Signal(int, int)      # candidatos, descartados
+
+    def __init__(self, pipeline, items, prefilter=True):
+        super().__init__(pipeline, items)
+        self.prefilter = prefilter
+
+    def _prepare(self):
+        if not self.prefilter:
+            return
+
+        self.items, skipped = self.pipeline.prefilter(self.items, cancel=self._cancel)
+        self.prefiltered.emit(len(self.items), skipped)
+
+    def _results(self):
+        return self.pipeline.load_many(self.items, cancel=self._cancel)
+
+
+class AssetApplyWorker(BatchWorker):
+    """
+    Reconstruye los assets modificados en paralelo. Cancelar deja de
+    lanzar assets nuevos: los que no se tocaron quedan intactos y los
+    que ya estaban en marcha terminan su importación.
+    """
+
+    def __init__(self, pipeline, assets):
+        # assets: {json_path: [entries del asset]}
+        super().__init__(pipeline, assets)
+        self.assets = assets
+
+    def _rebuild(self, json_path):
+        return self.pipeline.rebuild_asset(json_path, self.assets[json_path])
+
+    def _results(self):
+        return self.pipeline.run_batch(self._rebuild, self.items, cancel=self._cancel)
+
+
+def start_worker(worker: QObject, parent=None) -> QThread:
+    """
+    Mueve el worker a un QThread propio y lo arranca; el hilo se
+    destruye solo cuando el worker emite finished.
+    """
+    thread = QThread(parent)
+    worker.moveToThread(thread)
+
+    thread.started.connect(worker.run)
+    worker.finished.connect(thread.quit)
+    worker.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+
+    thread.start()
+    return thread